@@ -29,4 +29,7 @@ if [ "$1" = "nginx" -o "$1" = "nginx-debug" ]; then
     fi
 fi
 
+# a restarted sidecar Carrier has no routes, drop the redirects left in the Pod's network
+/bin/busybox sh /setredirects.sh
+
 exec nginx -g "daemon off;" -c /tmp/nginx.conf
\ No newline at end of file
@@ -0,0 +1,41 @@
+#!/bin/busybox sh
+# vim:sw=4:ts=4:et
+
+# Redirect the traffic of bridged ports to the ports Carrier listens on. This is only
+# done if Carrier runs as a sidecar (CARRIER_MODE=sidecar) next to the original
+# container, which keeps its ports; all redirects are replaced at once.
+
+set -e
+
+DEFAULT_CONF_FILE="/tmp/nginx.conf"
+
+if [ "$CARRIER_MODE" != "sidecar" ]; then
+    exit 0
+fi
+
+# the kubelet keeps probing the original container
+if [ -n "$HOST_IP" ]; then
+    source="! -s $HOST_IP "
+else
+    source=""
+fi
+
+rules="*nat\n:GEFYRA - [0:0]\n"
+for route in $(sed -n "s/.*upstream stowaway-\([0-9]*\) {.*listen \([0-9]*\);.*/\1:\2/p" $DEFAULT_CONF_FILE); do
+    port=${route%:*}
+    listen=${route#*:}
+    if [ "$port" = "$listen" ]; then
+        continue
+    fi
+    # nginx opens new ports in the background after a reload
+    for i in $(seq 50); do
+        netstat -ltn | grep -q ":$listen " && break
+        sleep 0.1
+    done
+    echo "Redirecting port $port to $listen"
+    rules="$rules-A GEFYRA -p tcp ${source}--dport $port -j REDIRECT --to-ports $listen\n"
+done
+
+printf "${rules}COMMIT\n" | iptables-restore --noflush
+iptables -t nat -C PREROUTING -p tcp -j GEFYRA 2>/dev/null \
+    || iptables -t nat -A PREROUTING -p tcp -j GEFYRA
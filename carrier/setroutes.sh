@@ -0,0 +1,65 @@
+#!/bin/busybox sh
+# vim:sw=4:ts=4:et
+
+# Usage:
+#   setroutes.sh add <port>[:<listen port>] <upstream> [...]
+#   setroutes.sh remove <port> [<port> ...]
+#   setroutes.sh set [<port>[:<listen port>] <upstream> ...]
+# "add" replaces the routes of the given ports, "remove" drops them and "set" replaces
+# all routes with the given ones. Nginx is reloaded once for all of them.
+# A route listens on its port unless a listen port is given; the sidecar Carrier
+# redirects the port to the listen port instead, see setredirects.sh.
+
+set -e
+
+DEFAULT_CONF_FILE="/tmp/nginx.conf"
+NEW_CONF_FILE="/tmp/nginx.conf.new"
+
+action=$1
+shift || true
+
+cp $DEFAULT_CONF_FILE $NEW_CONF_FILE
+
+case "$action" in
+    add)
+        ;;
+    set)
+        sed -i "/upstream stowaway-[0-9]* {/d" $NEW_CONF_FILE
+        ;;
+    remove)
+        for port in "$@"; do
+            echo "Removing route of port $port"
+            sed -i "/upstream stowaway-$port {/d" $NEW_CONF_FILE
+        done
+        set --
+        ;;
+    *)
+        echo "Usage: $0 add|remove|set [<port>[:<listen port>] [<upstream>]] ..." >&2
+        rm -f $NEW_CONF_FILE
+        exit 1
+        ;;
+esac
+
+while [ $# -ge 2 ]; do
+    port=${1%%:*}
+    listen=${1#*:}
+    echo "Setting listening port to $listen; Setting target upstream to $2"
+    sed -i "/upstream stowaway-$port {/d" $NEW_CONF_FILE
+    block="upstream stowaway-$port {server $2;} server {listen $listen; proxy_pass stowaway-$port;}\n#MARKER"
+    sed -i "s/#MARKER/$block/g" $NEW_CONF_FILE
+    shift 2
+done
+
+# nothing to reload if the routes did not change; a broken configuration is never
+# written over the running one
+if cmp -s $DEFAULT_CONF_FILE $NEW_CONF_FILE; then
+    rm -f $NEW_CONF_FILE
+else
+    nginx -t -q -c $NEW_CONF_FILE
+    cat $NEW_CONF_FILE > $DEFAULT_CONF_FILE
+    rm -f $NEW_CONF_FILE
+    nginx -s reload -c $DEFAULT_CONF_FILE
+fi
+
+/bin/busybox sh /setredirects.sh
+
@@ -1,8 +1,9 @@
 import logging
-from time import sleep
 from typing import List, Dict, TYPE_CHECKING
 
+from gefyra.cluster.watch import wait_for
 from gefyra.exceptions import CommandTimeoutError, GefyraBridgeError
+from gefyra.local import BRIDGE_CLIENT_LABEL, GEFYRA_API_VERSION
 
 if TYPE_CHECKING:
     from gefyra.configuration import ClientConfiguration
@@ -139,6 +140,7 @@ def bridge(
         get_gbridge_body,
         handle_create_gefyrabridge,
     )
+    from gefyra.local.utils import get_status
 
     ireqs = []
     for idx, pod in enumerate(pods_to_intercept):
@@ -161,31 +163,43 @@ def bridge(
     #
     logger.info("Waiting for the bridge(s) to become active")
 
-    bridges = {str(ireq["metadata"]["uid"]): False for ireq in ireqs}
-    waiting_time = 0
-    # timeout = 0  means no timeout
-    if timeout:
-        waiting_time = timeout
-    while True and wait:
-        # watch whether all relevant bridges have been established
-        gefyra_bridges = get_all_gefyrabridges(config)
-        for gefyra_bridge in gefyra_bridges:
+    uids = {str(ireq["metadata"]["uid"]) for ireq in ireqs}
+    established = set()
+
+    def all_established(objects: Dict[str, dict]) -> bool:
+        for gefyra_bridge in objects.values():
+            uid = str(gefyra_bridge["metadata"]["uid"])
             if (
-                gefyra_bridge["metadata"]["uid"] in bridges.keys()
-                and gefyra_bridge.get("state", "") == "ACTIVE"
+                uid in uids
+                and uid not in established
+                and get_status(gefyra_bridge, "state", "") == "ACTIVE"
             ):
-                bridges[str(gefyra_bridge["metadata"]["uid"])] = True
+                established.add(uid)
                 logger.info(
                     f"Bridge {gefyra_bridge['metadata']['name']} "
-                    f"({sum(bridges.values())}/{len(ireqs)}) established."
+                    f"({len(established)}/{len(ireqs)}) established."
                 )
-        if all(bridges.values()):
-            break
-        sleep(1)
-        # Raise exception in case timeout is reached
-        waiting_time -= 1
-        if timeout and waiting_time <= 0:
-            raise CommandTimeoutError("Timeout for bridging operation exceeded")
+        return established == uids
+
+    if wait:
+        # timeout = 0  means no timeout
+        try:
+            gefyra_bridges = list(
+                wait_for(
+                    config.K8S_CUSTOM_OBJECT_API.list_namespaced_custom_object,
+                    all_established,
+                    timeout=timeout,
+                    namespace=config.NAMESPACE,
+                    group="gefyra.dev",
+                    version=GEFYRA_API_VERSION,
+                    plural="gefyrabridges",
+                    label_selector=f"{BRIDGE_CLIENT_LABEL}={config.CLIENT_ID}",
+                ).values()
+            )
+        except CommandTimeoutError:
+            raise CommandTimeoutError(
+                "Timeout for bridging operation exceeded"
+            ) from None
     if not wait:
         gefyra_bridges = get_all_gefyrabridges(config)
         return list(map(wrap_bridge, gefyra_bridges))
@@ -211,23 +225,19 @@ def bridge(
 
 
 def wait_for_deletion(gefyra_bridges: List, config: "ClientConfiguration"):
-    from kubernetes.watch import Watch
-
-    w = Watch()
-    deleted = []
-    uids = [gefyra_bridge["metadata"]["uid"] for gefyra_bridge in gefyra_bridges]
-    for event in w.stream(
+    uids = {gefyra_bridge["metadata"]["uid"] for gefyra_bridge in gefyra_bridges}
+    # the bridges may already be gone when the wait starts
+    wait_for(
         config.K8S_CUSTOM_OBJECT_API.list_namespaced_custom_object,
+        lambda objects: not any(
+            obj["metadata"]["uid"] in uids for obj in objects.values()
+        ),
         namespace=config.NAMESPACE,
         group="gefyra.dev",
-        version="v1",
+        version=GEFYRA_API_VERSION,
         plural="gefyrabridges",
-    ):
-        if event["type"] == "DELETED":
-            if event["object"]["metadata"]["uid"] in uids:
-                deleted.append(event["object"]["metadata"]["uid"])
-                if set(deleted) == set(uids):
-                    break
+        label_selector=f"{BRIDGE_CLIENT_LABEL}={config.CLIENT_ID}",
+    )
 
 
 @stopwatch
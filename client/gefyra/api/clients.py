@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Iterable, List, Optional
 import uuid
 from gefyra.configuration import ClientConfiguration
+from gefyra.local import GEFYRA_API_VERSION
 from gefyra.local.clients import (
     get_gefyraclient_body,
     handle_create_gefyraclient,
@@ -140,6 +141,6 @@ def list_client(
         namespace=config.NAMESPACE,
         group="gefyra.dev",
         plural="gefyraclients",
-        version="v1",
+        version=GEFYRA_API_VERSION,
     )
     return [GefyraClient(client, config) for client in clients["items"]]
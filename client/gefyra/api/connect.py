@@ -7,7 +7,7 @@ import time
 
 from typing import IO, List, Optional, TYPE_CHECKING
 from gefyra.api.clients import get_client
-from gefyra.exceptions import GefyraConnectionError
+from gefyra.exceptions import CommandTimeoutError, GefyraConnectionError
 from gefyra.local.clients import handle_get_gefyraclient
 from gefyra.local.minikube import detect_minikube_config
 from .utils import stopwatch
@@ -16,7 +16,11 @@ if TYPE_CHECKING:
     from docker.models.networks import Network
 
 
-from gefyra.configuration import ClientConfiguration, get_gefyra_config_location
+from gefyra.configuration import (
+    ClientConfiguration,
+    forget_cargo_containers,
+    get_gefyra_config_location,
+)
 from gefyra.local.cargo import (
     create_wireguard_config,
     get_cargo_ip_from_netaddress,
@@ -123,17 +127,13 @@ def connect(  # noqa: C901
     else:
         raise GefyraConnectionError("Could not activate connection") from None
 
-    # busy wait for the client to enter the ACTIVE state
-    _i = 0
-    while _i < config.CONNECTION_TIMEOUT:
-        if client.state == GefyraClientState.ACTIVE:
-            break
-        else:
-            _i += 1
-            time.sleep(1)
-    else:
+    # wait for the client to enter the ACTIVE state
+    try:
+        client.wait_for_state(
+            GefyraClientState.ACTIVE, timeout=config.CONNECTION_TIMEOUT
+        )
+    except CommandTimeoutError:
         raise GefyraConnectionError("Could not activate connection") from None
-    client.update()
 
     # since this connection was (re)activated, save the current wireguard config (again)
     wg_conf = os.path.join(
@@ -210,6 +210,8 @@ def connect(  # noqa: C901
         except docker.errors.APIError:
             pass
         raise GefyraConnectionError(f"Could not start Cargo container: {e}") from None
+    finally:
+        forget_cargo_containers()
 
     # Confirm the wireguard connection working
     logger.debug("Checking wireguard connection")
@@ -232,6 +234,12 @@ def disconnect(connection_name: str) -> bool:
     except docker.errors.NotFound:
         pass
     client.deactivate_connection()
+    try:
+        client.wait_for_state(
+            GefyraClientState.WAITING, timeout=config.CONNECTION_TIMEOUT
+        )
+    except CommandTimeoutError:
+        raise GefyraConnectionError("Could not deactivate connection") from None
     return True
 
 
@@ -287,6 +295,7 @@ def remove_connection(connection_name: str):
             f"{config.CARGO_CONTAINER_NAME}",
         )
         cargo_container.remove(force=True)
+        forget_cargo_containers()
     except docker.errors.NotFound:
         pass
     handle_remove_network(config)
@@ -4,7 +4,8 @@ from pathlib import Path
 import time
 from typing import List, Optional
 from gefyra.cluster.utils import is_operator_running
-from gefyra.exceptions import ClusterError
+from gefyra.cluster.watch import wait_for
+from gefyra.exceptions import ClusterError, CommandTimeoutError
 
 
 from gefyra.misc.install import synthesize_config_as_dict, synthesize_config_as_yaml
@@ -127,20 +128,19 @@ def install(
                 toc = time.perf_counter()
                 logger.info(f"Gefyra became ready in {toc - tic:0.4f} seconds")
                 break
-        # busywait for the operator webhook to become ready
-        _i = 0
-        while _i < 20:
-            webhook_deploy = config.K8S_APP_API.read_namespaced_deployment(
-                name="gefyra-operator-webhook", namespace=config.NAMESPACE
+        # wait for the operator webhook to become ready
+        logger.debug("Waiting for the operator webhook to become ready")
+        try:
+            wait_for(
+                config.K8S_APP_API.list_namespaced_deployment,
+                lambda objects: "gefyra-operator-webhook" in objects
+                and objects["gefyra-operator-webhook"].status.ready_replicas == 1,
+                timeout=20,
+                namespace=config.NAMESPACE,
+                field_selector="metadata.name=gefyra-operator-webhook",
             )
-            if webhook_deploy.status.ready_replicas == 1:
-                break
-            else:
-                logger.debug("Waiting for the operator webhook to become ready")
-                time.sleep(1)
-                _i += 1
-        else:
-            raise ClusterError("Operator webhook did not become ready")
+        except CommandTimeoutError:
+            raise ClusterError("Operator webhook did not become ready") from None
     return output
 
 
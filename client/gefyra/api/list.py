@@ -2,7 +2,7 @@ import logging
 from gefyra.exceptions import ClientConfigurationError
 from gefyra.types import GefyraBridge, GefyraLocalContainer
 from tabulate import tabulate
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from gefyra.configuration import ClientConfiguration
 
@@ -38,7 +38,7 @@ def get_bridges_and_print(connection_name: Optional[str] = None):
 def list_gefyra_bridges(
     connection_name: Optional[str] = None,
 ) -> List[Tuple[str, List[GefyraBridge]]]:
-    from gefyra.local.bridge import get_all_gefyrabridges
+    from gefyra.local.bridge import get_gefyrabridges_by_client
     from gefyra import api
 
     conns = api.list_connections()
@@ -47,27 +47,25 @@ def list_gefyra_bridges(
             raise ClientConfigurationError(
                 f"Connection {connection_name} does not exist. Please create it first."
             )
-        obridges = get_all_gefyrabridges(
-            ClientConfiguration(connection_name=connection_name)
-        )
-        return [(connection_name, list(map(wrap_bridge, obridges)))]
+        names = [connection_name]
     else:
-        bridges = []
-        for conn in conns:
-            bridges.append(
-                (
-                    conn.name,
-                    list(
-                        map(
-                            wrap_bridge,
-                            get_all_gefyrabridges(
-                                ClientConfiguration(connection_name=conn.name)
-                            ),
-                        )
-                    ),
-                )
+        names = [conn.name for conn in conns]
+    # the connections to the same cluster share one request for all of their bridges
+    clusters: Dict[Tuple, List[ClientConfiguration]] = {}
+    for name in names:
+        config = ClientConfiguration(connection_name=name)
+        key = (config.KUBE_CONFIG_FILE, config.KUBE_CONTEXT, config.NAMESPACE)
+        clusters.setdefault(key, []).append(config)
+    bridges: Dict[str, List[GefyraBridge]] = {}
+    for configs in clusters.values():
+        by_client = get_gefyrabridges_by_client(
+            configs[0], [config.CLIENT_ID for config in configs if config.CLIENT_ID]
+        )
+        for config in configs:
+            bridges[config.CONNECTION_NAME] = list(
+                map(wrap_bridge, by_client.get(config.CLIENT_ID, []))
             )
-        return bridges
+    return [(name, bridges[name]) for name in names]
 
 
 @stopwatch
@@ -4,6 +4,7 @@ import time
 from typing import Any, Dict, Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from gefyra.local.utils import get_status
     from gefyra.types import GefyraBridge
 
 logger = logging.getLogger(__name__)
@@ -57,7 +58,7 @@ def wrap_bridge(bridge: Dict[Any, Any]) -> "GefyraBridge":
         target_container=bridge["targetContainer"],
         target_namespace=bridge["targetNamespace"],
         target_pod=bridge["targetPod"],
-        state=bridge["state"],
+        state=get_status(bridge, "state"),
     )
 
 
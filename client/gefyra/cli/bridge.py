@@ -1,5 +1,4 @@
 import dataclasses
-from time import sleep
 import click
 from gefyra.cli import console
 from gefyra.cli.utils import (
@@ -54,6 +53,11 @@ def create_bridge(
 ):
     from alive_progress import alive_bar
     from gefyra import api
+    from gefyra.api.utils import wrap_bridge
+    from gefyra.cluster.watch import wait_for
+    from gefyra.configuration import ClientConfiguration
+    from gefyra.exceptions import CommandTimeoutError
+    from gefyra.local import BRIDGE_CLIENT_LABEL, GEFYRA_API_VERSION
 
     print_keys = {
         "name": "NAME",
@@ -82,22 +86,36 @@ def create_bridge(
         stats=False,
         dual_line=True,
     ) as bar:
-        for _i in range(timeout):
-            all_bridges = api.list_gefyra_bridges(connection_name=connection_name)[0][1]
+        config = ClientConfiguration(connection_name=connection_name)
+        names = {bridge.name for bridge in _created_bridges}
+
+        def all_active(objects) -> bool:
+            nonlocal _created_bridges
             _created_bridges = [
-                bridge
-                for bridge in all_bridges
-                if bridge.name in [_bridge.name for _bridge in _created_bridges]
+                wrap_bridge(obj) for name, obj in objects.items() if name in names
             ]
             bar.text(
                 "\n".join(
                     [f"{bridge.name}: {bridge.state}" for bridge in _created_bridges]
                 )
             )
-            if all(bridge.state == "ACTIVE" for bridge in _created_bridges):
-                break
-            else:
-                sleep(1)
+            return len(_created_bridges) == len(names) and all(
+                bridge.state == "ACTIVE" for bridge in _created_bridges
+            )
+
+        try:
+            wait_for(
+                config.K8S_CUSTOM_OBJECT_API.list_namespaced_custom_object,
+                all_active,
+                timeout=timeout,
+                namespace=config.NAMESPACE,
+                group="gefyra.dev",
+                version=GEFYRA_API_VERSION,
+                plural="gefyrabridges",
+                label_selector=f"{BRIDGE_CLIENT_LABEL}={config.CLIENT_ID}",
+            )
+        except CommandTimeoutError:
+            pass
         bar.text(f"{len(_created_bridges)} bridge(s) active")
 
     if _created_bridges:
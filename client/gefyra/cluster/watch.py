@@ -0,0 +1,93 @@
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from gefyra.exceptions import CommandTimeoutError
+
+logger = logging.getLogger(__name__)
+
+# seconds after which the API server ends a watch, which is then resumed
+WATCH_TIMEOUT = 60
+
+
+def _name_and_version(obj: Any) -> Tuple[str, str]:
+    # custom objects are dicts, the other objects are models of the Kubernetes client
+    if isinstance(obj, dict):
+        return obj["metadata"]["name"], obj["metadata"]["resourceVersion"]
+    return obj.metadata.name, obj.metadata.resource_version
+
+
+def wait_for(
+    list_func: Callable,
+    condition: Callable[[Dict[str, Any]], bool],
+    timeout: Optional[float] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Block until a condition on a set of Kubernetes objects is met; the objects are
+    listed once and then kept up to date with a watch, which is resumed from the last
+    seen resourceVersion
+
+    :param list_func: the list function of the objects, e.g.
+        CustomObjectsApi.list_namespaced_custom_object
+    :param condition: called with the current objects by name after the list and each
+        change of the objects, returns True once the wait is over
+    :param timeout: seconds to wait at most, None or 0 wait forever
+    :param kwargs: the arguments of the list function, e.g. namespace and
+        label_selector
+    :raises CommandTimeoutError: if the condition is not met within the timeout
+    :return: the objects by name when the condition is met
+    """
+    from kubernetes.client import ApiException
+    from kubernetes.watch import Watch
+
+    deadline = time.monotonic() + timeout if timeout else None
+    objects: Dict[str, Any] = {}
+    resource_version: Optional[str] = None
+    while True:
+        if resource_version is None:
+            result = list_func(**kwargs)
+            if isinstance(result, dict):
+                items = result.get("items") or []
+                resource_version = result["metadata"]["resourceVersion"]
+            else:
+                items = result.items
+                resource_version = result.metadata.resource_version
+            objects = {_name_and_version(obj)[0]: obj for obj in items}
+            if condition(objects):
+                return objects
+        watch_timeout = WATCH_TIMEOUT
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise CommandTimeoutError(f"Timeout of {timeout} seconds exceeded")
+            watch_timeout = max(1, min(WATCH_TIMEOUT, int(remaining + 1)))
+        watch = Watch()
+        try:
+            for event in watch.stream(
+                list_func,
+                resource_version=resource_version,
+                timeout_seconds=watch_timeout,
+                **kwargs,
+            ):
+                obj = event["object"]
+                if event["type"] == "ERROR":
+                    # e.g. the resourceVersion is too old, start over with a list
+                    resource_version = None
+                    break
+                name, resource_version = _name_and_version(obj)
+                if event["type"] == "DELETED":
+                    objects.pop(name, None)
+                else:
+                    objects[name] = obj
+                if condition(objects):
+                    watch.stop()
+                    return objects
+                if deadline is not None and time.monotonic() >= deadline:
+                    watch.stop()
+                    raise CommandTimeoutError(f"Timeout of {timeout} seconds exceeded")
+        except ApiException as e:
+            if e.status != 410:
+                raise e
+            logger.debug("Watch expired, listing the objects again")
+            resource_version = None
@@ -1,10 +1,14 @@
 from os import path
+import atexit
+import json
 import os
 import struct
 import socket
 import sys
 import logging
-from typing import Optional, Union
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pathlib import Path
 from gefyra.exceptions import ClientConfigurationError
@@ -22,6 +26,99 @@ logger = logging.getLogger("gefyra")
 __VERSION__ = "2.2.5"
 USER_HOME = os.path.expanduser("~")
 
+# a CLI call creates many configurations, they share the Docker client, the list of
+# Cargo containers, the active contexts of the kubeconfigs and the Kubernetes clients
+_docker_client: Any = None
+_cargo_containers: Dict[Any, List[Any]] = {}
+_active_contexts: Dict[str, Optional[str]] = {}
+_api_clients: Dict[Tuple[str, Optional[str]], Any] = {}
+
+# the host IP to reach from the Docker containers, persisted per Docker context
+DOCKER_HOST_IPS_FILE = "docker-host-ips.json"
+DOCKER_HOST_IP_TTL = 60 * 60 * 24  # in seconds
+DOCKER_HOST_IP_REFRESH_TIMEOUT = 30  # in seconds
+_docker_context: Optional[str] = None
+_docker_host_ips: Dict[str, str] = {}
+_refresh_threads: List[threading.Thread] = []
+
+
+def forget_cargo_containers() -> None:
+    """
+    Drop the cached Cargo containers, e.g. after one has been created or removed
+    """
+    _cargo_containers.clear()
+
+
+def get_cargo_containers(docker_client) -> List[Any]:
+    """
+    :return: all Cargo containers of all connections, listed once per process
+    """
+    if docker_client not in _cargo_containers:
+        _cargo_containers[docker_client] = docker_client.containers.list(
+            all=True, filters={"label": CONNECTION_NAME_LABEL}
+        )
+    return _cargo_containers[docker_client]
+
+
+def get_docker_context() -> str:
+    """
+    :return: the name of the active Docker context
+    """
+    global _docker_context
+    if _docker_context is None:
+        from docker.context import ContextAPI
+
+        try:
+            _docker_context = ContextAPI.get_context().name
+        except Exception as e:
+            logger.debug(f"Could not read the Docker context: {e}")
+            _docker_context = "default"
+    return _docker_context
+
+
+def uses_docker0() -> bool:
+    """
+    :return: whether the Docker host IP is the address of the local docker0 interface,
+        otherwise it is resolved in a container
+    """
+    import platform
+
+    return (
+        platform.system().lower() == "linux"
+        and "microsoft" not in platform.release().lower()
+    )
+
+
+@atexit.register
+def _join_refresh_threads() -> None:
+    # a refresh runs a container which docker-py removes once it has exited, so it
+    # must not be cut off by the end of the process
+    deadline = time.monotonic() + DOCKER_HOST_IP_REFRESH_TIMEOUT
+    for thread in _refresh_threads:
+        thread.join(timeout=max(deadline - time.monotonic(), 0))
+
+
+def read_docker_host_ips(cache_file: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(cache_file, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_docker_host_ip(cache_file: Path, context: str, ip: str) -> None:
+    entries = read_docker_host_ips(cache_file)
+    entries[context] = {"ip": ip, "resolvedAt": time.time()}
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # write a new file and swap it in, other processes may read it meanwhile
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write {cache_file}: {e}")
+
 
 def fix_pywin32_in_frozen_build() -> None:  # pragma: no cover
     import os
@@ -127,10 +224,11 @@ class ClientConfiguration(object):
         self.CONTAINER_RUN_TIMEOUT = 10  # in seconds
         self.CLIENT_ID = client_id
         if not ignore_docker:
-            containers = self.DOCKER.containers.list(
-                all=True,
-                filters={"label": f"{CONNECTION_NAME_LABEL}={self.CONNECTION_NAME}"},
-            )
+            containers = [
+                container
+                for container in get_cargo_containers(self.DOCKER)
+                if container.labels.get(CONNECTION_NAME_LABEL) == self.CONNECTION_NAME
+            ]
             if containers and not ignore_connection:
                 cargo_container = containers[0]
                 self.CARGO_ENDPOINT = cargo_container.labels.get(CARGO_ENDPOINT_LABEL)
@@ -158,37 +256,77 @@ class ClientConfiguration(object):
 
     @property
     def CARGO_ENDPOINT(self):
-        import platform
-
         if hasattr(self, "_cargo_endpoint") and self._cargo_endpoint:
             return self._cargo_endpoint
+        _ip = self._get_docker_host_ip()
+        if _ip:
+            return f"{_ip}:{self.cargo_endpoint_port}"
+
+    def _get_docker_host_ip(self) -> Optional[str]:
+        """
+        Return the host IP for the active Docker context from the cache in
+        GEFYRA_LOCATION. Unknown contexts are resolved right away. Expired entries
+        are resolved again, with docker0 right away, otherwise in the background
+        while the expired entry is still used.
+        """
+        context = get_docker_context()
+        if context in _docker_host_ips:
+            return _docker_host_ips[context]
+        cache_file = self.GEFYRA_LOCATION.joinpath(DOCKER_HOST_IPS_FILE)
+        entry = read_docker_host_ips(cache_file).get(context)
+        if entry and entry.get("ip"):
+            _ip = entry["ip"]
+            if time.time() - entry.get("resolvedAt", 0) > DOCKER_HOST_IP_TTL:
+                if uses_docker0():
+                    _ip = self._refresh_docker_host_ip(cache_file, context) or _ip
+                else:
+                    thread = threading.Thread(
+                        target=self._refresh_docker_host_ip,
+                        args=[cache_file, context],
+                        daemon=True,
+                    )
+                    thread.start()
+                    _refresh_threads.append(thread)
         else:
-            if (
-                platform.system().lower() == "linux"
-                and "microsoft" not in platform.release().lower()
-            ):
-                # get linux docker0 network address
-                import fcntl
-
-                _soc = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                _ip = socket.inet_ntoa(
+            _ip = self._refresh_docker_host_ip(cache_file, context)
+        if _ip:
+            _docker_host_ips[context] = _ip
+        return _ip
+
+    def _refresh_docker_host_ip(self, cache_file: Path, context: str) -> Optional[str]:
+        try:
+            _ip = self._resolve_docker_host_ip()
+        except Exception as e:
+            logger.error(f"Could not resolve the Docker host IP: {e}")
+            return None
+        if _ip:
+            write_docker_host_ip(cache_file, context, _ip)
+        return _ip
+
+    def _resolve_docker_host_ip(self) -> Optional[str]:
+        if uses_docker0():
+            # get linux docker0 network address
+            import fcntl
+
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as _soc:
+                return socket.inet_ntoa(
                     fcntl.ioctl(
                         _soc.fileno(),
                         0x8915,
                         struct.pack("256s", "docker0".encode("utf-8")[:15]),
                     )[20:24]
                 )
-                return f"{_ip}:{self.cargo_endpoint_port}"
-            else:
-                try:
-                    _ip_output = self.DOCKER.containers.run(
-                        "alpine", "getent hosts host.docker.internal", remove=True
-                    )
-                    _ip = _ip_output.decode("utf-8").split(" ")[0]
-                    logger.debug(f"Found host.docker.internal IP: {_ip}")
-                    return f"{_ip}:{self.cargo_endpoint_port}"
-                except Exception as e:
-                    logger.error("Could not create a valid configuration: " + str(e))
+        else:
+            try:
+                _ip_output = self.DOCKER.containers.run(
+                    "alpine", "getent hosts host.docker.internal", remove=True
+                )
+                _ip = _ip_output.decode("utf-8").split(" ")[0]
+                logger.debug(f"Found host.docker.internal IP: {_ip}")
+                return _ip
+            except Exception as e:
+                logger.error("Could not create a valid configuration: " + str(e))
+        return None
 
     @CARGO_ENDPOINT.setter
     def CARGO_ENDPOINT(self, value):
@@ -200,14 +338,17 @@ class ClientConfiguration(object):
             from kubernetes.config.kube_config import list_kube_config_contexts
             from kubernetes.config.config_exception import ConfigException
 
-            try:
-                _, active_context = list_kube_config_contexts(
-                    config_file=self.KUBE_CONFIG_FILE
-                )
-                self.KUBE_CONTEXT = active_context.get("name", None)
-            except ConfigException:
-                logger.error("Could not read active 'kubeconfig' context.")
-                self.KUBE_CONTEXT = None
+            config_file = str(self.KUBE_CONFIG_FILE)
+            if config_file not in _active_contexts:
+                try:
+                    _, active_context = list_kube_config_contexts(
+                        config_file=config_file
+                    )
+                    _active_contexts[config_file] = active_context.get("name", None)
+                except ConfigException:
+                    logger.error("Could not read active 'kubeconfig' context.")
+                    _active_contexts[config_file] = None
+            self.KUBE_CONTEXT = _active_contexts[config_file]
         return self._kube_context
 
     @KUBE_CONTEXT.setter
@@ -232,8 +373,13 @@ class ClientConfiguration(object):
         import docker
         from docker.context import ContextAPI
 
+        global _docker_client, _docker_context
+        if _docker_client is not None:
+            self.DOCKER = _docker_client
+            return
         try:
             ctx = ContextAPI.get_context()
+            _docker_context = ctx.name
             if ctx.name != "default":
                 endpoint = ctx.endpoints["docker"]["Host"]
                 self.DOCKER = docker.DockerClient(base_url=endpoint)
@@ -243,6 +389,7 @@ class ClientConfiguration(object):
         except docker.errors.DockerException as de:
             logger.fatal(f"Docker init error: {de}")
             raise RuntimeError("Docker init error. Docker host not running?") from None
+        _docker_client = self.DOCKER
 
     def _init_kubeapi(self):
         from kubernetes.client import (
@@ -253,15 +400,20 @@ class ClientConfiguration(object):
             ApiextensionsV1Api,
             AdmissionregistrationV1Api,
         )
-        from kubernetes.config import load_kube_config
+        from kubernetes.config import new_client_from_config
 
-        load_kube_config(self.KUBE_CONFIG_FILE, context=self.KUBE_CONTEXT)
-        self.K8S_CORE_API = CoreV1Api()
-        self.K8S_RBAC_API = RbacAuthorizationV1Api()
-        self.K8S_APP_API = AppsV1Api()
-        self.K8S_CUSTOM_OBJECT_API = CustomObjectsApi()
-        self.K8S_EXTENSION_API = ApiextensionsV1Api()
-        self.K8S_ADMISSION_API = AdmissionregistrationV1Api()
+        key = (str(self.KUBE_CONFIG_FILE), self.KUBE_CONTEXT)
+        if key not in _api_clients:
+            _api_clients[key] = new_client_from_config(
+                str(self.KUBE_CONFIG_FILE), context=self.KUBE_CONTEXT
+            )
+        api_client = _api_clients[key]
+        self.K8S_CORE_API = CoreV1Api(api_client)
+        self.K8S_RBAC_API = RbacAuthorizationV1Api(api_client)
+        self.K8S_APP_API = AppsV1Api(api_client)
+        self.K8S_CUSTOM_OBJECT_API = CustomObjectsApi(api_client)
+        self.K8S_EXTENSION_API = ApiextensionsV1Api(api_client)
+        self.K8S_ADMISSION_API = AdmissionregistrationV1Api(api_client)
 
     def __getattr__(self, item):
         if item in [
@@ -349,7 +501,7 @@ def get_gefyra_config_location() -> str:
     :type config: ClientConfiguration
     :return: The path to the directory where the files will be stored.
     """
-    config = ClientConfiguration()
+    config = ClientConfiguration(ignore_docker=True)
     config_dir = config.GEFYRA_LOCATION
     config_dir.mkdir(parents=True, exist_ok=True)
     return str(config_dir)
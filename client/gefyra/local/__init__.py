@@ -7,3 +7,6 @@ ACTIVE_KUBECONFIG_LABEL = "active_kubeconfig.gefyra.dev"
 ACTIVE_KUBECONFIG_CONTEXT_LABEL = "active_context.gefyra.dev"
 CONNECTION_NAME_LABEL = "connection_name.gefyra.dev"
 CLIENT_ID_LABEL = "gefyraclient.gefyra.dev"
+# the version of the Gefyra CRDs and the label of GefyraBridges with their client
+GEFYRA_API_VERSION = "v2"
+BRIDGE_CLIENT_LABEL = "gefyra.dev/client"
@@ -6,6 +6,7 @@ from docker.models.containers import Container
 
 from gefyra.cli import console
 from gefyra.configuration import ClientConfiguration
+from gefyra.local import BRIDGE_CLIENT_LABEL, GEFYRA_API_VERSION
 from gefyra.local.cargo import get_cargo_ip_from_netaddress
 from gefyra.types import GefyraLocalContainer
 
@@ -23,7 +24,7 @@ def handle_create_gefyrabridge(config: ClientConfiguration, body, target: str):
             body=body,
             group="gefyra.dev",
             plural="gefyrabridges",
-            version="v1",
+            version=GEFYRA_API_VERSION,
         )
     except ApiException as e:
         if e.status == 409:
@@ -44,7 +45,7 @@ def handle_delete_gefyrabridge(config: ClientConfiguration, name: str) -> bool:
             name=name,
             group="gefyra.dev",
             plural="gefyrabridges",
-            version="v1",
+            version=GEFYRA_API_VERSION,
         )
         return ireq
     except ApiException as e:
@@ -63,15 +64,12 @@ def get_all_gefyrabridges(config: ClientConfiguration) -> list:
             namespace=config.NAMESPACE,
             group="gefyra.dev",
             plural="gefyrabridges",
-            version="v1",
+            version=GEFYRA_API_VERSION,
+            # only the bridges of this client
+            label_selector=f"{BRIDGE_CLIENT_LABEL}={config.CLIENT_ID}",
         )
         if ireq_list:
-            # filter bridges for this client
-            return list(
-                item
-                for item in ireq_list.get("items")
-                if item["client"] == config.CLIENT_ID
-            )
+            return ireq_list.get("items")
         else:
             return []
     except ApiException as e:
@@ -81,6 +79,38 @@ def get_all_gefyrabridges(config: ClientConfiguration) -> list:
         return []
 
 
+def get_gefyrabridges_by_client(
+    config: ClientConfiguration, client_ids: List[str]
+) -> Dict[str, list]:
+    """
+    List the GefyraBridges of several clients of a cluster with a single request
+    :return: the bridges by client id, for all of the given client ids
+    """
+    from kubernetes.client import ApiException
+
+    bridges: Dict[str, list] = {client_id: [] for client_id in client_ids}
+    if not client_ids:
+        return bridges
+    try:
+        ireq_list = config.K8S_CUSTOM_OBJECT_API.list_namespaced_custom_object(
+            namespace=config.NAMESPACE,
+            group="gefyra.dev",
+            plural="gefyrabridges",
+            version=GEFYRA_API_VERSION,
+            label_selector=f"{BRIDGE_CLIENT_LABEL} in ({','.join(sorted(bridges))})",
+        )
+    except ApiException as e:
+        if e.status != 404:
+            logger.warning("Error getting GefyraBridges: " + str(e))
+            raise e from None
+        return bridges
+    for item in (ireq_list or {}).get("items") or []:
+        client_id = item["metadata"].get("labels", {}).get(BRIDGE_CLIENT_LABEL)
+        if client_id in bridges:
+            bridges[client_id].append(item)
+    return bridges
+
+
 def get_all_containers(config: ClientConfiguration) -> List[GefyraLocalContainer]:
     container_information = []
     gefyra_net = config.DOCKER.networks.get(f"{config.NETWORK_NAME}")
@@ -113,11 +143,12 @@ def get_gbridge_body(
     handle_probes,
 ):
     return {
-        "apiVersion": "gefyra.dev/v1",
+        "apiVersion": f"gefyra.dev/{GEFYRA_API_VERSION}",
         "kind": "gefyrabridge",
         "metadata": {
             "name": name,
             "namespace": config.NAMESPACE,
+            "labels": {BRIDGE_CLIENT_LABEL: config.CLIENT_ID},
         },
         "provider": "carrier",
         "connectionProvider": "stowaway",
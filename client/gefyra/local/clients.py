@@ -2,6 +2,7 @@ import time
 
 import logging
 from gefyra.configuration import ClientConfiguration
+from gefyra.local import GEFYRA_API_VERSION
 from gefyra.exceptions import (
     GefyraClientAlreadyExists,
     GefyraClientNotFound,
@@ -24,7 +25,7 @@ def handle_create_gefyraclient(config: ClientConfiguration, body) -> dict:
                 body=body,
                 group="gefyra.dev",
                 plural="gefyraclients",
-                version="v1",
+                version=GEFYRA_API_VERSION,
             )
             success = True
         except ApiException as e:
@@ -53,7 +54,7 @@ def handle_get_gefyraclient(config: ClientConfiguration, client_id: str) -> dict
             name=client_id,
             group="gefyra.dev",
             plural="gefyraclients",
-            version="v1",
+            version=GEFYRA_API_VERSION,
         )
     except ApiException as e:
         if e.status in [404, 403]:
@@ -86,7 +87,7 @@ def handle_delete_gefyraclient(
                 name=client_id,
                 group="gefyra.dev",
                 plural="gefyraclients",
-                version="v1",
+                version=GEFYRA_API_VERSION,
                 body={"metadata": {"finalizers": None}},
             )
         config.K8S_CUSTOM_OBJECT_API.delete_namespaced_custom_object(
@@ -94,7 +95,7 @@ def handle_delete_gefyraclient(
             name=client_id,
             group="gefyra.dev",
             plural="gefyraclients",
-            version="v1",
+            version=GEFYRA_API_VERSION,
         )
         if wait:
             timeout = 30
@@ -123,7 +124,7 @@ def get_gefyraclient_body(
     config: ClientConfiguration, client_id: str, provider: str = "stowaway"
 ) -> dict:
     return {
-        "apiVersion": "gefyra.dev/v1",
+        "apiVersion": f"gefyra.dev/{GEFYRA_API_VERSION}",
         "kind": "gefyraclient",
         "metadata": {
             "name": client_id,
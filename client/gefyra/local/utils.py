@@ -1,5 +1,5 @@
 import os
-from typing import List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 import uuid
 
 from gefyra.configuration import ClientConfiguration, logger
@@ -19,6 +19,17 @@ if TYPE_CHECKING:
     from docker.models.containers import Container
 
 
+def get_status(gefyra_object: Dict[str, Any], field: str, default: Any = None) -> Any:
+    """
+    Read a field the operator writes to the status of a GefyraClient or GefyraBridge,
+    objects of older operators have it at the top level
+    """
+    status = gefyra_object.get("status") or {}
+    if field in status:
+        return status[field]
+    return gefyra_object.get(field, default)
+
+
 def get_processed_paths(base_path: str, volumes: List[str]) -> Optional[List[str]]:
     if volumes is None:
         return None
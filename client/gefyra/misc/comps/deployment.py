@@ -31,7 +31,11 @@ def data(params: "GefyraInstallOptions") -> list[dict]:
                         "labels": {
                             "gefyra.dev/app": "gefyra-operator",
                             "gefyra.dev/role": "operator",
-                        }
+                        },
+                        "annotations": {
+                            "prometheus.io/scrape": "true",
+                            "prometheus.io/port": "9090",
+                        },
                     },
                     "spec": {
                         "serviceAccountName": "gefyra-operator",
@@ -40,7 +44,10 @@ def data(params: "GefyraInstallOptions") -> list[dict]:
                                 "name": "gefyra",
                                 "image": f"{params.registry}/operator:{params.version}",
                                 "imagePullPolicy": "IfNotPresent",
-                                "ports": [{"containerPort": 9443}],
+                                "ports": [
+                                    {"containerPort": 9443},
+                                    {"containerPort": 9090, "name": "metrics"},
+                                ],
                                 "env": [
                                     {
                                         "name": "GEFYRA_STOWAWAY_IMAGE",
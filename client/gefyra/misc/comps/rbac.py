@@ -25,7 +25,15 @@ def data(params: "GefyraInstallOptions") -> list[dict]:
                 {
                     "apiGroups": ["apiextensions.k8s.io"],
                     "resources": ["customresourcedefinitions"],
-                    "verbs": ["create", "patch", "delete", "list", "watch"],
+                    "verbs": [
+                        "create",
+                        "get",
+                        "update",
+                        "patch",
+                        "delete",
+                        "list",
+                        "watch",
+                    ],
                 },
                 {
                     "apiGroups": ["admissionregistration.k8s.io"],
@@ -65,7 +73,12 @@ def data(params: "GefyraInstallOptions") -> list[dict]:
                 },
                 {
                     "apiGroups": ["gefyra.dev"],
-                    "resources": ["gefyraclients", "gefyrabridges"],
+                    "resources": [
+                        "gefyraclients",
+                        "gefyraclients/status",
+                        "gefyrabridges",
+                        "gefyrabridges/status",
+                    ],
                     "verbs": ["*"],
                 },
             ],
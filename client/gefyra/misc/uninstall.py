@@ -2,6 +2,7 @@ import logging
 
 
 from gefyra.configuration import ClientConfiguration
+from gefyra.local import GEFYRA_API_VERSION
 from gefyra import api
 
 logger = logging.getLogger(__name__)
@@ -17,7 +18,7 @@ def remove_remainder_bridges(config: ClientConfiguration):
     try:
         gbridges = config.K8S_CUSTOM_OBJECT_API.list_namespaced_custom_object(
             group="gefyra.dev",
-            version="v1",
+            version=GEFYRA_API_VERSION,
             namespace=config.NAMESPACE,
             plural="gefyrabridges",
         )
@@ -27,7 +28,7 @@ def remove_remainder_bridges(config: ClientConfiguration):
         try:
             config.K8S_CUSTOM_OBJECT_API.patch_namespaced_custom_object(
                 group="gefyra.dev",
-                version="v1",
+                version=GEFYRA_API_VERSION,
                 plural="gefyrabridges",
                 namespace=config.NAMESPACE,
                 name=bridge["metadata"]["name"],
@@ -35,7 +36,7 @@ def remove_remainder_bridges(config: ClientConfiguration):
             )
             config.K8S_CUSTOM_OBJECT_API.delete_namespaced_custom_object(
                 group="gefyra.dev",
-                version="v1",
+                version=GEFYRA_API_VERSION,
                 plural="gefyrabridges",
                 namespace=config.NAMESPACE,
                 name=bridge["metadata"]["name"],
@@ -89,3 +90,7 @@ def remove_gefyra_rbac(config: ClientConfiguration):
             config.K8S_ADMISSION_API.delete_validating_webhook_configuration(name=wh)
         except kubernetes.client.exceptions.ApiException as e:
             logger.debug(e)
+        try:
+            config.K8S_ADMISSION_API.delete_mutating_webhook_configuration(name=wh)
+        except kubernetes.client.exceptions.ApiException as e:
+            logger.debug(e)
@@ -2,11 +2,14 @@ from dataclasses import dataclass, field, fields
 from enum import Enum
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, ClassVar, Dict, List, Optional
 
 from gefyra.configuration import ClientConfiguration, __VERSION__
 from gefyra.exceptions import ClientConfigurationError
+from gefyra.local import GEFYRA_API_VERSION
 from gefyra.local.clients import handle_get_gefyraclient
+from gefyra.local.utils import get_status
 
 logger = logging.getLogger(__name__)
 
@@ -91,17 +94,28 @@ class GefyraClient:
     provider_config: Optional[StowawayConfig] = None
     service_account_name: Optional[str] = None
     service_account: Optional[Dict[str, str]] = None
+    # seconds for which state and state_transitions are served without fetching the
+    # object again
+    max_age: ClassVar[float] = 2.0
 
     def __init__(self, gclient: dict[str, Any], config: ClientConfiguration):
         self._init_data(gclient)
         self._config = config
 
     def _init_data(self, _object: dict[str, Any]):
+        self._fetched_at = time.monotonic()
+        resource_version = _object["metadata"].get("resourceVersion")
+        if resource_version and resource_version == getattr(
+            self, "resource_version", None
+        ):
+            # the object did not change since it was read last time
+            return
+        self.resource_version = resource_version
         self.client_id = _object["metadata"]["name"]
         self.uid = _object["metadata"]["uid"]
         self.provider = _object.get("provider", "")
-        self._state = _object.get("state", "")
-        self._state_transitions = _object.get("stateTransitions", {})
+        self._state = get_status(_object, "state", "")
+        self._state_transitions = get_status(_object, "stateTransitions", {})
         self.service_account_name = _object.get("serviceAccountName")
         self.service_account = _object.get("serviceAccountData", {})
         if (
@@ -146,19 +160,59 @@ class GefyraClient:
 
     @property
     def state(self) -> GefyraClientState:
-        self.update()
+        self.refresh(self.max_age)
         return GefyraClientState(self._state)
 
     @property
     def state_transitions(self):
-        self.update()
+        self.refresh(self.max_age)
         return self._state_transitions
 
+    @property
+    def age(self) -> float:
+        """
+        Seconds since the object was read from the cluster
+        """
+        return time.monotonic() - self._fetched_at
+
+    def refresh(self, max_age: float = 0) -> bool:
+        """
+        Fetch the object again if it was read more than max_age seconds ago
+        :return: True if the object was fetched
+        """
+        if max_age and self.age < max_age:
+            return False
+        self.update()
+        return True
+
     def update(self):
         logger.debug(f"Fetching object GefyraClient {self.client_id}")
         gclient = handle_get_gefyraclient(self._config, self.client_id)
         self._init_data(gclient)
 
+    def wait_for_state(
+        self, state: GefyraClientState, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Watch the object until it enters the state and keep the last seen version, so
+        that waiting does not fetch the object over and over again
+        :raises CommandTimeoutError: if the state is not entered within the timeout
+        """
+        from gefyra.cluster.watch import wait_for
+
+        objects = wait_for(
+            self._config.K8S_CUSTOM_OBJECT_API.list_namespaced_custom_object,
+            lambda objects: self.client_id in objects
+            and get_status(objects[self.client_id], "state") == state.value,
+            timeout=timeout,
+            namespace=self._config.NAMESPACE,
+            group="gefyra.dev",
+            version=GEFYRA_API_VERSION,
+            plural="gefyraclients",
+            field_selector=f"metadata.name={self.client_id}",
+        )
+        self._init_data(objects[self.client_id])
+
     def get_client_config(
         self,
         gefyra_server: str,
@@ -186,43 +240,48 @@ class GefyraClient:
             )
 
     def activate_connection(self, subnet: str):
-        _state = self.state
+        # decide on the current state, not on a cached one
+        self.refresh()
+        _state = GefyraClientState(self._state)
         if _state == GefyraClientState.ACTIVE:
             return
         elif _state == GefyraClientState.WAITING:
             logger.debug(f"Activating connection for client {self.client_id}")
-            self._config.K8S_CUSTOM_OBJECT_API.patch_namespaced_custom_object(
+            gclient = self._config.K8S_CUSTOM_OBJECT_API.patch_namespaced_custom_object(
                 group="gefyra.dev",
-                version="v1",
+                version=GEFYRA_API_VERSION,
                 namespace=self._config.NAMESPACE,
                 plural="gefyraclients",
                 name=self.client_id,
                 body={"providerParameter": {"subnet": subnet}},
             )
+            self._init_data(gclient)
         else:
             raise RuntimeError(
                 f"Cannot activate connection for client {self.client_id}, state is"
-                f" {self.state}"
+                f" {_state}"
             )
 
     def deactivate_connection(self):
-        _state = self.state
+        self.refresh()
+        _state = GefyraClientState(self._state)
         if _state == GefyraClientState.WAITING:
             return
         elif _state == GefyraClientState.ACTIVE:
             logger.debug(f"Deactivating connection for client {self.client_id}")
-            self._config.K8S_CUSTOM_OBJECT_API.patch_namespaced_custom_object(
+            gclient = self._config.K8S_CUSTOM_OBJECT_API.patch_namespaced_custom_object(
                 group="gefyra.dev",
-                version="v1",
+                version=GEFYRA_API_VERSION,
                 namespace=self._config.NAMESPACE,
                 plural="gefyraclients",
                 name=self.client_id,
                 body={"providerParameter": None},
             )
+            self._init_data(gclient)
         else:
             raise RuntimeError(
                 f"Cannot deactivate connection for client {self.client_id}, state is"
-                f" {self.state}"
+                f" {_state}"
             )
 
 
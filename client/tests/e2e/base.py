@@ -424,11 +424,13 @@ class GefyraBaseTest:
                 client = self.K8S_CUSTOM_OBJECT_API.get_namespaced_custom_object(
                     group="gefyra.dev",
                     plural="gefyraclients",
-                    version="v1",
+                    version="v2",
                     name=client_id,
                     namespace="gefyra",
                 )
-                self.assertEqual(client["state"], str(state.value))
+                self.assertEqual(
+                    client.get("status", {}).get("state"), str(state.value)
+                )
             except AssertionError:
                 sleep(interval)
                 continue
@@ -907,7 +909,7 @@ class GefyraBaseTest:
         self.assert_gefyra_connected()
 
         self.assert_custom_object_quantity(
-            group="gefyra.dev", plural="gefyraclients", version="v1", quantity=1
+            group="gefyra.dev", plural="gefyraclients", version="v2", quantity=1
         )
 
         runner = CliRunner()
@@ -919,7 +921,7 @@ class GefyraBaseTest:
 
         clients = list_client()
         self.assert_custom_object_quantity(
-            group="gefyra.dev", plural="gefyraclients", version="v1", quantity=3
+            group="gefyra.dev", plural="gefyraclients", version="v2", quantity=3
         )
 
         res = runner.invoke(
@@ -927,7 +929,7 @@ class GefyraBaseTest:
         )
         self.assertEqual(res.exit_code, 0)
         self.assert_custom_object_quantity(
-            group="gefyra.dev", plural="gefyraclients", version="v1", quantity=2
+            group="gefyra.dev", plural="gefyraclients", version="v2", quantity=2
         )
 
         self.gefyra_down()
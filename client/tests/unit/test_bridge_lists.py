@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+from gefyra.local import BRIDGE_CLIENT_LABEL
+from gefyra.local.bridge import get_gbridge_body, get_gefyrabridges_by_client
+
+
+class FakeCustomObjectsApi:
+    def __init__(self, items):
+        self.items = items
+        self.requests = []
+
+    def list_namespaced_custom_object(self, **kwargs):
+        self.requests.append(kwargs)
+        return {"items": self.items}
+
+
+def _bridge(name: str, client_id: str) -> dict:
+    return {"metadata": {"name": name, "labels": {BRIDGE_CLIENT_LABEL: client_id}}}
+
+
+def test_bridges_are_labeled_with_their_client():
+    config = SimpleNamespace(NAMESPACE="gefyra", CLIENT_ID="client-a")
+    body = get_gbridge_body(
+        config, "bridge-a", "192.168.101.2", "backend", "demo", "backend", [], False
+    )
+    assert body["metadata"]["labels"] == {BRIDGE_CLIENT_LABEL: "client-a"}
+
+
+def test_bridges_of_several_clients_are_listed_at_once():
+    api = FakeCustomObjectsApi(
+        [_bridge("bridge-a", "client-a"), _bridge("bridge-b", "client-b")]
+    )
+    config = SimpleNamespace(NAMESPACE="gefyra", K8S_CUSTOM_OBJECT_API=api)
+    bridges = get_gefyrabridges_by_client(config, ["client-b", "client-a", "client-c"])
+    assert len(api.requests) == 1
+    assert (
+        api.requests[0]["label_selector"]
+        == f"{BRIDGE_CLIENT_LABEL} in (client-a,client-b,client-c)"
+    )
+    assert [bridge["metadata"]["name"] for bridge in bridges["client-a"]] == [
+        "bridge-a"
+    ]
+    assert [bridge["metadata"]["name"] for bridge in bridges["client-b"]] == [
+        "bridge-b"
+    ]
+    assert bridges["client-c"] == []
+    assert get_gefyrabridges_by_client(config, []) == {}
+    assert len(api.requests) == 1
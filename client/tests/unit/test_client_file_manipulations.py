@@ -13,11 +13,11 @@ def test_a_write_client_file(operator: AClusterManager):
         ["-n", "gefyra", "get", "gefyraclients.gefyra.dev", "client-a"]
     )
 
-    assert client_a["state"] is not None
+    assert client_a["apiVersion"] == "gefyra.dev/v2"
 
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=WAITING",
+        "jsonpath=.status.state=WAITING",
         namespace="gefyra",
         timeout=20,
     )
@@ -39,7 +39,7 @@ def test_a_write_client_file(operator: AClusterManager):
 
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=ACTIVE",
+        "jsonpath=.status.state=ACTIVE",
         namespace="gefyra",
         timeout=20,
     )
@@ -66,11 +66,11 @@ def test_a_write_client_file_with_registry_and_mtu(operator: AClusterManager):
         ["-n", "gefyra", "get", "gefyraclients.gefyra.dev", "client-a"]
     )
 
-    assert client_a["state"] is not None
+    assert client_a["apiVersion"] == "gefyra.dev/v2"
 
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=ACTIVE",
+        "jsonpath=.status.state=ACTIVE",
         namespace="gefyra",
         timeout=20,
     )
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+from gefyra.types import GefyraClient, GefyraClientState
+
+
+class FakeCustomObjectsApi:
+    def __init__(self, gclient: dict):
+        self.gclient = gclient
+        self.gets = 0
+        self.patches = []
+
+    def get_namespaced_custom_object(self, **kwargs):
+        self.gets += 1
+        return self.gclient
+
+    def patch_namespaced_custom_object(self, **kwargs):
+        self.patches.append(kwargs["body"])
+        return self.gclient
+
+
+def _gclient(state: str, resource_version: str = "1") -> dict:
+    return {
+        "metadata": {
+            "name": "client-a",
+            "uid": "0",
+            "resourceVersion": resource_version,
+        },
+        "provider": "stowaway",
+        "status": {"state": state, "stateTransitions": {state: "now"}},
+    }
+
+
+def _client(gclient: dict):
+    api = FakeCustomObjectsApi(gclient)
+    config = SimpleNamespace(NAMESPACE="gefyra", K8S_CUSTOM_OBJECT_API=api)
+    return GefyraClient(gclient, config), api
+
+
+def test_state_is_cached_for_max_age():
+    client, api = _client(_gclient("WAITING"))
+    assert client.state is GefyraClientState.WAITING
+    assert client.state_transitions == {"WAITING": "now"}
+    assert api.gets == 0
+    api.gclient = _gclient("ACTIVE", "2")
+    client._fetched_at -= client.max_age
+    assert client.state is GefyraClientState.ACTIVE
+    assert client.state is GefyraClientState.ACTIVE
+    assert api.gets == 1
+
+
+def test_refresh_fetches_the_object():
+    client, api = _client(_gclient("WAITING"))
+    assert client.refresh(max_age=60) is False
+    assert client.refresh() is True
+    assert api.gets == 1
+
+
+def test_activate_connection_reads_the_state_once():
+    client, api = _client(_gclient("WAITING"))
+    client.activate_connection("192.168.101.0/24")
+    assert api.gets == 1
+    assert api.patches == [{"providerParameter": {"subnet": "192.168.101.0/24"}}]
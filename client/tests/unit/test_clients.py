@@ -12,12 +12,12 @@ def test_a_create_client(operator: AClusterManager):
     client_a: GefyraClient = k3d.kubectl(
         ["-n", "gefyra", "get", "gefyraclients.gefyra.dev", "client-a"]
     )
-    assert client_a["state"] is not None
+    assert client_a["apiVersion"] == "gefyra.dev/v2"
     with pytest.raises(RuntimeError):
         gclient.get_client_config(gefyra_server="localhost:31820")
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=WAITING",
+        "jsonpath=.status.state=WAITING",
         namespace="gefyra",
         timeout=60,
     )
@@ -0,0 +1,120 @@
+import json
+from types import SimpleNamespace
+
+from gefyra.configuration import ClientConfiguration, forget_cargo_containers
+from gefyra.local import (
+    ACTIVE_KUBECONFIG_LABEL,
+    CARGO_ENDPOINT_LABEL,
+    CLIENT_ID_LABEL,
+    CONNECTION_NAME_LABEL,
+)
+
+
+class FakeContainers:
+    def __init__(self, containers):
+        self.containers = containers
+        self.lists = 0
+
+    def list(self, **kwargs):
+        self.lists += 1
+        return self.containers
+
+
+class FakeDocker:
+    def __init__(self, containers):
+        self.containers = FakeContainers(containers)
+
+
+def _cargo(connection_name: str, kubeconfig) -> SimpleNamespace:
+    kubeconfig.touch()
+    return SimpleNamespace(
+        name=f"gefyra-cargo-{connection_name}",
+        labels={
+            CONNECTION_NAME_LABEL: connection_name,
+            CARGO_ENDPOINT_LABEL: f"{connection_name}:31820",
+            ACTIVE_KUBECONFIG_LABEL: str(kubeconfig),
+            CLIENT_ID_LABEL: f"client-{connection_name}",
+        },
+    )
+
+
+def test_cargo_containers_are_listed_once(tmp_path):
+    forget_cargo_containers()
+    docker_client = FakeDocker(
+        [_cargo("a", tmp_path / "a.yaml"), _cargo("b", tmp_path / "b.yaml")]
+    )
+    containers = docker_client.containers
+    config_a = ClientConfiguration(docker_client=docker_client, connection_name="a")
+    config_b = ClientConfiguration(docker_client=docker_client, connection_name="b")
+    config_c = ClientConfiguration(docker_client=docker_client, connection_name="c")
+    assert containers.lists == 1
+    assert config_a.CLIENT_ID == "client-a"
+    assert config_a.CARGO_CONTAINER_NAME == "gefyra-cargo-a"
+    assert config_b.CARGO_ENDPOINT == "b:31820"
+    assert config_c.CARGO_CONTAINER_NAME == "gefyra-cargo-default"
+    forget_cargo_containers()
+    ClientConfiguration(docker_client=docker_client, connection_name="a")
+    assert containers.lists == 2
+
+
+def _endpoint_config(monkeypatch, tmp_path, ips, docker0=False):
+    import gefyra.configuration
+
+    monkeypatch.setattr(gefyra.configuration, "_docker_context", "desktop")
+    monkeypatch.setattr(gefyra.configuration, "_docker_host_ips", {})
+    monkeypatch.setattr(gefyra.configuration, "_refresh_threads", [])
+    monkeypatch.setattr(gefyra.configuration, "uses_docker0", lambda: docker0)
+    resolved = []
+
+    def resolve(self):
+        resolved.append(ips[len(resolved)])
+        if isinstance(resolved[-1], Exception):
+            raise resolved[-1]
+        return resolved[-1]
+
+    monkeypatch.setattr(ClientConfiguration, "_resolve_docker_host_ip", resolve)
+    config = ClientConfiguration(ignore_docker=True, gefyra_config_root=tmp_path)
+    return config, resolved
+
+
+def test_cargo_endpoint_is_resolved_once(monkeypatch, tmp_path):
+    import gefyra.configuration
+
+    config, resolved = _endpoint_config(monkeypatch, tmp_path, ["192.168.65.254"])
+    assert config.CARGO_ENDPOINT == "192.168.65.254:31820"
+    assert config.CARGO_ENDPOINT == "192.168.65.254:31820"
+    assert resolved == ["192.168.65.254"]
+    # a new process reads the persisted IP
+    monkeypatch.setattr(gefyra.configuration, "_docker_host_ips", {})
+    config = ClientConfiguration(ignore_docker=True, gefyra_config_root=tmp_path)
+    assert config.CARGO_ENDPOINT == "192.168.65.254:31820"
+    assert resolved == ["192.168.65.254"]
+
+
+def test_expired_cargo_endpoint_is_refreshed(monkeypatch, tmp_path):
+    import gefyra.configuration
+
+    config, resolved = _endpoint_config(monkeypatch, tmp_path, ["10.0.0.1"])
+    cache_file = tmp_path / gefyra.configuration.DOCKER_HOST_IPS_FILE
+    cache_file.write_text(json.dumps({"desktop": {"ip": "10.0.0.2", "resolvedAt": 0}}))
+    assert config.CARGO_ENDPOINT == "10.0.0.2:31820"
+    gefyra.configuration._join_refresh_threads()
+    assert resolved == ["10.0.0.1"]
+    assert json.loads(cache_file.read_text())["desktop"]["ip"] == "10.0.0.1"
+
+
+def test_expired_docker0_endpoint_is_refreshed_right_away(monkeypatch, tmp_path):
+    import gefyra.configuration
+
+    config, resolved = _endpoint_config(
+        monkeypatch, tmp_path, [OSError("No such device"), "172.17.0.1"], docker0=True
+    )
+    cache_file = tmp_path / gefyra.configuration.DOCKER_HOST_IPS_FILE
+    cache_file.write_text(
+        json.dumps({"desktop": {"ip": "172.18.0.1", "resolvedAt": 0}})
+    )
+    # a failing refresh keeps the expired IP
+    assert config.CARGO_ENDPOINT == "172.18.0.1:31820"
+    monkeypatch.setattr(gefyra.configuration, "_docker_host_ips", {})
+    assert config.CARGO_ENDPOINT == "172.17.0.1:31820"
+    assert gefyra.configuration._refresh_threads == []
@@ -0,0 +1,80 @@
+from time import sleep
+
+import kubernetes
+import pytest
+
+from gefyra.cluster.watch import wait_for
+from gefyra.exceptions import CommandTimeoutError
+
+
+def _bridge(name: str, resource_version: str, state: str = "") -> dict:
+    return {
+        "metadata": {"name": name, "resourceVersion": resource_version},
+        "status": {"state": state},
+    }
+
+
+class FakeWatch:
+    # the events of each watch, one list per watch call
+    streams: list = []
+    resource_versions: list = []
+
+    def stream(self, func, resource_version=None, timeout_seconds=None, **kwargs):
+        FakeWatch.resource_versions.append(resource_version)
+        yield from FakeWatch.streams.pop(0)
+
+    def stop(self):
+        pass
+
+
+@pytest.fixture
+def fake_watch(monkeypatch):
+    monkeypatch.setattr(kubernetes.watch, "Watch", FakeWatch)
+    FakeWatch.resource_versions = []
+    return FakeWatch
+
+
+def _list(*items, resource_version="1"):
+    def list_func(**kwargs):
+        return {"metadata": {"resourceVersion": resource_version}, "items": list(items)}
+
+    return list_func
+
+
+def _active(objects):
+    return bool(objects) and all(
+        obj["status"]["state"] == "ACTIVE" for obj in objects.values()
+    )
+
+
+def test_met_condition_returns_without_watching(fake_watch):
+    fake_watch.streams = []
+    objects = wait_for(_list(_bridge("a", "1", "ACTIVE")), _active)
+    assert list(objects) == ["a"]
+    assert fake_watch.resource_versions == []
+
+
+def test_watch_is_resumed_from_the_last_resource_version(fake_watch):
+    fake_watch.streams = [
+        [{"type": "MODIFIED", "object": _bridge("a", "2", "CREATING")}],
+        [{"type": "MODIFIED", "object": _bridge("a", "3", "ACTIVE")}],
+    ]
+    objects = wait_for(_list(_bridge("a", "1", "REQUESTED")), _active, timeout=5)
+    assert objects["a"]["metadata"]["resourceVersion"] == "3"
+    assert fake_watch.resource_versions == ["1", "2"]
+
+
+def test_deleted_objects_are_removed(fake_watch):
+    fake_watch.streams = [[{"type": "DELETED", "object": _bridge("a", "2")}]]
+    objects = wait_for(_list(_bridge("a", "1")), lambda objects: not objects)
+    assert objects == {}
+
+
+def test_timeout_is_raised(fake_watch):
+    def slow_events():
+        sleep(0.05)
+        yield {"type": "MODIFIED", "object": _bridge("a", "2", "CREATING")}
+
+    fake_watch.streams = [slow_events()]
+    with pytest.raises(CommandTimeoutError):
+        wait_for(_list(_bridge("a", "1")), _active, timeout=0.01)
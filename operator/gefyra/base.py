@@ -1,5 +1,11 @@
-from typing import Any, Dict, Optional
+import copy
+from contextlib import contextmanager
+from datetime import datetime
+import logging
+from typing import Any, Dict, Iterator, Optional
 import uuid
+import kopf
+from gefyra.callstats import start_counting, stop_counting
 from gefyra.configuration import OperatorConfiguration
 from gefyra.connection.abstract import AbstractGefyraConnectionProvider
 import kubernetes as k8s
@@ -10,19 +16,61 @@ from gefyra.connection.factory import (
     connection_provider_factory,
 )
 
+from gefyra.eventqueue import event_queue
+from gefyra.kubeclient import get_api_client
+from gefyra.metrics import STATE_TRANSITION_SECONDS
+from gefyra.resources.crds import (
+    API_VERSION,
+    INITIAL_STATE,
+    STATUS_FIELDS,
+    get_status,
+)
 from gefyra.resources.events import _get_now
 
+logger = logging.getLogger("gefyra.base")
+
+
+def merge_patch(target: Dict[str, Any], patch: Dict[str, Any]) -> None:
+    """
+    Apply a JSON merge patch (RFC 7386) to a dict in place, a None value removes a key
+    """
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge_patch(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+
+
+def merge_patches(first: Dict[str, Any], second: Dict[str, Any]) -> None:
+    """
+    Combine two JSON merge patches in place into `first`, so that it has the effect of
+    applying both; unlike merge_patch, a None value is kept to remove the key
+    """
+    for key, value in second.items():
+        if isinstance(value, dict) and isinstance(first.get(key), dict):
+            merge_patches(first[key], value)
+        else:
+            first[key] = copy.deepcopy(value)
+
 
 class GefyraStateObject:
     plural: str
+    kind: str
 
-    def __init__(self, data: dict):
+    def __init__(self, data: dict, api_client: Optional[k8s.client.ApiClient] = None):
         self._state = None
+        # the states entered by this object, with their timestamps
+        self._entered: Dict[str, str] = {}
         self.data = data
         self.name = data["metadata"]["name"]
         self.namespace = data["metadata"]["namespace"]
+        # the writes collected during write_behind, sent as one patch
+        self._pending: Dict[str, Any] = {}
+        self._buffering = 0
 
-        self.custom_api = k8s.client.CustomObjectsApi()
+        self.custom_api = k8s.client.CustomObjectsApi(api_client or get_api_client())
 
     def __repr__(self):
         return f"{self.__class__.__name__}: {self.name} (state={self.state})"
@@ -30,31 +78,124 @@ class GefyraStateObject:
     @property
     def state(self):
         if self._state is None:
-            self._state = self.data["state"]
+            self._state = get_status(self.data, "state") or INITIAL_STATE
         return self._state
 
     @state.setter
     def state(self, value):
+        previous = self._state or get_status(self.data, "state")
         self._state = value
-        self._write_state(value)
-
-    def _write_state(self, state: State):
-        self.custom_api.patch_namespaced_custom_object(
-            namespace=self.namespace,
-            name=self.name,
-            body={
-                "state": str(state),
-                "stateTransitions": {str(state): _get_now()},
-            },
-            plural=self.plural,
-            group="gefyra.dev",
-            version="v1",
+        now = self._write_state(value)
+        if previous and str(previous) != str(value):
+            self._observe_transition(str(previous), str(value), now)
+
+    def _write_state(self, state: State) -> str:
+        now = _get_now()
+        self.patch({"state": str(state), "stateTransitions": {str(state): now}})
+        self._entered[str(state)] = now
+        return now
+
+    @contextmanager
+    def write_behind(self) -> Iterator[None]:
+        """
+        Collect the state and field writes to this object, e.g. of a reconciliation,
+        and send them as one patch at the end; if it fails, the writes are still sent,
+        but an error of that patch does not replace the original exception; a server
+        error of the patch is retried by kopf shortly
+        """
+        self._buffering += 1
+        try:
+            yield
+        except BaseException:
+            self._buffering -= 1
+            if not self._buffering:
+                try:
+                    self.flush()
+                except Exception as e:
+                    logger.error(f"Could not write {self.kind} '{self.name}': {e}")
+            raise
+        self._buffering -= 1
+        if not self._buffering:
+            try:
+                self.flush()
+            except k8s.client.ApiException as e:
+                if e.status == 500:
+                    raise kopf.TemporaryError(
+                        f"Cannot write {self.kind} '{self.name}': {e.reason}", delay=1
+                    )
+                raise e
+
+    def patch(self, data: Dict[str, Any]) -> None:
+        """
+        Write fields of this object, right away or at the end of write_behind; the
+        fields are updated in `data` immediately; the state fields are written to the
+        status subresource
+        """
+        status = {key: data[key] for key in STATUS_FIELDS if key in data}
+        if status:
+            # carry the transitions of objects created as v1 over to their status
+            legacy = self.data.get("stateTransitions")
+            current = self.data.get("status") or {}
+            if (
+                legacy
+                and "stateTransitions" in status
+                and "stateTransitions" not in current
+            ):
+                status["stateTransitions"] = {**legacy, **status["stateTransitions"]}
+            data = {key: value for key, value in data.items() if key not in status}
+            data["status"] = {**data.get("status", {}), **status}
+        merge_patch(self.data, data)
+        merge_patches(self._pending, data)
+        if not self._buffering:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        body, self._pending = self._pending, {}
+        # the status subresource ignores all other fields, and vice versa
+        status = body.pop("status", None)
+        if body:
+            self.custom_api.patch_namespaced_custom_object(
+                namespace=self.namespace,
+                name=self.name,
+                body=body,
+                plural=self.plural,
+                group="gefyra.dev",
+                version=API_VERSION,
+            )
+        if status:
+            self.custom_api.patch_namespaced_custom_object_status(
+                namespace=self.namespace,
+                name=self.name,
+                body={"status": status},
+                plural=self.plural,
+                group="gefyra.dev",
+                version=API_VERSION,
+            )
+
+    def _observe_transition(self, previous: str, state: str, now: str) -> None:
+        """
+        Observe the time since the previous state was entered, as recorded in the
+        stateTransitions of this object
+        """
+        entered = self._entered.get(previous) or (
+            get_status(self.data, "stateTransitions") or {}
+        ).get(previous)
+        if not entered:
+            return
+        duration = datetime.fromisoformat(now.strip("Z")) - datetime.fromisoformat(
+            entered.strip("Z")
+        )
+        STATE_TRANSITION_SECONDS.labels(kind=self.kind, state=state).observe(
+            max(duration.total_seconds(), 0)
         )
 
 
 class StateControllerMixin:
     configuration: OperatorConfiguration
     logger: Any
+    api_client: k8s.client.ApiClient
     custom_api: k8s.client.CustomObjectsApi
     events_api: k8s.client.EventsV1Api
     plural: str
@@ -83,16 +224,32 @@ class StateControllerMixin:
     def connection_provider(self) -> AbstractGefyraConnectionProvider:
         """
         It creates a Gefyra connection provider object based on the connection
-        provider type
+        provider type, once per state machine
         :return: The connection provider is being returned.
         """
-        provider = connection_provider_factory.get(
-            ConnectionProviderType(self.data.get(self.connection_provider_field)),
-            self.configuration,
-            self.logger,
-        )
+        provider = getattr(self, "_connection_provider", None)
+        if provider is None:
+            provider = connection_provider_factory.get(
+                ConnectionProviderType(self.data.get(self.connection_provider_field)),
+                self.configuration,
+                self.logger,
+                api_client=self.api_client,
+            )
+            self._connection_provider = provider
         return provider
 
+    def before_transition(self, event: str, source: State, target: State):
+        start_counting()
+
+    def after_transition(self, event: str, source: State, target: State):
+        # the number of calls of each transition, to spot additional round trips
+        stats = stop_counting()
+        if stats is not None:
+            self.logger.info(
+                f"{self.kind} '{self.object_name}' transition '{event}' "
+                f"({source.value} -> {target.value}) made {stats}"
+            )
+
     def completed_transition(self, target: State) -> Optional[str]:
         """
         Read the stateTransitions attribute, return the value of the
@@ -101,7 +258,7 @@ class StateControllerMixin:
         :type target: State
         :return: The value of the stateTransitions key in the model dictionary.
         """
-        if transitions := self.data.get("stateTransitions"):
+        if transitions := get_status(self.data, "stateTransitions"):
             return transitions.get(target, None)
         else:
             return None
@@ -136,16 +293,8 @@ class StateControllerMixin:
                 uid=self.data["metadata"]["uid"],
             ),
         )
-        self.events_api.create_namespaced_event(
-            namespace=self.configuration.NAMESPACE, body=event
-        )
+        # posted in the background, the handler does not wait for it
+        event_queue.post(self.configuration.NAMESPACE, event)
 
     def _patch_object(self, data: dict):
-        self.custom_api.patch_namespaced_custom_object(
-            namespace=self.configuration.NAMESPACE,
-            name=self.object_name,
-            body=data,
-            group="gefyra.dev",
-            plural=self.plural,
-            version="v1",
-        )
+        self.model.patch(data)
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# (container port, destination host, destination port)
+ProxyRoute = Tuple[int, str, int]
 
 
 class AbstractGefyraBridgeProvider(ABC):
@@ -29,6 +32,13 @@ class AbstractGefyraBridgeProvider(ABC):
         """
         raise NotImplementedError
 
+    def wait_ready(self, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for this Gefyra bridge provider to become ready,
+        providers should override this to return as soon as they are ready
+        """
+        return self.ready()
+
     @abstractmethod
     def uninstall(self):
         """
@@ -60,6 +70,24 @@ class AbstractGefyraBridgeProvider(ABC):
         """
         raise NotImplementedError
 
+    def add_proxy_routes(self, routes: List[ProxyRoute]):
+        """
+        Add several proxy routes which do not exist yet, providers should override this
+        to apply all routes at once
+        """
+        for route in routes:
+            if not self.proxy_route_exists(*route):
+                self.add_proxy_route(*route)
+
+    def remove_proxy_routes(self, routes: List[ProxyRoute]):
+        """
+        Remove several proxy routes which exist, providers should override this to
+        apply all removals at once
+        """
+        for route in routes:
+            if self.proxy_route_exists(*route):
+                self.remove_proxy_route(*route)
+
     @abstractmethod
     def proxy_route_exists(
         self, container_port: int, destination_host: str, destination_port: int
@@ -1,19 +1,52 @@
 import json
+import re
 from typing import Any, Dict, List, Optional
 from gefyra.utils import exec_command_pod
 import kubernetes as k8s
 
-from gefyra.bridge.abstract import AbstractGefyraBridgeProvider
+from gefyra.bridge.abstract import AbstractGefyraBridgeProvider, ProxyRoute
+from gefyra.bridge.carrier.sidecar import CARRIER_SIDECAR_NAME, has_carrier_sidecar
 from gefyra.configuration import OperatorConfiguration
+from gefyra.kubeclient import get_api_client
+from gefyra.readiness import PodWaitTimeout, wait_for_pod
 
-app = k8s.client.AppsV1Api()
-core_v1_api = k8s.client.CoreV1Api()
-custom_object_api = k8s.client.CustomObjectsApi()
+app = k8s.client.AppsV1Api(get_api_client())
+core_v1_api = k8s.client.CoreV1Api(get_api_client())
+custom_object_api = k8s.client.CustomObjectsApi(get_api_client())
 
 BUSYBOX_COMMAND = "/bin/busybox"
-CARRIER_CONFIGURE_COMMAND_BASE = [BUSYBOX_COMMAND, "sh", "setroute.sh"]
+CARRIER_CONFIGURE_COMMAND_BASE = [BUSYBOX_COMMAND, "sh", "setroutes.sh"]
 CARRIER_CONFIGURE_PROBE_COMMAND_BASE = [BUSYBOX_COMMAND, "sh", "setprobe.sh"]
 CARRIER_ORIGINAL_CONFIGMAP = "gefyra-carrier-restore-configmap"
+CARRIER_CONFIG_FILE = "/tmp/nginx.conf"
+
+# a route as written by setroutes.sh; the sidecar Carrier listens on another port
+ROUTE_PATTERN = re.compile(
+    r"upstream stowaway-(?P<port>\d+) \{server (?P<upstream>[^;]+);\} "
+    r"server \{listen (?P<listen>\d+); proxy_pass stowaway-(?P=port);\}"
+)
+
+
+def parse_proxy_routes(config: str) -> Dict[int, str]:
+    """
+    Read the routes from a Carrier nginx configuration
+    :return: the upstream ("<host>:<port>") by container port
+    """
+    return {
+        int(match.group("port")): match.group("upstream")
+        for match in ROUTE_PATTERN.finditer(config)
+    }
+
+
+def parse_listen_ports(config: str) -> Dict[int, int]:
+    """
+    Read the ports nginx listens on from a Carrier nginx configuration
+    :return: the listen port by container port
+    """
+    return {
+        int(match.group("port")): int(match.group("listen"))
+        for match in ROUTE_PATTERN.finditer(config)
+    }
 
 
 class Carrier(AbstractGefyraBridgeProvider):
@@ -24,18 +57,58 @@ class Carrier(AbstractGefyraBridgeProvider):
         target_pod: str,
         target_container: str,
         logger,
+        api_client: Optional[k8s.client.ApiClient] = None,
     ) -> None:
         self.configuration = configuration
+        self.core_v1_api = (
+            k8s.client.CoreV1Api(api_client) if api_client else core_v1_api
+        )
         self.namespace = target_namespace
         self.pod = target_pod
         self.container = target_container
         self.logger = logger
+        self._sidecar: Optional[bool] = None
+        # one snapshot of the Pod per provider, it is dropped after writing the Pod
+        self._pod: Optional[k8s.client.V1Pod] = None
+        self._probes_ensured = False
+
+    def _read_pod(self) -> k8s.client.V1Pod:
+        if self._pod is None:
+            self._pod = self.core_v1_api.read_namespaced_pod(
+                name=self.pod, namespace=self.namespace
+            )
+        return self._pod
+
+    def _invalidate_pod(self) -> None:
+        self._pod = None
+
+    @property
+    def sidecar(self) -> bool:
+        """
+        True if the Pod runs an injected Carrier sidecar, which takes over the ports of
+        the target container instead of replacing it
+        """
+        if self._sidecar is None:
+            self._sidecar = has_carrier_sidecar(self._read_pod())
+        return self._sidecar
+
+    @property
+    def carrier_container(self) -> str:
+        return CARRIER_SIDECAR_NAME if self.sidecar else self.container
 
     def install(self, parameters: Optional[Dict[Any, Any]] = None):
+        if self.sidecar:
+            self.logger.info(
+                f"Pod {self.pod} runs the Carrier sidecar, container {self.container}"
+                " is not patched"
+            )
+            return
         parameters = parameters or {}
         self._patch_pod_with_carrier(handle_probes=parameters.get("handleProbes", True))
 
     def _ensure_probes(self, container: k8s.client.V1Container) -> bool:
+        if self._probes_ensured:
+            return True
         probes = self._get_all_probes(container)
         for probe in probes:
             try:
@@ -43,15 +116,18 @@ class Carrier(AbstractGefyraBridgeProvider):
                     probe.http_get.port,
                 ]
                 exec_command_pod(
-                    core_v1_api, self.pod, self.namespace, self.container, command
+                    self.core_v1_api, self.pod, self.namespace, self.container, command
                 )
             except Exception as e:
                 self.logger.error(e)
                 return False
+        self._probes_ensured = True
         return True
 
     def installed(self) -> bool:
-        pod = core_v1_api.read_namespaced_pod(name=self.pod, namespace=self.namespace)
+        if self.sidecar:
+            return True
+        pod = self._read_pod()
         for container in pod.spec.containers:
             if (
                 container.name == self.container
@@ -63,21 +139,46 @@ class Carrier(AbstractGefyraBridgeProvider):
         return False
 
     def ready(self) -> bool:
-        if self.installed():
-            pod = core_v1_api.read_namespaced_pod(
-                name=self.pod, namespace=self.namespace
-            )
-            return all(
-                status.ready for status in pod.status.container_statuses
-            ) and any(
-                f"{self.configuration.CARRIER_IMAGE}:{self.configuration.CARRIER_IMAGE_TAG}"
-                in status.image
-                for status in pod.status.container_statuses
-            )
+        if self.sidecar or self.installed():
+            return self._carrier_running(self._read_pod())
         else:
             return False
 
+    def wait_ready(self, timeout: float) -> bool:
+        try:
+            self._pod = wait_for_pod(
+                self.namespace,
+                self._carrier_running,
+                name=self.pod,
+                timeout=timeout,
+                reason="carrier",
+            )
+        except PodWaitTimeout as e:
+            self.logger.warning(e)
+            return False
+        return self.ready()
+
+    def _carrier_running(self, pod: k8s.client.V1Pod) -> bool:
+        """
+        Check the container statuses of the Pod for a ready Carrier
+        """
+        statuses = pod.status.container_statuses or []
+        if self.sidecar:
+            return any(
+                status.name == CARRIER_SIDECAR_NAME and status.ready
+                for status in statuses
+            )
+        return all(status.ready for status in statuses) and any(
+            f"{self.configuration.CARRIER_IMAGE}:{self.configuration.CARRIER_IMAGE_TAG}"
+            in status.image
+            for status in statuses
+        )
+
     def uninstall(self):
+        if self.sidecar:
+            # the sidecar stays dormant, the original container was never changed
+            self._configure_carrier("set", [])
+            return
         self._patch_pod_with_original_config()
 
     def add_proxy_route(
@@ -87,32 +188,81 @@ class Carrier(AbstractGefyraBridgeProvider):
         destination_port: int,
         parameters: Optional[Dict[Any, Any]] = None,
     ):
-        self._configure_carrier(container_port, destination_host, destination_port)
+        self.add_proxy_routes([(container_port, destination_host, destination_port)])
+
+    def add_proxy_routes(self, routes: List[ProxyRoute]):
+        if not self.ready():
+            raise RuntimeError(
+                f"Not able to configure Carrier in Pod {self.pod}. See error above."
+            )
+        config = self._read_config()
+        current = parse_proxy_routes(config)
+        listen_ports = parse_listen_ports(config)
+        arguments = []
+        for container_port, destination_host, destination_port in routes:
+            upstream = f"{destination_host}:{destination_port}"
+            if current.get(int(container_port)) != upstream:
+                if self.sidecar:
+                    listen_port = self._get_listen_port(
+                        int(container_port), listen_ports
+                    )
+                    arguments += [f"{container_port}:{listen_port}", upstream]
+                else:
+                    arguments += [f"{container_port}", upstream]
+        if arguments:
+            self._configure_carrier("add", arguments)
 
     def remove_proxy_route(
         self, container_port: int, destination_host: str, destination_port: int
     ):
-        """This feature is currently not support by Carrier and does nothing"""
-        pass
+        self.remove_proxy_routes([(container_port, destination_host, destination_port)])
+
+    def remove_proxy_routes(self, routes: List[ProxyRoute]):
+        current = self._get_proxy_routes()
+        arguments = [
+            f"{container_port}"
+            for container_port, destination_host, destination_port in routes
+            if current.get(int(container_port))
+            == f"{destination_host}:{destination_port}"
+        ]
+        if arguments:
+            self._configure_carrier("remove", arguments)
 
     def proxy_route_exists(
         self, container_port: int, destination_host: str, destination_port: int
     ) -> bool:
-        output = exec_command_pod(
-            core_v1_api,
+        return (
+            self._get_proxy_routes().get(int(container_port))
+            == f"{destination_host}:{destination_port}"
+        )
+
+    def _get_proxy_routes(self) -> Dict[int, str]:
+        return parse_proxy_routes(self._read_config())
+
+    def _read_config(self) -> str:
+        return exec_command_pod(
+            self.core_v1_api,
             self.pod,
             self.namespace,
-            self.container,
-            ["cat", "/tmp/nginx.conf"],
+            self.carrier_container,
+            ["cat", CARRIER_CONFIG_FILE],
         )
-        if (
-            f"upstream stowaway-{container_port} {{server"
-            f" {destination_host}:{destination_port};}} server {{listen"
-            f" {container_port}; proxy_pass stowaway-{container_port};}}" in output
-        ):
-            return True
-        else:
-            return False
+
+    def _get_listen_port(
+        self, container_port: int, listen_ports: Dict[int, int]
+    ) -> int:
+        """
+        Pick the port the sidecar listens on for a container port; the port is kept for
+        an existing route, otherwise the first free one is taken
+        :param listen_ports: the listen ports in use, updated with the picked port
+        """
+        if container_port not in listen_ports:
+            used = set(listen_ports.values())
+            port = self.configuration.CARRIER_SIDECAR_PORT_BASE
+            while port in used:
+                port += 1
+            listen_ports[container_port] = port
+        return listen_ports[container_port]
 
     def validate(self, brige_request: Optional[Dict[Any, Any]] = None):
         raise NotImplementedError
@@ -127,7 +277,7 @@ class Carrier(AbstractGefyraBridgeProvider):
         :param handle_probes: See if Gefyra can handle probes of this Pod
         """
 
-        pod = core_v1_api.read_namespaced_pod(name=self.pod, namespace=self.namespace)
+        pod = self._read_pod()
 
         for container in pod.spec.containers:
             if container.name == self.container:
@@ -163,9 +313,10 @@ class Carrier(AbstractGefyraBridgeProvider):
         self.logger.info(
             f"Now patching Pod {self.pod}; container {self.container} with Carrier"
         )
-        core_v1_api.patch_namespaced_pod(
+        self.core_v1_api.patch_namespaced_pod(
             name=self.pod, namespace=self.namespace, body=pod
         )
+        self._invalidate_pod()
 
     def _get_all_probes(
         self, container: k8s.client.V1Container
@@ -180,8 +331,8 @@ class Carrier(AbstractGefyraBridgeProvider):
         return probes
 
     def _patch_pod_with_original_config(self):
-        pod = core_v1_api.read_namespaced_pod(name=self.pod, namespace=self.namespace)
-        configmap = core_v1_api.read_namespaced_config_map(
+        pod = self._read_pod()
+        configmap = self.core_v1_api.read_namespaced_config_map(
             name=CARRIER_ORIGINAL_CONFIGMAP,
             namespace=self.configuration.NAMESPACE,
         )
@@ -202,9 +353,10 @@ class Carrier(AbstractGefyraBridgeProvider):
             f"Now patching Pod {self.pod}; container {self.container} with original"
             " state"
         )
-        core_v1_api.patch_namespaced_pod(
+        self.core_v1_api.patch_namespaced_pod(
             name=self.pod, namespace=self.namespace, body=pod
         )
+        self._invalidate_pod()
 
     def _check_probe_compatibility(self, probe: k8s.client.V1Probe) -> bool:
         """
@@ -245,14 +397,14 @@ class Carrier(AbstractGefyraBridgeProvider):
             {"op": "add", "path": f"/data/{self.namespace}-{self.pod}", "value": data}
         ]
         try:
-            core_v1_api.patch_namespaced_config_map(
+            self.core_v1_api.patch_namespaced_config_map(
                 name=CARRIER_ORIGINAL_CONFIGMAP,
                 namespace=self.configuration.NAMESPACE,
                 body=config,
             )
         except k8s.client.exceptions.ApiException as e:
             if e.status == 404:
-                core_v1_api.create_namespaced_config_map(
+                self.core_v1_api.create_namespaced_config_map(
                     namespace=self.configuration.NAMESPACE,
                     body=k8s.client.V1ConfigMap(
                         metadata=k8s.client.V1ObjectMeta(
@@ -266,27 +418,28 @@ class Carrier(AbstractGefyraBridgeProvider):
             else:
                 raise e
 
-    def _configure_carrier(
-        self,
-        container_port: int,
-        destination_host: str,
-        destination_port: int,
-    ):
-        if not self.ready():
-            raise RuntimeError(
-                f"Not able to configure Carrier in Pod {self.pod}. See error above."
-            )
+    def _configure_carrier(self, action: str, arguments: List[str]):
+        """
+        Change the routes of Carrier with one reload of nginx
+        :param action: "add", "remove" or "set", see setroutes.sh
+        :param arguments: the ports (and upstreams) for the action
+        :raises RuntimeError: if the routes could not be changed, so that the handler
+            is retried
+        """
+        command = CARRIER_CONFIGURE_COMMAND_BASE + [action] + arguments
         try:
-            command = CARRIER_CONFIGURE_COMMAND_BASE + [
-                f"{container_port}",
-                f"{destination_host}:{destination_port}",
-            ]
             exec_command_pod(
-                core_v1_api, self.pod, self.namespace, self.container, command
+                self.core_v1_api,
+                self.pod,
+                self.namespace,
+                self.carrier_container,
+                command,
             )
         except Exception as e:
             self.logger.error(e)
-            return
+            raise RuntimeError(
+                f"Not able to configure Carrier in Pod {self.pod}: {e}"
+            ) from e
         self.logger.info(f"Carrier configured in {self.pod}")
 
 
@@ -301,6 +454,7 @@ class CarrierBuilder:
         target_pod: str,
         target_container: str,
         logger,
+        api_client: Optional[k8s.client.ApiClient] = None,
         **_ignored,
     ):
         instance = Carrier(
@@ -309,5 +463,6 @@ class CarrierBuilder:
             target_pod=target_pod,
             target_container=target_container,
             logger=logger,
+            api_client=api_client,
         )
         return instance
@@ -0,0 +1,57 @@
+from typing import Any, Dict, List, Optional
+
+from gefyra.configuration import OperatorConfiguration
+
+# Pods with this label get a dormant Carrier sidecar injected by the webhook
+CARRIER_INJECTION_LABEL = "gefyra.dev/carrier-injection"
+CARRIER_SIDECAR_NAME = "gefyra-carrier"
+
+
+def create_carrier_sidecar(configuration: OperatorConfiguration) -> Dict[str, Any]:
+    """
+    The Carrier sidecar runs without routes until a bridge redirects a port of the
+    original container to it with iptables, which requires NET_ADMIN
+    """
+    return {
+        "name": CARRIER_SIDECAR_NAME,
+        "image": f"{configuration.CARRIER_IMAGE}:{configuration.CARRIER_IMAGE_TAG}",
+        "env": [
+            {"name": "CARRIER_MODE", "value": "sidecar"},
+            {
+                "name": "HOST_IP",
+                "valueFrom": {"fieldRef": {"fieldPath": "status.hostIP"}},
+            },
+        ],
+        "securityContext": {
+            "runAsUser": 0,
+            "runAsNonRoot": False,
+            "capabilities": {"add": ["NET_ADMIN"]},
+        },
+        "resources": {
+            "requests": {"cpu": "10m", "memory": "16Mi"},
+            "limits": {"memory": "64Mi"},
+        },
+    }
+
+
+def inject_carrier_sidecar(
+    pod: Dict[str, Any], configuration: OperatorConfiguration
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Add the Carrier sidecar to a Pod manifest
+    :return: the containers of the Pod with the sidecar, None if it is already there
+    """
+    containers = list(pod.get("spec", {}).get("containers", []))
+    if any(container["name"] == CARRIER_SIDECAR_NAME for container in containers):
+        return None
+    return containers + [create_carrier_sidecar(configuration)]
+
+
+def has_carrier_sidecar(pod) -> bool:
+    """
+    :param pod: a V1Pod
+    :return: True if the Carrier sidecar was injected to the Pod
+    """
+    return any(
+        container.name == CARRIER_SIDECAR_NAME for container in pod.spec.containers
+    )
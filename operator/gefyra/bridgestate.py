@@ -10,10 +10,13 @@ from statemachine import State, StateMachine
 
 from gefyra.base import GefyraStateObject, StateControllerMixin
 from gefyra.configuration import OperatorConfiguration
+from gefyra.kubeclient import get_api_client
+from gefyra.sunset import parse_sunset
 
 
 class GefyraBridgeObject(GefyraStateObject):
     plural = "gefyrabridges"
+    kind = "GefyraBridge"
 
 
 class GefyraBridge(StateMachine, StateControllerMixin):
@@ -71,38 +74,40 @@ class GefyraBridge(StateMachine, StateControllerMixin):
         model: GefyraBridgeObject,
         configuration: OperatorConfiguration,
         logger: Any,
+        api_client: Optional[k8s.client.ApiClient] = None,
     ):
         super().__init__()
         self.model = model
         self.data = model.data
         self.configuration = configuration
         self.logger = logger
-        self.custom_api = k8s.client.CustomObjectsApi()
-        self.events_api = k8s.client.EventsV1Api()
+        self.api_client = api_client or get_api_client()
+        self.custom_api = k8s.client.CustomObjectsApi(self.api_client)
+        self.events_api = k8s.client.EventsV1Api(self.api_client)
         self._bridge_provider = None
 
     @property
     def bridge_provider(self) -> AbstractGefyraBridgeProvider:
         """
-        It creates a Gefyra bridge provider object based on the provider type
+        It creates a Gefyra bridge provider object based on the provider type, once
+        per state machine
         :return: The bridge provider is being returned.
         """
-        provider = bridge_provider_factory.get(
-            BridgeProviderType(self.data.get("provider")),
-            self.configuration,
-            self.data["targetNamespace"],
-            self.data["targetPod"],
-            self.data["targetContainer"],
-            self.logger,
-        )
-        return provider
+        if self._bridge_provider is None:
+            self._bridge_provider = bridge_provider_factory.get(
+                BridgeProviderType(self.data.get("provider")),
+                self.configuration,
+                self.data["targetNamespace"],
+                self.data["targetPod"],
+                self.data["targetContainer"],
+                self.logger,
+                api_client=self.api_client,
+            )
+        return self._bridge_provider
 
     @property
     def sunset(self) -> Optional[datetime]:
-        if sunset := self.data.get("sunset"):
-            return datetime.fromisoformat(sunset.strip("Z"))
-        else:
-            return None
+        return parse_sunset(self.data.get("sunset"))
 
     @property
     def should_terminate(self) -> bool:
@@ -124,7 +129,9 @@ class GefyraBridge(StateMachine, StateControllerMixin):
         self.bridge_provider.install()
 
     def _wait_for_provider(self):
-        if not self.bridge_provider.ready():
+        if not self.bridge_provider.wait_ready(
+            self.configuration.CARRIER_STARTUP_TIMEOUT
+        ):
             # TODO add timeout
             raise kopf.TemporaryError(
                 (
@@ -139,6 +146,7 @@ class GefyraBridge(StateMachine, StateControllerMixin):
     def on_activate(self):
         self.logger.info(f"GefryaBridge '{self.object_name}' is being activated")
         destination = self.data["destinationIP"]
+        routes = []
         for port_mapping in self.data.get("portMappings"):
             source_port, target_port = port_mapping.split(":")
             if not self.connection_provider.destination_exists(
@@ -152,12 +160,9 @@ class GefyraBridge(StateMachine, StateControllerMixin):
                     self.data["client"], destination, int(source_port)
                 )
             proxy_host, proxy_port = proxy_host.split(":", 1)
-            if not self.bridge_provider.proxy_route_exists(
-                target_port, proxy_host, proxy_port
-            ):
-                self.bridge_provider.add_proxy_route(
-                    target_port, proxy_host, proxy_port
-                )
+            routes.append((int(target_port), proxy_host, int(proxy_port)))
+        # all routes are configured at once, the provider skips existing ones
+        self.bridge_provider.add_proxy_routes(routes)
         self.send("establish")
 
     def on_create(self):
@@ -166,6 +171,8 @@ class GefyraBridge(StateMachine, StateControllerMixin):
     def on_remove(self):
         self.logger.info(f"GefyraBridge '{self.object_name}' is being removed")
         destination = self.data["destinationIP"]
+        routes = []
+        source_ports = []
         for port_mapping in self.data.get("portMappings"):
             source_port, target_port = port_mapping.split(":")
             if self.connection_provider.destination_exists(
@@ -175,15 +182,13 @@ class GefyraBridge(StateMachine, StateControllerMixin):
                     self.data["client"], destination, int(source_port)
                 )
                 proxy_host, proxy_port = proxy_host.split(":", 1)
-                if self.bridge_provider.proxy_route_exists(
-                    target_port, proxy_host, proxy_port
-                ):
-                    self.bridge_provider.remove_proxy_route(
-                        target_port, proxy_host, proxy_port
-                    )
-                self.connection_provider.remove_destination(
-                    self.data["client"], destination, int(source_port)
-                )
+                routes.append((int(target_port), proxy_host, int(proxy_port)))
+                source_ports.append(int(source_port))
+        self.bridge_provider.remove_proxy_routes(routes)
+        for source_port in source_ports:
+            self.connection_provider.remove_destination(
+                self.data["client"], destination, source_port
+            )
         self.send("set_installed")
 
     def on_restore(self):
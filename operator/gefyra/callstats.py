@@ -0,0 +1,70 @@
+import contextvars
+from dataclasses import dataclass
+from typing import Optional
+
+import kubernetes as k8s
+
+
+@dataclass
+class CallStats:
+    """
+    The requests to the Kubernetes API and the execs into Pods made while counting
+    """
+
+    api_calls: int = 0
+    execs: int = 0
+
+    def __str__(self) -> str:
+        return f"{self.api_calls} API calls and {self.execs} execs"
+
+
+_current: contextvars.ContextVar[Optional[CallStats]] = contextvars.ContextVar(
+    "gefyra_call_stats", default=None
+)
+
+
+def start_counting() -> CallStats:
+    """
+    Count the calls of the current thread (or task) from now on into a new CallStats
+    """
+    stats = CallStats()
+    _current.set(stats)
+    return stats
+
+
+def stop_counting() -> Optional[CallStats]:
+    """
+    :return: the CallStats counted since start_counting, None if nothing was counted
+    """
+    stats = _current.get()
+    _current.set(None)
+    return stats
+
+
+def count_api_call() -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.api_calls += 1
+
+
+def count_exec() -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.execs += 1
+
+
+def instrument_api_client() -> None:
+    """
+    Count every request of the Kubernetes client; execs replace the request function
+    of their ApiClient, so they are not counted here but by count_exec
+    """
+    request = k8s.client.ApiClient.request
+    if getattr(request, "_gefyra_counted", False):
+        return
+
+    def counted_request(self, *args, **kwargs):
+        count_api_call()
+        return request(self, *args, **kwargs)
+
+    counted_request._gefyra_counted = True  # type: ignore
+    k8s.client.ApiClient.request = counted_request
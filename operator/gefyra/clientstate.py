@@ -8,14 +8,19 @@ from statemachine import State, StateMachine
 
 from gefyra.base import GefyraStateObject, StateControllerMixin
 from gefyra.configuration import OperatorConfiguration
+from gefyra.connection.batch import peer_batcher
 from gefyra.resources.serviceaccounts import (
     get_serviceaccount_data,
     handle_create_gefyraclient_serviceaccount,
 )
+from gefyra.kubeclient import get_api_client
+from gefyra.resources.crds import API_VERSION, CLIENT_LABEL
+from gefyra.sunset import parse_sunset
 
 
 class GefyraClientObject(GefyraStateObject):
     plural = "gefyraclients"
+    kind = "GefyraClient"
 
 
 class GefyraClient(StateMachine, StateControllerMixin):
@@ -64,14 +69,16 @@ class GefyraClient(StateMachine, StateControllerMixin):
         model: GefyraClientObject,
         configuration: OperatorConfiguration,
         logger: Any,
+        api_client: Optional[k8s.client.ApiClient] = None,
     ):
         super().__init__()
         self.model = model
         self.data = model.data
         self.configuration = configuration
         self.logger = logger
-        self.custom_api = k8s.client.CustomObjectsApi()
-        self.events_api = k8s.client.EventsV1Api()
+        self.api_client = api_client or get_api_client()
+        self.custom_api = k8s.client.CustomObjectsApi(self.api_client)
+        self.events_api = k8s.client.EventsV1Api(self.api_client)
         self._connection_provider = None
 
     @property
@@ -92,10 +99,7 @@ class GefyraClient(StateMachine, StateControllerMixin):
 
     @property
     def sunset(self) -> Optional[datetime]:
-        if sunset := self.data.get("sunset"):
-            return datetime.fromisoformat(sunset.strip("Z"))
-        else:
-            return None
+        return parse_sunset(self.data.get("sunset"))
 
     @property
     def should_terminate(self) -> bool:
@@ -148,7 +152,7 @@ class GefyraClient(StateMachine, StateControllerMixin):
             self.logger.warning(
                 f"Removing '{self.object_name}' from connection provider"
             )
-            self.connection_provider.remove_peer(self.object_name)
+            peer_batcher.remove_peer(self.connection_provider, self.object_name)
         # TODO delete SA, Rolebinding
 
     def can_add_client(self):
@@ -156,8 +160,10 @@ class GefyraClient(StateMachine, StateControllerMixin):
             self.logger.warning(f"Client '{self.object_name}' already exists.")
             return True
         else:
-            self.connection_provider.add_peer(
-                self.object_name, self.data["providerParameter"]
+            peer_batcher.add_peer(
+                self.connection_provider,
+                self.object_name,
+                self.data["providerParameter"],
             )
             return True
 
@@ -168,13 +174,7 @@ class GefyraClient(StateMachine, StateControllerMixin):
             raise kopf.TemporaryError(
                 f"Cannot read connection data from provider: {e}", delay=1
             )
-        try:
-            self._patch_object({"providerConfig": conn_data})
-        except k8s.client.ApiException as e:
-            if e.status == 500:
-                raise kopf.TemporaryError(
-                    f"Cannot enable connection: {e.reason}", delay=1
-                )
+        self._patch_object({"providerConfig": conn_data})
 
     def disable_connection(self):
         try:
@@ -183,7 +183,7 @@ class GefyraClient(StateMachine, StateControllerMixin):
                     f"Client '{self.object_name}' does not exist, noting to disable."
                 )
                 return
-            self.connection_provider.remove_peer(self.object_name)
+            peer_batcher.remove_peer(self.connection_provider, self.object_name)
         except k8s.client.rest.ApiException as e:
             if e.status == 500:
                 raise kopf.TemporaryError(
@@ -194,23 +194,23 @@ class GefyraClient(StateMachine, StateControllerMixin):
     def cleanup_all_bridges(self):
         bridges = self.custom_api.list_namespaced_custom_object(
             group="gefyra.dev",
-            version="v1",
+            version=API_VERSION,
             plural="gefyrabridges",
             namespace=self.configuration.NAMESPACE,
+            label_selector=f"{CLIENT_LABEL}={self.client_name}",
         )
         for bridge in bridges.get("items"):
-            if bridge.get("client") == self.client_name:
-                self.logger.warning(
-                    "Now going to delete remaining Gefyra bridge "
-                    f"'{bridge['metadata']['name']}' for client {self.client_name}"
-                )
-                self.custom_api.delete_namespaced_custom_object(
-                    group="gefyra.dev",
-                    version="v1",
-                    plural="gefyrabridges",
-                    namespace=self.configuration.NAMESPACE,
-                    name=bridge["metadata"]["name"],
-                )
+            self.logger.warning(
+                "Now going to delete remaining Gefyra bridge "
+                f"'{bridge['metadata']['name']}' for client {self.client_name}"
+            )
+            self.custom_api.delete_namespaced_custom_object(
+                group="gefyra.dev",
+                version=API_VERSION,
+                plural="gefyrabridges",
+                namespace=self.configuration.NAMESPACE,
+                name=bridge["metadata"]["name"],
+            )
 
     def get_latest_transition(self) -> Optional[datetime]:
         """
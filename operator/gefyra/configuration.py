@@ -26,9 +26,62 @@ class OperatorConfiguration:
         self.STOWAWAY_INTERNAL_SUBNET = config(
             "GEFYRA_INTERNAL_SUBNET", default="192.168.99.0"
         )
+        # apply peers to the running Wireguard interface instead of restarting Stowaway
+        self.STOWAWAY_LIVE_PEERS = config(
+            "GEFYRA_STOWAWAY_LIVE_PEERS", cast=bool, default=True
+        )
+
+        # threads to run the (synchronous) handlers of clients and bridges concurrently
+        self.HANDLER_WORKERS = config("GEFYRA_HANDLER_WORKERS", cast=int, default=20)
+        # the port of the Prometheus metrics endpoint, 0 disables it
+        self.METRICS_PORT = config("GEFYRA_METRICS_PORT", cast=int, default=9090)
+
+        # the one client to the Kubernetes API shared by the operator: a connection
+        # per handler thread plus the long-running watches of the informers
+        self.API_POOL_MAXSIZE = config(
+            "GEFYRA_API_POOL_MAXSIZE", cast=int, default=self.HANDLER_WORKERS + 8
+        )
+        # seconds to wait for a response (watches are not limited)
+        self.API_REQUEST_TIMEOUT = config(
+            "GEFYRA_API_REQUEST_TIMEOUT", cast=float, default=30
+        )
+        # retries of failed connections and idempotent requests (429/5xx)
+        self.API_RETRIES = config("GEFYRA_API_RETRIES", cast=int, default=3)
+        self.API_RETRY_BACKOFF = config(
+            "GEFYRA_API_RETRY_BACKOFF", cast=float, default=0.5
+        )
+
+        # seconds to collect peers of concurrent clients before applying them at once
+        self.PEER_BATCH_WINDOW = config(
+            "GEFYRA_PEER_BATCH_WINDOW", cast=float, default=0.2
+        )
+
+        # manage peers and proxy routes through the control API of Stowaway
+        self.STOWAWAY_CONTROL_API = config(
+            "GEFYRA_STOWAWAY_CONTROL_API", cast=bool, default=True
+        )
+        self.STOWAWAY_CONTROL_PORT = config(
+            "GEFYRA_STOWAWAY_CONTROL_PORT", cast=int, default=8181
+        )
+        self.STOWAWAY_CONTROL_TIMEOUT = config(
+            "GEFYRA_STOWAWAY_CONTROL_TIMEOUT", cast=float, default=30
+        )
+        self.STOWAWAY_CONTROL_POOLSIZE = config(
+            "GEFYRA_STOWAWAY_CONTROL_POOLSIZE", cast=int, default=4
+        )
+
+        # serve reads of the Stowaway Pod and configmaps from a watch-based cache
+        self.INFORMER_ENABLED = config(
+            "GEFYRA_INFORMER_ENABLED", cast=bool, default=True
+        )
+        self.INFORMER_SYNC_TIMEOUT = config(
+            "GEFYRA_INFORMER_SYNC_TIMEOUT", cast=float, default=5
+        )
 
         self.STOWAWAY_PROXYROUTE_CONFIGMAPNAME = "gefyra-stowaway-proxyroutes"
         self.STOWAWAY_CONFIGMAPNAME = "gefyra-stowaway-config"
+        self.STOWAWAY_CONTROL_SECRETNAME = "gefyra-stowaway-control"
+        self.STOWAWAY_CONTROL_SERVICENAME = "gefyra-stowaway-control"
         self.STOWAWAY_STORAGE = config(
             "GEFYRA_STOWAWAY_STORAGE", cast=int, default=64
         )  # see https://github.com/gefyrahq/gefyra/issues/670
@@ -40,6 +93,11 @@ class OperatorConfiguration:
         self.CARRIER_STARTUP_TIMEOUT = config(
             "GEFYRA_CARRIER_STARTUP_TIMEOUT", cast=int, default=60
         )
+        # the injected Carrier sidecar listens on ports from here, above the ephemeral
+        # port range of Linux
+        self.CARRIER_SIDECAR_PORT_BASE = config(
+            "GEFYRA_CARRIER_SIDECAR_PORT_BASE", cast=int, default=61000
+        )
 
     def to_dict(self):
         return {k: v for k, v in self.__dict__.items() if k.isupper()}
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 
 class AbstractGefyraConnectionProvider(ABC):
@@ -47,6 +47,21 @@ class AbstractGefyraConnectionProvider(ABC):
         """
         raise NotImplementedError
 
+    def add_peers(self, peers: Dict[str, Optional[Dict[Any, Any]]]):
+        """
+        Add several peers (mapped to their parameters) to the connection provider,
+        providers should override this to apply all peers at once
+        """
+        for peer_id, parameters in peers.items():
+            self.add_peer(peer_id, parameters)
+
+    def remove_peers(self, peer_ids: List[str]) -> Dict[str, bool]:
+        """
+        Remove several peers from the connection provider, providers should override
+        this to apply all removals at once
+        """
+        return {peer_id: self.remove_peer(peer_id) for peer_id in peer_ids}
+
     @abstractmethod
     def get_peer_config(self, peer_id: str) -> Dict[str, str]:
         """
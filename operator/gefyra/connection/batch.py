@@ -0,0 +1,110 @@
+import threading
+from concurrent.futures import Future
+from time import sleep
+from typing import Any, Dict, List, Optional, Tuple
+
+from gefyra.configuration import configuration
+from gefyra.connection.abstract import AbstractGefyraConnectionProvider
+
+ADD = "add"
+REMOVE = "remove"
+
+
+class PeerBatcher:
+    """
+    Collects peer additions and removals of concurrently running handlers for a short
+    window and hands them to the connection provider as one batch
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self._lock = threading.Lock()
+        # batches of a provider are applied one after another
+        self._provider_locks: Dict[str, threading.Lock] = {}
+        self._pending: Dict[
+            Tuple[str, str], Dict[str, Tuple[Optional[Dict[Any, Any]], List[Future]]]
+        ] = {}
+
+    def add_peer(
+        self,
+        provider: AbstractGefyraConnectionProvider,
+        peer_id: str,
+        parameters: Optional[Dict[Any, Any]] = None,
+    ) -> None:
+        """
+        Add a peer to the connection provider, returns once the batch containing this
+        peer has been applied
+        """
+        self._submit(provider, ADD, peer_id, parameters)
+
+    def remove_peer(
+        self, provider: AbstractGefyraConnectionProvider, peer_id: str
+    ) -> bool:
+        """
+        Remove a peer from the connection provider, returns once the batch containing
+        this peer has been applied
+        """
+        return self._submit(provider, REMOVE, peer_id)
+
+    def _submit(
+        self,
+        provider: AbstractGefyraConnectionProvider,
+        operation: str,
+        peer_id: str,
+        parameters: Optional[Dict[Any, Any]] = None,
+    ) -> Any:
+        key = (provider.provider_type, operation)
+        future: Future = Future()
+        with self._lock:
+            leader = key not in self._pending
+            batch = self._pending.setdefault(key, {})
+            if peer_id in batch:
+                if batch[peer_id][0] != parameters:
+                    # the pending batch would apply the other parameters only
+                    raise ValueError(
+                        f"Peer {peer_id} is already pending with other parameters"
+                    )
+                batch[peer_id][1].append(future)
+            else:
+                batch[peer_id] = (parameters, [future])
+        if leader:
+            # the first caller waits for the window to close and applies the batch
+            # on behalf of all callers that joined in the meantime
+            if self.window > 0:
+                sleep(self.window)
+            with self._lock:
+                provider_lock = self._provider_locks.setdefault(
+                    provider.provider_type, threading.Lock()
+                )
+            with provider_lock:
+                # callers keep joining the batch while an earlier one is applied
+                with self._lock:
+                    batch = self._pending.pop(key)
+                self._flush(provider, operation, batch)
+        return future.result()
+
+    def _flush(
+        self,
+        provider: AbstractGefyraConnectionProvider,
+        operation: str,
+        batch: Dict[str, Tuple[Optional[Dict[Any, Any]], List[Future]]],
+    ) -> None:
+        try:
+            if operation == ADD:
+                provider.add_peers(
+                    {peer_id: parameters for peer_id, (parameters, _) in batch.items()}
+                )
+                results: Dict[str, Any] = {}
+            else:
+                results = provider.remove_peers(list(batch.keys()))
+        except Exception as e:
+            for _, futures in batch.values():
+                for future in futures:
+                    future.set_exception(e)
+        else:
+            for peer_id, (_, futures) in batch.items():
+                for future in futures:
+                    future.set_result(results.get(peer_id))
+
+
+peer_batcher = PeerBatcher(configuration.PEER_BATCH_WINDOW)
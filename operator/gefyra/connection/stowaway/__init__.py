@@ -1,45 +1,60 @@
 import random
 import re
 import string
-from time import sleep
+import threading
+from time import perf_counter, sleep
 from collections import defaultdict
 from os import path
-import os
-from typing import Any, Dict, Optional
-from gefyra.connection.stowaway.resources.configmaps import (
-    create_stowaway_proxyroute_configmap,
-)
+from typing import Any, Dict, List, Optional
 from gefyra.connection.stowaway.resources.services import create_stowaway_proxy_service
-from gefyra.resources.events import _get_now
+from gefyra.connection.stowaway.ports import (
+    PROXY_PORTS_ANNOTATION,
+    ProxyPortAllocator,
+)
+from gefyra.connection.stowaway.routes import ProxyRouteIndex
+from gefyra.connection.stowaway.subnets import SubnetIndex
+from gefyra.connection.stowaway.control import (
+    StowawayControlError,
+    StowawayControlUnavailable,
+    stowaway_control,
+)
 import kopf
 import kubernetes as k8s
 
-from gefyra.utils import exec_command_pod, get_label_selector, stream_copy_from_pod
+from gefyra.utils import exec_command_pod, get_label_selector, stream_read_from_pod
 from gefyra.connection.abstract import AbstractGefyraConnectionProvider
-from gefyra.configuration import OperatorConfiguration
+from gefyra.configuration import OperatorConfiguration, configuration
+from gefyra.informer import Informer, InformerNotSynced
+from gefyra.metrics import STOWAWAY_RELOAD_SECONDS
+from gefyra.readiness import PodWaitTimeout, pod_ready, wait_for_pod
 
 from .components import (
     check_config_configmap,
+    check_control_secret,
     check_proxyroute_configmap,
     check_serviceaccount,
     check_stowaway_statefulset,
     check_stowaway_nodeport_service,
+    check_stowaway_control_service,
     handle_config_configmap,
+    handle_control_secret,
     handle_serviceaccount,
     handle_proxyroute_configmap,
     handle_stowaway_proxy_service,
     handle_stowaway_statefulset,
     handle_stowaway_nodeport_service,
+    handle_stowaway_control_service,
     create_stowaway_statefulset,
-    create_stowaway_configmap,
     remove_stowaway_configmaps,
     remove_stowaway_services,
     remove_stowaway_statefulset,
+    remove_stowaway_secrets,
 )
+from gefyra.kubeclient import get_api_client
 
-app = k8s.client.AppsV1Api()
-core_v1_api = k8s.client.CoreV1Api()
-custom_api = k8s.client.CustomObjectsApi()
+app = k8s.client.AppsV1Api(get_api_client())
+core_v1_api = k8s.client.CoreV1Api(get_api_client())
+custom_api = k8s.client.CustomObjectsApi(get_api_client())
 
 STOWAWAY_LABELS = {
     "gefyra.dev/app": "stowaway",
@@ -47,14 +62,41 @@ STOWAWAY_LABELS = {
     "gefyra.dev/provider": "stowaway",
 }
 
-PROXY_RELOAD_COMMAND = [
-    "/bin/bash",
-    "generate-proxyroutes.sh",
-    "/stowaway/proxyroutes/",
-]
+PROXY_ROUTE_COMMAND = ["/bin/bash", "/app/proxyroute"]
+PEER_ADD_COMMAND = ["/bin/bash", "/app/add-peer"]
+PEER_REMOVE_COMMAND = ["/bin/bash", "/app/remove-peer"]
+
+CONFIGMAP_WRITE_RETRIES = 10
 
 WIREGUARD_CIDR_PATTERN = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\/\d{1,3}$")
 
+# the Stowaway Pod and configmaps, shared by all providers of this process
+stowaway_pods = Informer(
+    core_v1_api.list_namespaced_pod,
+    configuration.NAMESPACE,
+    label_selector=get_label_selector(STOWAWAY_LABELS),
+    enabled=configuration.INFORMER_ENABLED,
+    sync_timeout=configuration.INFORMER_SYNC_TIMEOUT,
+)
+stowaway_configmaps = Informer(
+    core_v1_api.list_namespaced_config_map,
+    configuration.NAMESPACE,
+    label_selector="gefyra.dev/app=stowaway",
+    enabled=configuration.INFORMER_ENABLED,
+    sync_timeout=configuration.INFORMER_SYNC_TIMEOUT,
+)
+
+# the proxy routes of the proxy route configmap by destination
+proxy_routes = ProxyRouteIndex()
+
+# the subnets of the peers, to reject overlapping subnets of new clients
+subnets = SubnetIndex()
+
+# parsed Wireguard configs by peer name; the providers are created for each handler
+# call, so the cache is kept on module level
+_peer_configs: Dict[str, Dict[str, str]] = {}
+_peer_configs_lock = threading.Lock()
+
 
 class Stowaway(AbstractGefyraConnectionProvider):
     provider_type = "stowaway"
@@ -63,19 +105,25 @@ class Stowaway(AbstractGefyraConnectionProvider):
         self,
         configuration: OperatorConfiguration,
         logger,
+        api_client: Optional[k8s.client.ApiClient] = None,
     ):
         self.configuration = configuration
         self.logger = logger
+        self.core_v1_api = (
+            k8s.client.CoreV1Api(api_client) if api_client else core_v1_api
+        )
 
     def install(self, config: Optional[Dict[Any, Any]] = None):
         handle_serviceaccount(self.logger, self.configuration)
         handle_proxyroute_configmap(self.logger, self.configuration)
         handle_config_configmap(self.logger, self.configuration)
+        handle_control_secret(self.logger, self.configuration)
         sts_stowaway = handle_stowaway_statefulset(
             self.logger, self.configuration, STOWAWAY_LABELS
         )
 
         handle_stowaway_nodeport_service(self.logger, self.configuration, sts_stowaway)
+        handle_stowaway_control_service(self.logger, self.configuration, sts_stowaway)
 
     def installed(self, config: Optional[Dict[Any, Any]] = None) -> bool:
         return all(
@@ -83,6 +131,7 @@ class Stowaway(AbstractGefyraConnectionProvider):
                 check_serviceaccount(self.logger),
                 check_proxyroute_configmap(self.logger),
                 check_config_configmap(self.logger),
+                check_control_secret(self.logger),
                 check_stowaway_statefulset(
                     self.logger, self.configuration, STOWAWAY_LABELS
                 ),
@@ -90,6 +139,10 @@ class Stowaway(AbstractGefyraConnectionProvider):
                     self.logger,
                     create_stowaway_statefulset(STOWAWAY_LABELS, self.configuration),
                 ),
+                check_stowaway_control_service(
+                    self.logger,
+                    create_stowaway_statefulset(STOWAWAY_LABELS, self.configuration),
+                ),
             ]
         )
 
@@ -100,6 +153,7 @@ class Stowaway(AbstractGefyraConnectionProvider):
             create_stowaway_statefulset(STOWAWAY_LABELS, self.configuration),
         )
         remove_stowaway_configmaps(self.logger, self.configuration)
+        remove_stowaway_secrets(self.logger, self.configuration)
 
     def ready(self) -> bool:
         pod = self._get_stowaway_pod()
@@ -113,44 +167,65 @@ class Stowaway(AbstractGefyraConnectionProvider):
             return False
 
     def add_peer(self, peer_id: str, parameters: Optional[Dict[Any, Any]] = None):
-        parameters = parameters or {}
-        self.logger.info(
-            f"Adding peer {peer_id} to stowaway with parameters: {parameters}"
-        )
+        self.add_peers({peer_id: parameters})
+
+    def add_peers(self, peers: Dict[str, Optional[Dict[Any, Any]]]):
+        peers = {peer_id: parameters or {} for peer_id, parameters in peers.items()}
+        self.logger.info(f"Adding peers to stowaway with parameters: {peers}")
+        self._forget_peer_configs(list(peers))
         try:
-            self._edit_peer_configmap(add=peer_id, subnet=parameters.get("subnet"))
-            self._restart_stowaway()
-            sleep(1)
+            self._edit_peer_configmap(
+                add={
+                    peer_id: parameters.get("subnet")
+                    for peer_id, parameters in peers.items()
+                }
+            )
+            if self.configuration.STOWAWAY_LIVE_PEERS:
+                self._apply_peers(
+                    {
+                        peer_id: parameters.get("subnet")
+                        for peer_id, parameters in peers.items()
+                    }
+                )
+            else:
+                self._restart_stowaway()
         except k8s.client.exceptions.ApiException as e:
-            self.logger.error(f"Error adding peer {peer_id} to stowaway: {e}")
+            self.logger.error(f"Error adding peers {list(peers)} to stowaway: {e}")
 
     def remove_peer(self, peer_id: str):
-        self.logger.info(f"Removing peer {peer_id} from stowaway")
+        return self.remove_peers([peer_id])[peer_id]
+
+    def remove_peers(self, peer_ids: List[str]) -> Dict[str, bool]:
+        self.logger.info(f"Removing peers {peer_ids} from stowaway")
+        self._forget_peer_configs(peer_ids)
         try:
-            self._edit_peer_configmap(remove=peer_id)
-            pod = self._get_stowaway_pod()
-            if pod is None:
-                raise RuntimeError("No Stowaway Pod found for peer removal")
-            exec_command_pod(
-                core_v1_api,
-                pod.metadata.name,
-                pod.metadata.namespace,
-                "stowaway",
-                ["rm", "-rf", f"/config/peer_{self._translate_peer_name(peer_id)}"],
-            )
-            self._restart_stowaway()
-            sleep(1)
-            return True
+            self._edit_peer_configmap(remove=peer_ids)
+            if self.configuration.STOWAWAY_LIVE_PEERS:
+                self._remove_live_peers(peer_ids)
+            else:
+                pod = self._get_stowaway_pod()
+                if pod is None:
+                    raise RuntimeError("No Stowaway Pod found for peer removal")
+                exec_command_pod(
+                    self.core_v1_api,
+                    pod.metadata.name,
+                    pod.metadata.namespace,
+                    "stowaway",
+                    ["rm", "-rf"]
+                    + [
+                        f"/config/peer_{self._translate_peer_name(peer_id)}"
+                        for peer_id in peer_ids
+                    ],
+                )
+                self._restart_stowaway()
+            return {peer_id: True for peer_id in peer_ids}
         except k8s.client.exceptions.ApiException as e:
-            self.logger.error(f"Error removing peer {peer_id} from stowaway: {e}")
-            return False
+            self.logger.error(f"Error removing peers {peer_ids} from stowaway: {e}")
+            return {peer_id: False for peer_id in peer_ids}
 
     def peer_exists(self, peer_id: str) -> bool:
-        _config = create_stowaway_configmap()
         try:
-            configmap = core_v1_api.read_namespaced_config_map(
-                _config.metadata.name, _config.metadata.namespace
-            )
+            configmap = self._read_configmap(self.configuration.STOWAWAY_CONFIGMAPNAME)
             if self._translate_peer_name(peer_id) in configmap.data["PEERS"].split(","):
                 return True
             else:
@@ -160,8 +235,16 @@ class Stowaway(AbstractGefyraConnectionProvider):
             return False
 
     def get_peer_config(self, peer_id: str) -> dict[str, str]:
+        peer = self._translate_peer_name(peer_id)
+        with _peer_configs_lock:
+            cached = _peer_configs.get(peer)
+        if cached is not None:
+            return dict(cached)
         if self.peer_exists(peer_id):
-            return self._get_wireguard_connection_details(peer_id)
+            peer_config = self._get_wireguard_connection_details(peer_id)
+            with _peer_configs_lock:
+                _peer_configs[peer] = peer_config
+            return dict(peer_config)
         else:
             raise RuntimeError(f"Peer {peer_id} does not exist")
 
@@ -174,7 +257,9 @@ class Stowaway(AbstractGefyraConnectionProvider):
     ):
         # create service with random port that is not taken
         stowaway_port = self._edit_proxyroutes_configmap(
-            peer_id=peer_id, add=f"{destination_ip}:{destination_port}"
+            peer_id=peer_id,
+            destination_ip=destination_ip,
+            destination_port=destination_port,
         )
         # create a stowaway proxy k8s service (target of reverse proxy in bridge operations)
         svc = handle_stowaway_proxy_service(
@@ -184,46 +269,38 @@ class Stowaway(AbstractGefyraConnectionProvider):
             stowaway_port,
             peer_id,
         )
-        stowaway_pod = self._get_stowaway_pod()
-        if stowaway_pod is None:
-            raise RuntimeError("No Stowaway Pod found for destination addition")
-        self._notify_stowaway_pod(stowaway_pod.metadata.name)
-        exec_command_pod(
-            core_v1_api,
-            stowaway_pod.metadata.name,
-            self.configuration.NAMESPACE,
-            "stowaway",
-            PROXY_RELOAD_COMMAND,
+        self._apply_proxy_route(
+            ["add", str(stowaway_port), f"{destination_ip}:{destination_port}"]
         )
         return f"{svc.metadata.name}.{self.configuration.NAMESPACE}.svc.cluster.local:{stowaway_port}"
 
     def get_destination(
         self, peer_id: str, destination_ip: str, destination_port: int
     ) -> str:
-        svcs = core_v1_api.list_namespaced_service(
-            namespace=self.configuration.NAMESPACE,
-            label_selector=get_label_selector(
-                {
-                    "gefyra.dev/app": "stowaway",
-                    "gefyra.dev/role": "proxy",
-                    "gefyra.dev/client-id": peer_id,
-                }
-            ),
+        stowaway_port = self._get_proxy_routes().get(
+            peer_id, destination_ip, destination_port
         )
-        if len(svcs.items) == 0:
+        if stowaway_port is None:
             raise RuntimeError(
                 f"Error looking up destination {destination_ip}:{destination_port} for"
-                f" client {peer_id}: no proxy service found"
+                f" client {peer_id}: no proxy route found"
             )
-        _, stowaway_port = svcs.items[0].metadata.name.rsplit("-", 1)
-        return f"{svcs.items[0].metadata.name}.{self.configuration.NAMESPACE}.svc.cluster.local:{stowaway_port}"
+        proxy_svc = create_stowaway_proxy_service(
+            create_stowaway_statefulset(STOWAWAY_LABELS, self.configuration),
+            stowaway_port,
+            client_id=peer_id,
+        )
+        return f"{proxy_svc.metadata.name}.{self.configuration.NAMESPACE}.svc.cluster.local:{stowaway_port}"
 
     def remove_destination(
         self, peer_id: str, destination_ip: str, destination_port: int
     ):
         # update configmap and return the port that was removed
         stowaway_port = self._edit_proxyroutes_configmap(
-            peer_id=peer_id, remove=f"{destination_ip}:{destination_port}"
+            peer_id=peer_id,
+            destination_ip=destination_ip,
+            destination_port=destination_port,
+            remove=True,
         )
         proxy_svc = create_stowaway_proxy_service(
             create_stowaway_statefulset(STOWAWAY_LABELS, self.configuration),
@@ -231,7 +308,7 @@ class Stowaway(AbstractGefyraConnectionProvider):
             client_id=peer_id,
         )
         try:
-            core_v1_api.delete_namespaced_service(
+            self.core_v1_api.delete_namespaced_service(
                 name=proxy_svc.metadata.name, namespace=proxy_svc.metadata.namespace
             )
         except k8s.client.exceptions.ApiException as e:
@@ -239,42 +316,27 @@ class Stowaway(AbstractGefyraConnectionProvider):
                 self.logger.error(
                     f"Error removing proxy service {proxy_svc.metadata.name}: {e}"
                 )
-        stowaway_pod = self._get_stowaway_pod()
-        if stowaway_pod is None:
-            raise RuntimeError("No Stowaway Pod found for destination removal")
-        self._notify_stowaway_pod(stowaway_pod.metadata.name)
+        if not stowaway_port:
+            return
         retries = 0
         while retries < 5:
             try:
-                exec_command_pod(
-                    core_v1_api,
-                    stowaway_pod.metadata.name,
-                    self.configuration.NAMESPACE,
-                    "stowaway",
-                    PROXY_RELOAD_COMMAND,
-                )
-                self.logger.info("Successfully reloaded proxy services.")
+                self._apply_proxy_route(["remove", str(stowaway_port)])
                 return
-            except k8s.client.exceptions.ApiException:
+            except (k8s.client.exceptions.ApiException, StowawayControlError):
                 retries += 1
                 sleep(1)
                 continue
-        self.logger.error("Could not reload proxy services.")
+        self.logger.error("Could not remove proxy route.")
 
     def destination_exists(
         self, peer_id: str, destination_ip: str, destination_port: int
     ) -> bool:
-        _config = create_stowaway_proxyroute_configmap()
         try:
-            configmap = core_v1_api.read_namespaced_config_map(
-                _config.metadata.name, _config.metadata.namespace
+            return (
+                self._get_proxy_routes().get(peer_id, destination_ip, destination_port)
+                is not None
             )
-            if configmap.data is None:
-                return False
-            for k, v in configmap.data.items():
-                if f"{destination_ip}:{destination_port}" in v:
-                    return True
-            return False
         except k8s.client.exceptions.ApiException as e:
             self.logger.error(
                 f"Error looking up destination {destination_ip}:{destination_port} for"
@@ -298,163 +360,314 @@ class Stowaway(AbstractGefyraConnectionProvider):
                     )
 
     def _subnet_taken(self, subnet: str) -> bool:
-        _config = create_stowaway_configmap()
-        configmap = core_v1_api.read_namespaced_config_map(
-            _config.metadata.name, _config.metadata.namespace
-        )
-        for k, v in configmap.data.items():
-            if k.startswith("SERVER_ALLOWEDIPS_PEER_"):
-                if v.split("/", 1)[0] == subnet.split("/", 1)[0]:
-                    return True
-            else:
-                continue
-        return False
+        """
+        Check if the subnet overlaps with a subnet of any peer, the admission requests
+        are answered from the index of the cached peer configmap
+        """
+        try:
+            return self._get_subnets().overlaps(subnet)
+        except ValueError as e:
+            raise kopf.AdmissionError(
+                f"The Wireguard subnet '{subnet}' is invalid: {e}"
+            )
 
+    @STOWAWAY_RELOAD_SECONDS.labels(operation="add_peers").time()
+    def _apply_peers(self, peers: Dict[str, Optional[str]]) -> None:
+        """
+        Generate the keys of the given peers (mapped to their subnet) and add them to
+        the running Wireguard interface in one go, other peers are not affected by this
+        """
+        try:
+            output = stowaway_control.add_peers(
+                {
+                    self._translate_peer_name(peer_id): subnet
+                    for peer_id, subnet in peers.items()
+                }
+            )
+        except StowawayControlUnavailable as e:
+            self.logger.info(f"{e}, adding peers via exec")
+            pod = self._get_stowaway_pod()
+            if pod is None:
+                raise RuntimeError("No Stowaway Pod found for peer addition")
+            command = PEER_ADD_COMMAND + [
+                (
+                    f"{self._translate_peer_name(peer_id)}={subnet}"
+                    if subnet
+                    else self._translate_peer_name(peer_id)
+                )
+                for peer_id, subnet in peers.items()
+            ]
+            output = exec_command_pod(
+                self.core_v1_api,
+                pod.metadata.name,
+                pod.metadata.namespace,
+                "stowaway",
+                command,
+            )
+        self.logger.info(output)
+
+    @STOWAWAY_RELOAD_SECONDS.labels(operation="remove_peers").time()
+    def _remove_live_peers(self, peer_ids: List[str]) -> None:
+        """
+        Remove the given peers from the running Wireguard interface and delete their
+        configs, other peers are not affected by this
+        """
+        peers = [self._translate_peer_name(peer_id) for peer_id in peer_ids]
+        try:
+            output = stowaway_control.remove_peers(peers)
+        except StowawayControlUnavailable as e:
+            self.logger.info(f"{e}, removing peers via exec")
+            pod = self._get_stowaway_pod()
+            if pod is None:
+                raise RuntimeError("No Stowaway Pod found for peer removal")
+            output = exec_command_pod(
+                self.core_v1_api,
+                pod.metadata.name,
+                pod.metadata.namespace,
+                "stowaway",
+                PEER_REMOVE_COMMAND + peers,
+            )
+        self.logger.info(output)
+
+    @STOWAWAY_RELOAD_SECONDS.labels(operation="restart").time()
     def _restart_stowaway(self) -> None:
         pod = self._get_stowaway_pod()
         if pod is None:
             raise RuntimeError("No Stowaway Pod found for restart")
-        core_v1_api.delete_namespaced_pod(
+        self.core_v1_api.delete_namespaced_pod(
             pod.metadata.name,
             pod.metadata.namespace,
             grace_period_seconds=0,
         )
-        # busy wait
-        _i = 0
-        while (
-            not self.ready()
-            and _i < self.configuration.CONNECTION_PROVIDER_STARTUP_TIMEOUT
-        ):
-            sleep(1)
-            _i += 1
+        # the replacement Pod is ready once WireGuard is up, see its readiness probe
+        try:
+            wait_for_pod(
+                pod.metadata.namespace,
+                lambda new_pod: new_pod.metadata.uid != pod.metadata.uid
+                and pod_ready(new_pod),
+                label_selector=get_label_selector(STOWAWAY_LABELS),
+                timeout=self.configuration.CONNECTION_PROVIDER_STARTUP_TIMEOUT,
+                reason="stowaway",
+            )
+        except PodWaitTimeout as e:
+            self.logger.error(e)
 
     def _get_stowaway_pod(self) -> Optional[k8s.client.V1Pod]:
-        stowaway_pod = core_v1_api.list_namespaced_pod(
-            self.configuration.NAMESPACE,
-            label_selector=get_label_selector(STOWAWAY_LABELS),
-        )
-        if stowaway_pod.items and len(stowaway_pod.items) > 0:
-            return stowaway_pod.items[0]
+        try:
+            pods = stowaway_pods.list()
+        except InformerNotSynced:
+            pods = self.core_v1_api.list_namespaced_pod(
+                self.configuration.NAMESPACE,
+                label_selector=get_label_selector(STOWAWAY_LABELS),
+            ).items
+        # prefer a running Pod over one that is being replaced
+        pods = sorted(pods, key=lambda pod: pod.metadata.deletion_timestamp is not None)
+        if pods:
+            return pods[0]
         else:
             return None
 
-    def _notify_stowaway_pod(self, pod_name: str):
-        self.logger.info("Notify stowaway")
+    def _read_configmap(self, name: str, fresh: bool = False) -> k8s.client.V1ConfigMap:
+        """
+        Read a Stowaway configmap from the informer cache
+        :param fresh: read the configmap from the API server and update the cache
+        """
+        if not fresh:
+            try:
+                configmap = stowaway_configmaps.get(name)
+                if configmap is not None:
+                    return configmap
+            except InformerNotSynced:
+                pass
+        # the configmap may have been created right before the watch event arrived
+        configmap = self.core_v1_api.read_namespaced_config_map(
+            name, self.configuration.NAMESPACE
+        )
+        stowaway_configmaps.update(configmap)
+        return configmap
+
+    def _apply_proxy_route(self, arguments: List[str]) -> float:
+        """
+        Add or remove a single proxy route in the running Stowaway; nginx reloads are
+        debounced by Stowaway itself
+        :param arguments: either ["add", <proxy port>, <ip:port>] or ["remove", <proxy port>]
+        :return: the duration of the apply in seconds
+        """
+        start = perf_counter()
         try:
-            core_v1_api.patch_namespaced_pod(
-                name=pod_name,
-                body={
-                    "metadata": {
-                        "annotations": {"operator": f"update-notification-{_get_now()}"}
-                    }
-                },
-                namespace=self.configuration.NAMESPACE,
+            if arguments[0] == "add":
+                output = stowaway_control.add_route(int(arguments[1]), arguments[2])
+            else:
+                output = stowaway_control.remove_route(int(arguments[1]))
+        except StowawayControlUnavailable as e:
+            self.logger.info(f"{e}, applying proxy route via exec")
+            pod = self._get_stowaway_pod()
+            if pod is None:
+                raise RuntimeError("No Stowaway Pod found for proxy route change")
+            output = exec_command_pod(
+                self.core_v1_api,
+                pod.metadata.name,
+                self.configuration.NAMESPACE,
+                "stowaway",
+                PROXY_ROUTE_COMMAND + arguments,
             )
-        except k8s.client.exceptions.ApiException as e:
-            self.logger.exception(e)
-        sleep(1)
+        duration = perf_counter() - start
+        STOWAWAY_RELOAD_SECONDS.labels(operation="proxy_route").observe(duration)
+        self.logger.info(
+            f"Applied proxy route change '{' '.join(arguments)}' in {duration:.3f}s: "
+            f"{output.strip()}"
+        )
+        return duration
 
     def _edit_peer_configmap(
         self,
-        add: Optional[str] = None,
-        remove: Optional[str] = None,
-        subnet: Optional[str] = None,
+        add: Optional[Dict[str, Optional[str]]] = None,
+        remove: Optional[List[str]] = None,
     ) -> None:
-        _config = create_stowaway_configmap()
-        configmap = core_v1_api.read_namespaced_config_map(
-            _config.metadata.name, _config.metadata.namespace
-        )
-        if add:
-            add = self._translate_peer_name(add)
-        if remove:
-            remove = self._translate_peer_name(remove)
-        peers = configmap.data["PEERS"].split(",")
-        if add and add not in peers:
-            peers = [add] + peers
-            data = {"PEERS": ",".join(peers)}
-            if subnet:
-                data[f"SERVER_ALLOWEDIPS_PEER_{add}"] = subnet
-            core_v1_api.patch_namespaced_config_map(
-                name=configmap.metadata.name,
-                namespace=configmap.metadata.namespace,
-                body={"data": data},
+        """
+        Add peers (mapped to their subnet) and remove peers with a single patch of the
+        peer configmap
+        """
+        for attempt in range(CONFIGMAP_WRITE_RETRIES):
+            configmap = self._read_configmap(
+                self.configuration.STOWAWAY_CONFIGMAPNAME, fresh=attempt > 0
             )
-        if remove and remove in peers:
-            peers.remove(remove)
+            peers = configmap.data["PEERS"].split(",")
+            data: Dict[str, Optional[str]] = {}
+            for peer_id, subnet in (add or {}).items():
+                peer = self._translate_peer_name(peer_id)
+                if peer not in peers:
+                    peers = [peer] + peers
+                    if subnet:
+                        data[f"SERVER_ALLOWEDIPS_PEER_{peer}"] = subnet
+            for peer_id in remove or []:
+                peer = self._translate_peer_name(peer_id)
+                if peer in peers:
+                    peers.remove(peer)
+                    if f"SERVER_ALLOWEDIPS_PEER_{peer}" in configmap.data:
+                        # a null value removes the key from the configmap
+                        data[f"SERVER_ALLOWEDIPS_PEER_{peer}"] = None
+            if not data and ",".join(peers) == configmap.data["PEERS"]:
+                return
+            data["PEERS"] = ",".join(peers)
             try:
-                del configmap.data[f"SERVER_ALLOWEDIPS_PEER_{remove}"]
-            except KeyError:
-                pass
-            configmap.data["PEERS"] = ",".join(peers)
-            core_v1_api.replace_namespaced_config_map(
-                name=configmap.metadata.name,
-                namespace=configmap.metadata.namespace,
-                body=configmap,
-            )
+                # the resourceVersion of the cached configmap makes this patch fail if
+                # the cache is outdated
+                patched = self.core_v1_api.patch_namespaced_config_map(
+                    name=configmap.metadata.name,
+                    namespace=configmap.metadata.namespace,
+                    body={
+                        "metadata": {
+                            "resourceVersion": configmap.metadata.resource_version
+                        },
+                        "data": data,
+                    },
+                )
+                stowaway_configmaps.update(patched)
+                return
+            except k8s.client.exceptions.ApiException as e:
+                if e.status != 409:
+                    raise e
+                self.logger.info("Peers have been changed concurrently, retrying")
+        raise RuntimeError(
+            f"Could not update peers after {CONFIGMAP_WRITE_RETRIES} attempts"
+        )
 
     def _translate_peer_name(self, peer_id: str) -> str:
         return re.sub(f"[^{string.printable[:62]}]", "000", peer_id)
 
-    def _get_free_proxyroute_port(self) -> int:
-        _config = create_stowaway_proxyroute_configmap()
-        configmap = core_v1_api.read_namespaced_config_map(
-            _config.metadata.name, _config.metadata.namespace
+    def _get_proxy_port_allocator(
+        self, configmap: k8s.client.V1ConfigMap
+    ) -> ProxyPortAllocator:
+        annotations = configmap.metadata.annotations or {}
+        if bitmap := annotations.get(PROXY_PORTS_ANNOTATION):
+            return ProxyPortAllocator.from_annotation(bitmap)
+        # the values are stored as "to_ip:to_port,proxy_port"
+        return ProxyPortAllocator.from_ports(
+            int(v.split(",")[1]) for v in (configmap.data or {}).values()
         )
-        routes = configmap.data
-        # the values ar stored as "to_ip:to_port,proxy_port"
-        if routes:
-            taken_ports = [int(v.split(",")[1]) for v in routes.values()]
-        else:
-            taken_ports = []
-        for port in range(10000, 60000):
-            if port not in taken_ports:
-                return port
-        raise RuntimeError("No free port found for proxy route")
+
+    def _get_subnets(self) -> SubnetIndex:
+        subnets.refresh(self._read_configmap(self.configuration.STOWAWAY_CONFIGMAPNAME))
+        return subnets
+
+    def _get_proxy_routes(self) -> ProxyRouteIndex:
+        proxy_routes.refresh(
+            self._read_configmap(self.configuration.STOWAWAY_PROXYROUTE_CONFIGMAPNAME)
+        )
+        return proxy_routes
 
     def _edit_proxyroutes_configmap(
         self,
         peer_id: str,
-        add: Optional[str] = None,
-        remove: Optional[str] = None,
+        destination_ip: str,
+        destination_port: int,
+        remove: bool = False,
     ) -> int:
-        _config = create_stowaway_proxyroute_configmap()
-        configmap = core_v1_api.read_namespaced_config_map(
-            _config.metadata.name, _config.metadata.namespace
-        )
-        routes = configmap.data
-        if routes is None:
-            routes = {}
-        if add:
-            stowaway_port = self._get_free_proxyroute_port()
-            routes[
-                f"{peer_id}-{''.join(random.choices(string.ascii_lowercase, k=10))}"
-            ] = f"{add},{stowaway_port}"
-            core_v1_api.patch_namespaced_config_map(
-                name=configmap.metadata.name,
-                namespace=configmap.metadata.namespace,
-                body={"data": routes},
+        """
+        Add or remove the proxy route of a peer's destination
+        :return: the proxy port of the route, 0 if a route to remove was not found
+        """
+        for attempt in range(CONFIGMAP_WRITE_RETRIES):
+            configmap = self._read_configmap(
+                self.configuration.STOWAWAY_PROXYROUTE_CONFIGMAPNAME, fresh=attempt > 0
             )
-            return int(stowaway_port)
-        elif remove:
-            to_be_deleted = None
-            stowaway_port = 0
-            for k, v in routes.items():
-                if v.split(",")[0] == remove:
-                    to_be_deleted = k
-                    stowaway_port = v.split(",")[1]
-            if to_be_deleted:
-                del routes[to_be_deleted]
-                configmap.data = routes
-                core_v1_api.replace_namespaced_config_map(
+            routes = configmap.data or {}
+            index = ProxyRouteIndex.from_configmap(configmap)
+            allocator = self._get_proxy_port_allocator(configmap)
+            key = index.get_key(peer_id, destination_ip, destination_port)
+            if not remove:
+                if key is not None:
+                    # the route exists already
+                    return int(routes[key].split(",")[1])
+                stowaway_port = allocator.allocate()
+                routes[
+                    f"{peer_id}-{''.join(random.choices(string.ascii_lowercase, k=10))}"
+                ] = f"{destination_ip}:{destination_port},{stowaway_port}"
+            else:
+                if key is None:
+                    return 0
+                stowaway_port = int(routes.pop(key).split(",")[1])
+                allocator.release(stowaway_port)
+            configmap.data = routes
+            configmap.metadata.annotations = {
+                **(configmap.metadata.annotations or {}),
+                PROXY_PORTS_ANNOTATION: allocator.to_annotation(),
+            }
+            try:
+                # the resourceVersion of the read configmap makes this update fail if
+                # another operation changed the routes in the meantime
+                replaced = self.core_v1_api.replace_namespaced_config_map(
                     name=configmap.metadata.name,
                     namespace=configmap.metadata.namespace,
                     body=configmap,
                 )
-            return int(stowaway_port)
-        else:
-            raise ValueError("Either the add or remove parameter must be set")
+                stowaway_configmaps.update(replaced)
+                proxy_routes.refresh(replaced)
+                return stowaway_port
+            except k8s.client.exceptions.ApiException as e:
+                if e.status != 409:
+                    raise e
+                self.logger.info(
+                    "Proxy routes have been changed concurrently, retrying"
+                )
+        raise RuntimeError(
+            f"Could not update proxy routes after {CONFIGMAP_WRITE_RETRIES} attempts"
+        )
+
+    def _forget_peer_configs(self, peer_ids: List[str]) -> None:
+        with _peer_configs_lock:
+            for peer_id in peer_ids:
+                _peer_configs.pop(self._translate_peer_name(peer_id), None)
 
     def _get_wireguard_connection_details(self, peer_id: str) -> dict[str, str]:
+        try:
+            peer_connection_details_raw = stowaway_control.get_peer_config(
+                self._translate_peer_name(peer_id)
+            )
+            return self._read_wireguard_config(peer_connection_details_raw)
+        except StowawayControlUnavailable as e:
+            self.logger.info(f"{e}, copying peer {peer_id} config via exec")
         pod = self._get_stowaway_pod()
         if pod is None:
             raise RuntimeError("No Stowaway Pod found for peer lookup")
@@ -467,18 +680,13 @@ class Stowaway(AbstractGefyraConnectionProvider):
             f"Copy peer {peer_id} connection details from Pod "
             f"{pod.metadata.name}:{peer_config_file}"
         )
-        tmpfile_location = f"/tmp/peer_{self._translate_peer_name(peer_id)}.conf"
-        stream_copy_from_pod(
+        # Wireguard config is unfortunately no valid TOML
+        peer_connection_details_raw = stream_read_from_pod(
+            self.core_v1_api,
             pod.metadata.name,
             self.configuration.NAMESPACE,
             peer_config_file,
-            tmpfile_location,
-        )
-
-        # Wireguard config is unfortunately no valid TOML
-        with open(tmpfile_location, "r") as f:
-            peer_connection_details_raw = f.read()
-        os.remove(tmpfile_location)
+        ).decode("utf-8")
 
         peer_connection_details = self._read_wireguard_config(
             peer_connection_details_raw
@@ -517,10 +725,12 @@ class StowawayBuilder:
         self,
         configuration: OperatorConfiguration,
         logger,
+        api_client: Optional[k8s.client.ApiClient] = None,
         **_ignored,
     ):
         instance = Stowaway(
             configuration=configuration,
             logger=logger,
+            api_client=api_client,
         )
         return instance
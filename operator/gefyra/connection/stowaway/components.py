@@ -8,10 +8,13 @@ from gefyra.connection.stowaway.resources import (
     create_stowaway_statefulset,
     create_stowaway_serviceaccount,
     create_stowaway_nodeport_service,
+    create_stowaway_control_service,
+    create_stowaway_control_secret,
 )
+from gefyra.kubeclient import get_api_client
 
-core_v1_api = k8s.client.CoreV1Api()
-app = k8s.client.AppsV1Api()
+core_v1_api = k8s.client.CoreV1Api(get_api_client())
+app = k8s.client.AppsV1Api(get_api_client())
 
 
 def handle_serviceaccount(logger, configuration: OperatorConfiguration):
@@ -222,6 +225,80 @@ def check_stowaway_nodeport_service(
             raise e
 
 
+def handle_control_secret(logger, configuration: OperatorConfiguration):
+    secret = create_stowaway_control_secret()
+    try:
+        core_v1_api.create_namespaced_secret(
+            body=secret, namespace=configuration.NAMESPACE
+        )
+        logger.info("Stowaway control secret created")
+    except k8s.client.exceptions.ApiException as e:
+        # keep the token of an existing secret, Stowaway is already using it
+        if e.status != 409:
+            raise e
+
+
+def check_control_secret(logger):
+    secret = create_stowaway_control_secret()
+    try:
+        core_v1_api.read_namespaced_secret(
+            secret.metadata.name, secret.metadata.namespace
+        )
+        return True
+    except k8s.client.exceptions.ApiException as e:
+        if e.status == 404:
+            logger.warning("Stowaway control secret does not exist")
+            return False
+        else:
+            raise e
+
+
+def handle_stowaway_control_service(
+    logger,
+    configuration: OperatorConfiguration,
+    stowaway_sts: k8s.client.V1StatefulSet,
+):
+    control_service_stowaway = create_stowaway_control_service(stowaway_sts)
+    try:
+        core_v1_api.create_namespaced_service(
+            body=control_service_stowaway, namespace=configuration.NAMESPACE
+        )
+        logger.info("Stowaway control service created")
+    except k8s.client.exceptions.ApiException as e:
+        if e.status == 409:
+            logger.warning(
+                "Stowaway control service already available, now patching it with"
+                " current configuration"
+            )
+            core_v1_api.patch_namespaced_service(
+                name=control_service_stowaway.metadata.name,
+                body=control_service_stowaway,
+                namespace=configuration.NAMESPACE,
+            )
+            logger.info("Stowaway control service patched")
+        else:
+            raise e
+
+
+def check_stowaway_control_service(
+    logger,
+    stowaway_sts: k8s.client.V1StatefulSet,
+):
+    control_service_stowaway = create_stowaway_control_service(stowaway_sts)
+    try:
+        core_v1_api.read_namespaced_service(
+            control_service_stowaway.metadata.name,
+            control_service_stowaway.metadata.namespace,
+        )
+        return True
+    except k8s.client.exceptions.ApiException as e:
+        if e.status == 404:
+            logger.warning("Stowaway control service does not exist")
+            return False
+        else:
+            raise e
+
+
 def remove_stowaway_services(logger, configuration: OperatorConfiguration):
     logger.info("Removing Stowaway services")
     try:
@@ -262,6 +339,21 @@ def remove_stowaway_configmaps(logger, configuration: OperatorConfiguration):
         logger.error("Error removing Stowaway configmap: " + str(e))
 
 
+def remove_stowaway_secrets(logger, configuration: OperatorConfiguration):
+    logger.info("Removing Stowaway secrets")
+    try:
+        secrets = core_v1_api.list_namespaced_secret(
+            namespace=configuration.NAMESPACE, label_selector="gefyra.dev/app=stowaway"
+        )
+        for secret in secrets.items:
+            core_v1_api.delete_namespaced_secret(
+                name=secret.metadata.name,
+                namespace=secret.metadata.namespace,
+            )
+    except k8s.client.exceptions.ApiException as e:
+        logger.error("Error removing Stowaway secret: " + str(e))
+
+
 def handle_stowaway_proxy_service(
     logger,
     configuration: OperatorConfiguration,
@@ -0,0 +1,143 @@
+import base64
+import json
+import threading
+from time import monotonic
+from typing import Any, Dict, List, Optional
+
+import kubernetes as k8s
+import urllib3
+
+from gefyra.configuration import OperatorConfiguration, configuration
+from gefyra.connection.stowaway.resources.secrets import CONTROL_TOKEN_KEY
+from gefyra.kubeclient import get_api_client
+
+# after the control API could not be reached, use exec for this many seconds
+CONTROL_RETRY_INTERVAL = 30
+
+core_v1_api = k8s.client.CoreV1Api(get_api_client())
+
+
+class StowawayControlUnavailable(Exception):
+    """
+    The control API of Stowaway cannot be used; the operation has not been applied and
+    the caller can fall back to exec
+    """
+
+
+class StowawayControlError(RuntimeError):
+    """
+    The control API of Stowaway was reached, but the operation failed
+    """
+
+
+class StowawayControlClient:
+    """
+    Client for the control API served by Stowaway; all requests share one pool of
+    keep-alive connections
+    """
+
+    def __init__(self, configuration: OperatorConfiguration):
+        self.configuration = configuration
+        self.base_url = (
+            f"http://{configuration.STOWAWAY_CONTROL_SERVICENAME}."
+            f"{configuration.NAMESPACE}.svc.cluster.local:"
+            f"{configuration.STOWAWAY_CONTROL_PORT}"
+        )
+        self._pool = urllib3.PoolManager(
+            num_pools=1,
+            maxsize=configuration.STOWAWAY_CONTROL_POOLSIZE,
+            retries=False,
+            timeout=urllib3.Timeout(
+                connect=1.0, read=configuration.STOWAWAY_CONTROL_TIMEOUT
+            ),
+        )
+        self._lock = threading.Lock()
+        self._token: Optional[str] = None
+        self._unavailable_until = 0.0
+
+    def get_peer_config(self, peer: str) -> str:
+        return self._request("GET", f"/peers/{peer}/config")
+
+    def add_peers(self, peers: Dict[str, Optional[str]]) -> str:
+        return self._output(self._request("POST", "/peers", {"peers": peers}))
+
+    def remove_peers(self, peers: List[str]) -> str:
+        return self._output(self._request("POST", "/peers/remove", {"peers": peers}))
+
+    def add_route(self, port: int, upstream: str) -> str:
+        return self._output(
+            self._request("POST", "/routes", {"port": port, "upstream": upstream})
+        )
+
+    def remove_route(self, port: int) -> str:
+        return self._output(self._request("DELETE", f"/routes/{port}"))
+
+    def reload(self) -> str:
+        return self._output(self._request("POST", "/reload"))
+
+    def _output(self, response: str) -> str:
+        return json.loads(response).get("output", "")
+
+    def _get_token(self) -> str:
+        with self._lock:
+            if self._token is None:
+                try:
+                    secret = core_v1_api.read_namespaced_secret(
+                        self.configuration.STOWAWAY_CONTROL_SECRETNAME,
+                        self.configuration.NAMESPACE,
+                    )
+                except k8s.client.exceptions.ApiException as e:
+                    if e.status == 404:
+                        raise StowawayControlUnavailable("No control API token found")
+                    raise e
+                # the data of secrets is base64 encoded
+                token = (secret.data or {}).get(CONTROL_TOKEN_KEY)
+                if not token:
+                    raise StowawayControlUnavailable("No control API token found")
+                self._token = base64.b64decode(token).decode("utf-8")
+            return self._token
+
+    def _request(
+        self, method: str, url: str, body: Optional[Dict[str, Any]] = None
+    ) -> str:
+        if not self.configuration.STOWAWAY_CONTROL_API:
+            raise StowawayControlUnavailable("The control API is disabled")
+        if monotonic() < self._unavailable_until:
+            raise StowawayControlUnavailable("The control API was not reachable")
+        headers = {"Authorization": f"Bearer {self._get_token()}"}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        try:
+            response = self._pool.request(
+                method,
+                f"{self.base_url}{url}",
+                body=json.dumps(body) if body is not None else None,
+                headers=headers,
+            )
+        except (
+            urllib3.exceptions.NewConnectionError,
+            urllib3.exceptions.ConnectTimeoutError,
+        ) as e:
+            # the request did not reach Stowaway, so it is safe to repeat it via exec
+            self._unavailable_until = monotonic() + CONTROL_RETRY_INTERVAL
+            raise StowawayControlUnavailable(f"The control API is not reachable: {e}")
+        except urllib3.exceptions.HTTPError as e:
+            raise StowawayControlError(
+                f"Control API request {method} {url} failed: {e}"
+            )
+        data = response.data.decode("utf-8")
+        if response.status == 401:
+            # the token may have been renewed since it was read
+            with self._lock:
+                self._token = None
+            self._unavailable_until = monotonic() + CONTROL_RETRY_INTERVAL
+            raise StowawayControlUnavailable("The control API rejected the token")
+        if response.status >= 400:
+            raise StowawayControlError(
+                f"Control API request {method} {url} failed with status"
+                f" {response.status}: {data}"
+            )
+        return data
+
+
+stowaway_control = StowawayControlClient(configuration)
@@ -0,0 +1,106 @@
+import base64
+import re
+import zlib
+from typing import Iterable, Optional
+
+PROXY_PORT_RANGE_START = 10000
+PROXY_PORT_RANGE_END = 60000
+# the allocation state is stored alongside the proxy routes, so both are written in one
+# update which is guarded by the configmap's resourceVersion
+PROXY_PORTS_ANNOTATION = "gefyra.dev/proxy-ports"
+
+_NOT_FULL = re.compile(b"[^\xff]")
+
+
+class ProxyPortAllocator:
+    """
+    A bitmap of the proxy route ports of Stowaway; one bit per port of the port range
+    """
+
+    def __init__(
+        self,
+        start: int = PROXY_PORT_RANGE_START,
+        end: int = PROXY_PORT_RANGE_END,
+        bitmap: Optional[bytes] = None,
+    ):
+        self.start = start
+        self.end = end
+        size = (end - start + 7) // 8
+        self._bitmap = bytearray(bitmap or b"")[:size].ljust(size, b"\x00")
+        # mark the padding bits beyond the end of the range as taken
+        for port in range(end, start + size * 8):
+            self._set(port)
+        # all bytes before the cursor are fully allocated
+        self._cursor = self._find_not_full(0)
+
+    @classmethod
+    def from_ports(
+        cls,
+        ports: Iterable[int],
+        start: int = PROXY_PORT_RANGE_START,
+        end: int = PROXY_PORT_RANGE_END,
+    ) -> "ProxyPortAllocator":
+        allocator = cls(start, end)
+        for port in ports:
+            allocator.take(port)
+        return allocator
+
+    @classmethod
+    def from_annotation(
+        cls,
+        value: str,
+        start: int = PROXY_PORT_RANGE_START,
+        end: int = PROXY_PORT_RANGE_END,
+    ) -> "ProxyPortAllocator":
+        return cls(start, end, zlib.decompress(base64.b64decode(value)))
+
+    def to_annotation(self) -> str:
+        return base64.b64encode(zlib.compress(bytes(self._bitmap))).decode("ascii")
+
+    def allocate(self) -> int:
+        """
+        Take the lowest free port of the range
+        :return: the allocated port
+        """
+        index = self._cursor
+        if index >= len(self._bitmap):
+            raise RuntimeError("No free port found for proxy route")
+        byte = self._bitmap[index]
+        # isolate the lowest zero bit of this byte
+        bit = ((~byte) & (byte + 1)).bit_length() - 1
+        port = self.start + index * 8 + bit
+        self._set(port)
+        if self._bitmap[index] == 0xFF:
+            self._cursor = self._find_not_full(index)
+        return port
+
+    def take(self, port: int) -> None:
+        self._check(port)
+        self._set(port)
+        if self._cursor < len(self._bitmap) and self._bitmap[self._cursor] == 0xFF:
+            self._cursor = self._find_not_full(self._cursor)
+
+    def release(self, port: int) -> None:
+        self._check(port)
+        offset = port - self.start
+        self._bitmap[offset // 8] &= ~(1 << (offset % 8)) & 0xFF
+        self._cursor = min(self._cursor, offset // 8)
+
+    def is_taken(self, port: int) -> bool:
+        self._check(port)
+        offset = port - self.start
+        return bool(self._bitmap[offset // 8] & (1 << (offset % 8)))
+
+    def _set(self, port: int) -> None:
+        offset = port - self.start
+        self._bitmap[offset // 8] |= 1 << (offset % 8)
+
+    def _check(self, port: int) -> None:
+        if not self.start <= port < self.end:
+            raise ValueError(
+                f"Port {port} is not in proxy port range {self.start}-{self.end}"
+            )
+
+    def _find_not_full(self, index: int) -> int:
+        match = _NOT_FULL.search(self._bitmap, index)
+        return match.start() if match else len(self._bitmap)
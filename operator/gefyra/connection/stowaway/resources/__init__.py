@@ -6,5 +6,7 @@ from .statefulsets import create_stowaway_statefulset  # noqa
 from .services import (  # noqa
     create_stowaway_nodeport_service,  # noqa
     create_stowaway_proxy_service,  # noqa
+    create_stowaway_control_service,  # noqa
 )  # noqa
 from .serviceaccounts import create_stowaway_serviceaccount  # noqa
+from .secrets import create_stowaway_control_secret  # noqa
@@ -0,0 +1,21 @@
+import secrets
+
+import kubernetes as k8s
+from gefyra.configuration import configuration
+
+CONTROL_TOKEN_KEY = "token"
+
+
+def create_stowaway_control_secret() -> k8s.client.V1Secret:
+    return k8s.client.V1Secret(
+        api_version="v1",
+        kind="Secret",
+        type="Opaque",
+        # a new token is generated for each call; an existing secret is kept
+        string_data={CONTROL_TOKEN_KEY: secrets.token_urlsafe(32)},
+        metadata=k8s.client.V1ObjectMeta(
+            name=configuration.STOWAWAY_CONTROL_SECRETNAME,
+            namespace=configuration.NAMESPACE,
+            labels={"gefyra.dev/app": "stowaway", "gefyra.dev/role": "control"},
+        ),
+    )
@@ -36,6 +36,36 @@ def create_stowaway_nodeport_service(
     return service
 
 
+def create_stowaway_control_service(
+    stowaway_deployment: k8s.client.V1Deployment,
+) -> k8s.client.V1Service:
+    spec = k8s.client.V1ServiceSpec(
+        type="ClusterIP",
+        selector=stowaway_deployment.spec.template.metadata.labels,
+        ports=[
+            k8s.client.V1ServicePort(
+                protocol="TCP",
+                name="gefyra-control",
+                target_port=configuration.STOWAWAY_CONTROL_PORT,
+                port=configuration.STOWAWAY_CONTROL_PORT,
+            )
+        ],
+    )
+
+    service = k8s.client.V1Service(
+        api_version="v1",
+        kind="Service",
+        metadata=k8s.client.V1ObjectMeta(
+            name=configuration.STOWAWAY_CONTROL_SERVICENAME,
+            namespace=stowaway_deployment.metadata.namespace,
+            labels={GEFYRA_APP_LABEL: "stowaway", "gefyra.dev/role": "control"},
+        ),
+        spec=spec,
+    )
+
+    return service
+
+
 def create_stowaway_proxy_service(
     stowaway_deployment: k8s.client.V1Deployment, port: int, client_id: str = "unknown"
 ) -> k8s.client.V1Service:
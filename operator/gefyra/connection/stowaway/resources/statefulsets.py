@@ -12,7 +12,12 @@ def create_stowaway_statefulset(
         image=f"{configuration.STOWAWAY_IMAGE}:{configuration.STOWAWAY_TAG}",
         image_pull_policy=configuration.STOWAWAY_IMAGE_PULLPOLICY,
         # Wireguard default port 51820 will be mapped by the nodeport service
-        ports=[k8s.client.V1ContainerPort(container_port=51820, protocol="UDP")],
+        ports=[
+            k8s.client.V1ContainerPort(container_port=51820, protocol="UDP"),
+            k8s.client.V1ContainerPort(
+                container_port=configuration.STOWAWAY_CONTROL_PORT, protocol="TCP"
+            ),
+        ],
         resources=k8s.client.V1ResourceRequirements(
             requests={"cpu": "0.1", "memory": "100Mi"},
             limits={"cpu": "0.75", "memory": "500Mi"},
@@ -24,6 +29,23 @@ def create_stowaway_statefulset(
             period_seconds=1,
             initial_delay_seconds=1,
         ),
+        env=[
+            k8s.client.V1EnvVar(
+                name="STOWAWAY_CONTROL_PORT",
+                value=str(configuration.STOWAWAY_CONTROL_PORT),
+            ),
+            # without the secret, the control API stays disabled
+            k8s.client.V1EnvVar(
+                name="STOWAWAY_CONTROL_TOKEN",
+                value_from=k8s.client.V1EnvVarSource(
+                    secret_key_ref=k8s.client.V1SecretKeySelector(
+                        name=configuration.STOWAWAY_CONTROL_SECRETNAME,
+                        key="token",
+                        optional=True,
+                    )
+                ),
+            ),
+        ],
         env_from=[
             k8s.client.V1EnvFromSource(
                 config_map_ref=k8s.client.V1ConfigMapEnvSource(
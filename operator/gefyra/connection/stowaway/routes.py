@@ -0,0 +1,72 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+import kubernetes as k8s
+
+from gefyra.informer import is_newer
+
+# (peer, destination ip, destination port)
+RouteKey = Tuple[str, str, int]
+
+
+def parse_route(key: str, value: str) -> Tuple[RouteKey, int]:
+    """
+    Parse an entry of the proxy route configmap; the keys are "<peer>-<random suffix>"
+    and the values "<destination ip>:<destination port>,<proxy port>"
+    :return: the route key and its proxy port
+    """
+    peer_id = key.rsplit("-", 1)[0]
+    destination, proxy_port = value.split(",", 1)
+    destination_ip, destination_port = destination.rsplit(":", 1)
+    return (peer_id, destination_ip, int(destination_port)), int(proxy_port)
+
+
+class ProxyRouteIndex:
+    """
+    The proxy ports of Stowaway by (peer, destination ip, destination port); the index
+    is rebuilt from the proxy route configmap whenever a newer version is seen
+    """
+
+    def __init__(self):
+        self.resource_version: Optional[str] = None
+        self._routes: Dict[RouteKey, int] = {}
+        self._keys: Dict[RouteKey, str] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_configmap(cls, configmap: k8s.client.V1ConfigMap) -> "ProxyRouteIndex":
+        index = cls()
+        index.refresh(configmap)
+        return index
+
+    def refresh(self, configmap: k8s.client.V1ConfigMap) -> None:
+        """
+        Rebuild the index if the configmap is newer than the one it was built from
+        """
+        with self._lock:
+            if not is_newer(configmap.metadata.resource_version, self.resource_version):
+                return
+            routes: Dict[RouteKey, int] = {}
+            keys: Dict[RouteKey, str] = {}
+            for key, value in (configmap.data or {}).items():
+                route, proxy_port = parse_route(key, value)
+                routes[route] = proxy_port
+                keys[route] = key
+            self._routes, self._keys = routes, keys
+            self.resource_version = configmap.metadata.resource_version
+
+    def get(
+        self, peer_id: str, destination_ip: str, destination_port: int
+    ) -> Optional[int]:
+        """
+        :return: the proxy port of the route, None if there is no such route
+        """
+        return self._routes.get((peer_id, destination_ip, int(destination_port)))
+
+    def get_key(
+        self, peer_id: str, destination_ip: str, destination_port: int
+    ) -> Optional[str]:
+        """
+        :return: the configmap key of the route, None if there is no such route
+        """
+        return self._keys.get((peer_id, destination_ip, int(destination_port)))
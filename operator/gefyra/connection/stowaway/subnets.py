@@ -0,0 +1,82 @@
+import bisect
+import ipaddress
+import threading
+from typing import List, Optional, Tuple
+
+import kubernetes as k8s
+
+from gefyra.informer import is_newer
+
+ALLOWEDIPS_PREFIX = "SERVER_ALLOWEDIPS_PEER_"
+
+
+def parse_network(value: str) -> ipaddress.IPv4Network:
+    """
+    Parse a subnet like "192.168.101.0/24", host bits are ignored
+    :raises ValueError: if the value is not an IPv4 network
+    """
+    return ipaddress.IPv4Network(value.strip(), strict=False)
+
+
+class SubnetIndex:
+    """
+    The subnets allocated to the peers of Stowaway as address intervals sorted by their
+    first address, to find any overlap with a bisection; the index is rebuilt from the
+    peer configmap whenever a newer version is seen
+    """
+
+    def __init__(self):
+        self.resource_version: Optional[str] = None
+        self._starts: List[int] = []
+        # the highest last address of the intervals up to each position
+        self._max_ends: List[int] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_configmap(cls, configmap: k8s.client.V1ConfigMap) -> "SubnetIndex":
+        index = cls()
+        index.refresh(configmap)
+        return index
+
+    def refresh(self, configmap: k8s.client.V1ConfigMap) -> None:
+        """
+        Rebuild the index if the configmap is newer than the one it was built from
+        """
+        with self._lock:
+            if not is_newer(configmap.metadata.resource_version, self.resource_version):
+                return
+            intervals: List[Tuple[int, int]] = []
+            for key, value in (configmap.data or {}).items():
+                if not key.startswith(ALLOWEDIPS_PREFIX) or not value:
+                    continue
+                for subnet in value.split(","):
+                    try:
+                        network = parse_network(subnet)
+                    except ValueError:
+                        continue
+                    intervals.append(
+                        (
+                            int(network.network_address),
+                            int(network.broadcast_address),
+                        )
+                    )
+            intervals.sort()
+            max_ends: List[int] = []
+            for _, end in intervals:
+                max_ends.append(max(end, max_ends[-1]) if max_ends else end)
+            self._starts = [start for start, _ in intervals]
+            self._max_ends = max_ends
+            self.resource_version = configmap.metadata.resource_version
+
+    def overlaps(self, subnet: str) -> bool:
+        """
+        :return: True if the subnet shares any address with an allocated subnet
+        :raises ValueError: if the subnet is not an IPv4 network
+        """
+        network = parse_network(subnet)
+        start, end = int(network.network_address), int(network.broadcast_address)
+        # the intervals starting at or before the end of the subnet overlap it, unless
+        # all of them end before its start
+        with self._lock:
+            position = bisect.bisect_right(self._starts, end)
+            return position > 0 and self._max_ends[position - 1] >= start
@@ -0,0 +1,79 @@
+import logging
+import queue
+import threading
+from typing import List, Optional, Tuple
+
+import kubernetes as k8s
+
+from gefyra.kubeclient import get_api_client
+
+logger = logging.getLogger("gefyra.events")
+
+# the most events taken from the queue at once, and seconds to wait for more events
+BATCH_SIZE = 50
+BATCH_WINDOW = 0.1
+
+
+class EventQueue:
+    """
+    Posts Kubernetes events from a background thread, so that handlers do not wait for
+    them; the Events API creates one event per request, so the thread drains the queue
+    and posts the events one after another
+    """
+
+    def __init__(self, events_api: Optional[k8s.client.EventsV1Api] = None):
+        self.events_api = events_api
+        self._queue: "queue.Queue[Tuple[str, k8s.client.EventsV1Event]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def post(self, namespace: str, event: k8s.client.EventsV1Event) -> None:
+        """
+        Queue an event to be posted to a namespace, returns immediately
+        """
+        self._queue.put((namespace, event))
+        self._ensure_thread()
+
+    def join(self) -> None:
+        """
+        Wait until all queued events have been posted
+        """
+        self._queue.join()
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="event-queue", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            events = [self._queue.get()]
+            try:
+                while len(events) < BATCH_SIZE:
+                    events.append(self._queue.get(timeout=BATCH_WINDOW))
+            except queue.Empty:
+                pass
+            self._post_events(events)
+
+    def _post_events(self, events: List[Tuple[str, k8s.client.EventsV1Event]]) -> None:
+        """
+        Post the events taken from the queue, each in its own request
+        """
+        if self.events_api is None:
+            self.events_api = k8s.client.EventsV1Api(get_api_client())
+        for namespace, event in events:
+            try:
+                self.events_api.create_namespaced_event(namespace=namespace, body=event)
+            except k8s.client.exceptions.ApiException as e:
+                if e.status != 409:
+                    logger.error(f"Could not post event {event.metadata.name}: {e}")
+            except Exception as e:
+                logger.error(f"Could not post event {event.metadata.name}: {e}")
+            finally:
+                self._queue.task_done()
+
+
+event_queue = EventQueue()
@@ -1,31 +1,76 @@
 import kopf
+import kubernetes as k8s
 
 from gefyra.bridgestate import GefyraBridge, GefyraBridgeObject
 from gefyra.configuration import configuration
+from gefyra.kubeclient import get_api_client
+from gefyra.resources.crds import API_VERSION, CLIENT_LABEL
+from gefyra.sunset import parse_sunset, sunset_scheduler
+
+custom_api = k8s.client.CustomObjectsApi(get_api_client())
+
+# the handlers are synchronous: kopf runs them in its thread pool, so that the blocking
+# Kubernetes calls of one bridge do not stall the event loop and the other bridges
+# the state and field writes of a handler call are sent as one patch at its end
 
 
 @kopf.on.create("gefyrabridges.gefyra.dev")
 @kopf.on.resume("gefyrabridges.gefyra.dev")
-async def client_created(body, logger, **kwargs):
+def client_created(body, logger, **kwargs):
     obj = GefyraBridgeObject(body)
-    bridge = GefyraBridge(obj, configuration, logger)
-    if bridge.requested.is_active:
-        bridge.install()
-    if bridge.installing.is_active:
-        bridge.install()
-    if bridge.installed.is_active:
-        bridge.activate()
+    with obj.write_behind():
+        # bridges created by older clients are not labeled with their client yet
+        labels = body["metadata"].get("labels") or {}
+        if body.get("client") and CLIENT_LABEL not in labels:
+            obj.patch({"metadata": {"labels": {CLIENT_LABEL: body["client"]}}})
+        bridge = GefyraBridge(obj, configuration, logger)
+        if bridge.requested.is_active:
+            bridge.install()
+        if bridge.installing.is_active:
+            bridge.install()
+        if bridge.installed.is_active:
+            bridge.activate()
 
 
 @kopf.on.delete("gefyrabridges.gefyra.dev")
-async def client_deleting(body, logger, **kwargs):
+def client_deleting(body, logger, **kwargs):
     obj = GefyraBridgeObject(body)
-    bridge = GefyraBridge(obj, configuration, logger)
-    if (
-        bridge.active.is_active
-        or bridge.creating.is_active
-        or bridge.removing.is_active
-    ):
-        bridge.remove()
-    if bridge.installed.is_active:
-        bridge.restore()
+    with obj.write_behind():
+        bridge = GefyraBridge(obj, configuration, logger)
+        if (
+            bridge.active.is_active
+            or bridge.creating.is_active
+            or bridge.removing.is_active
+        ):
+            bridge.remove()
+        if bridge.installed.is_active:
+            bridge.restore()
+
+
+def expire_bridge(namespace: str, name: str) -> None:
+    # the bridge is removed by the deletion handler
+    try:
+        custom_api.delete_namespaced_custom_object(
+            namespace=namespace,
+            name=name,
+            group="gefyra.dev",
+            plural="gefyrabridges",
+            version=API_VERSION,
+        )
+    except k8s.client.ApiException as e:
+        if e.status != 404:
+            raise e
+
+
+sunset_scheduler.register("GefyraBridge", expire_bridge)
+
+
+@kopf.on.event("gefyrabridges.gefyra.dev")
+def bridge_sunset(type, body, **kwargs):
+    namespace, name = body["metadata"]["namespace"], body["metadata"]["name"]
+    if type == "DELETED" or body["metadata"].get("deletionTimestamp"):
+        sunset_scheduler.unschedule("GefyraBridge", namespace, name)
+    else:
+        sunset_scheduler.schedule(
+            "GefyraBridge", namespace, name, parse_sunset(body.get("sunset"))
+        )
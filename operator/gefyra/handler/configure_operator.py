@@ -2,6 +2,16 @@ import logging
 
 import kopf
 
+from gefyra.callstats import instrument_api_client
+from gefyra.configuration import configuration
+from prometheus_client import start_http_server
+
+from gefyra.metrics import (
+    InstrumentedThreadPoolExecutor,
+    observe_api_requests,
+    registry,
+)
+
 
 @kopf.on.startup()
 def configure(settings: kopf.OperatorSettings, **_):
@@ -15,3 +25,15 @@ def configure(settings: kopf.OperatorSettings, **_):
     settings.persistence.finalizer = "operator.gefyra.dev/kopf-finalizer"
     settings.watching.server_timeout = 10 * 60
     settings.watching.client_timeout = 5 * 60
+    # all handlers are synchronous and run in this thread pool
+    settings.execution.executor = InstrumentedThreadPoolExecutor(
+        max_workers=configuration.HANDLER_WORKERS
+    )
+    settings.execution.max_workers = configuration.HANDLER_WORKERS
+    instrument_api_client()
+    observe_api_requests()
+    if configuration.METRICS_PORT:
+        start_http_server(configuration.METRICS_PORT, registry=registry)
+        logging.getLogger("gefyra.metrics").info(
+            f"Serving metrics on port {configuration.METRICS_PORT}"
+        )
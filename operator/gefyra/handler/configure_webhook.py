@@ -4,6 +4,10 @@ from datetime import datetime
 import kubernetes as k8s
 import kopf
 
+from gefyra.bridge.carrier.sidecar import (
+    CARRIER_INJECTION_LABEL,
+    inject_carrier_sidecar,
+)
 from gefyra.clientstate import GefyraClient
 
 from gefyra.configuration import configuration
@@ -12,12 +16,14 @@ from gefyra.connection.factory import (
     connection_provider_factory,
 )
 
+from gefyra.resources.crds import get_status
 from gefyra.resources.events import create_operator_webhook_ready_event
+from gefyra.kubeclient import get_api_client
 
 
 logger = logging.getLogger(__name__)
 
-events = k8s.client.EventsV1Api()
+events = k8s.client.EventsV1Api(get_api_client())
 
 
 @kopf.on.startup()
@@ -70,7 +76,7 @@ def check_validate_provider_parameters(body, diff, logger, operation, **_):
         if (
             "providerParameter" in changeset
             and bool(changeset["providerParameter"]) is True
-            and body["state"] != GefyraClient.waiting.value
+            and get_status(body, "state") != GefyraClient.waiting.value
         ):
             raise kopf.AdmissionError(
                 "Cannot set 'providerParameter' when "
@@ -88,3 +94,21 @@ def check_validate_provider_parameters(body, diff, logger, operation, **_):
             raise kopf.AdmissionError(f"Cannot parse 'sunset': {e}")
     provider.validate(body, hints)
     return True
+
+
+@kopf.on.mutate(
+    "pods",
+    id="carrier-injection",
+    operation="CREATE",
+    labels={CARRIER_INJECTION_LABEL: "enabled"},
+)  # type: ignore
+def inject_carrier(body, patch, logger, **_):
+    """
+    Add a dormant Carrier sidecar to Pods which opted in, so they can be bridged
+    without restarting their containers
+    """
+    containers = inject_carrier_sidecar(body, configuration)
+    if containers is not None:
+        name = body["metadata"].get("name") or body["metadata"].get("generateName")
+        logger.info(f"Injecting the Carrier sidecar into Pod {name}")
+        patch.spec["containers"] = containers
@@ -10,42 +10,38 @@ from gefyra.connection.factory import (
     ConnectionProviderType,
     connection_provider_factory,
 )
+from gefyra.kubeclient import get_api_client
 
-app = k8s.client.AppsV1Api()
-core_v1_api = k8s.client.CoreV1Api()
-extension_api = k8s.client.ApiextensionsV1Api()
-events = k8s.client.EventsV1Api()
+app = k8s.client.AppsV1Api(get_api_client())
+core_v1_api = k8s.client.CoreV1Api(get_api_client())
+extension_api = k8s.client.ApiextensionsV1Api(get_api_client())
+events = k8s.client.EventsV1Api(get_api_client())
 
 
-def handle_crds(logger) -> None:
-    ireqs = create_gefyrabridge_definition()
-    try:
-        extension_api.create_custom_resource_definition(body=ireqs)
-        logger.info("Gefyra CRD gefyrabridge created")
-    except k8s.client.exceptions.ApiException as e:
-        if e.status == 409:
-            logger.warning(
-                "Gefyra CRD gefyrabridge already available but might be outdated. "
-                "Please remove it manually if you encounter issues."
-            )
-        else:
-            raise e
-    gclients = create_gefyraclient_definition()
+def _apply_crd(crd: k8s.client.V1CustomResourceDefinition, logger) -> None:
     try:
-        extension_api.create_custom_resource_definition(body=gclients)
-        logger.info("Gefyra CRD gefyraclient created")
+        extension_api.create_custom_resource_definition(body=crd)
+        logger.info(f"Gefyra CRD {crd.metadata.name} created")
     except k8s.client.exceptions.ApiException as e:
         if e.status == 409:
-            logger.warning(
-                "Gefyra CRD gefyraclient already available but might "
-                "be outdated. Please remove it manually if you encounter issues."
+            # update an existing CRD to the current versions (e.g. add v2 to v1)
+            existing = extension_api.read_custom_resource_definition(crd.metadata.name)
+            crd.metadata.resource_version = existing.metadata.resource_version
+            extension_api.replace_custom_resource_definition(
+                name=crd.metadata.name, body=crd
             )
+            logger.info(f"Gefyra CRD {crd.metadata.name} updated")
         else:
             raise e
 
 
+def handle_crds(logger) -> None:
+    _apply_crd(create_gefyrabridge_definition(), logger)
+    _apply_crd(create_gefyraclient_definition(), logger)
+
+
 @kopf.on.startup()
-async def check_gefyra_components(logger, **kwargs) -> None:
+def check_gefyra_components(logger, **kwargs) -> None:
     """
     Checks all required components of Gefyra in the current version.
     This handler installs components if they are
@@ -61,7 +57,7 @@ async def check_gefyra_components(logger, **kwargs) -> None:
 
 
 @kopf.on.startup()
-async def start_connection_providers(logger, retry, **kwargs) -> None:
+def start_connection_providers(logger, retry, **kwargs) -> None:
     """
     Starts all connection providers that are configured in the current version
     """
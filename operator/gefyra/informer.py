@@ -0,0 +1,168 @@
+import copy
+import logging
+import threading
+from time import sleep
+from typing import Any, Callable, Dict, List, Optional
+
+import kubernetes as k8s
+
+logger = logging.getLogger("gefyra.informer")
+
+# seconds after which the API server ends a watch, which is then resumed
+WATCH_TIMEOUT = 300
+# seconds to wait before listing the objects again after an error
+ERROR_BACKOFF = 2
+
+
+class InformerNotSynced(Exception):
+    """
+    The informer has not received the current state yet; read from the API instead
+    """
+
+
+def is_newer(resource_version: Optional[str], than: Optional[str]) -> bool:
+    """
+    Compare two resourceVersions; they are opaque strings, but etcd based API servers
+    use increasing integers, so those can be ordered
+    """
+    if than is None:
+        return True
+    if resource_version is None:
+        return False
+    if resource_version.isdigit() and than.isdigit():
+        return int(resource_version) > int(than)
+    return resource_version != than
+
+
+class Informer:
+    """
+    Keeps a local copy of namespaced objects up to date with a watch running in a
+    background thread, so they can be read without a request to the API server
+    """
+
+    def __init__(
+        self,
+        list_func: Callable,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        enabled: bool = True,
+        sync_timeout: float = 5,
+    ):
+        """
+        :param list_func: the list function of the objects, e.g. list_namespaced_pod
+        :param namespace: the namespace of the objects
+        :param label_selector: only keep objects matching this selector
+        :param enabled: a disabled informer never syncs, all reads go to the API
+        :param sync_timeout: seconds to wait for the initial list on the first read
+        """
+        self.list_func = list_func
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.enabled = enabled
+        self.sync_timeout = sync_timeout
+        self.resource_version: Optional[str] = None
+        self._objects: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def get(self, name: str) -> Optional[Any]:
+        """
+        :return: a copy of the cached object, None if it does not exist
+        :raises InformerNotSynced: if the objects are not available from the cache
+        """
+        self._wait_for_sync()
+        with self._lock:
+            obj = self._objects.get(name)
+            return copy.deepcopy(obj) if obj is not None else None
+
+    def list(self) -> List[Any]:
+        """
+        :return: copies of all cached objects
+        :raises InformerNotSynced: if the objects are not available from the cache
+        """
+        self._wait_for_sync()
+        with self._lock:
+            return [copy.deepcopy(obj) for obj in self._objects.values()]
+
+    def update(self, obj: Any) -> None:
+        """
+        Store an object returned from a write, so subsequent reads see it before the
+        watch event arrives
+        """
+        # the watch is not resumed from this resourceVersion, as it would skip the
+        # events of other writes before it
+        self._store(copy.deepcopy(obj), advance=False)
+
+    def _wait_for_sync(self) -> None:
+        if not self.enabled:
+            raise InformerNotSynced("The informer is disabled")
+        self._start()
+        if not self._synced.wait(self.sync_timeout):
+            raise InformerNotSynced(
+                f"The informer for {self.list_func.__name__} did not sync within "
+                f"{self.sync_timeout} seconds"
+            )
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"informer-{self.list_func.__name__}",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self._list()
+                self._watch()
+            except k8s.client.exceptions.ApiException as e:
+                if e.status != 410:
+                    logger.warning(f"Informer for {self.list_func.__name__}: {e}")
+                    sleep(ERROR_BACKOFF)
+            except Exception as e:
+                logger.warning(f"Informer for {self.list_func.__name__}: {e}")
+                sleep(ERROR_BACKOFF)
+
+    def _list(self) -> None:
+        result = self.list_func(self.namespace, label_selector=self.label_selector)
+        with self._lock:
+            self._objects = {obj.metadata.name: obj for obj in result.items}
+            self.resource_version = result.metadata.resource_version
+        self._synced.set()
+
+    def _watch(self) -> None:
+        while True:
+            watch = k8s.watch.Watch()
+            for event in watch.stream(
+                self.list_func,
+                self.namespace,
+                label_selector=self.label_selector,
+                resource_version=self.resource_version,
+                timeout_seconds=WATCH_TIMEOUT,
+                allow_watch_bookmarks=True,
+            ):
+                obj = event["object"]
+                if event["type"] == "BOOKMARK":
+                    self.resource_version = watch.resource_version
+                elif event["type"] == "DELETED":
+                    with self._lock:
+                        self._objects.pop(obj.metadata.name, None)
+                        self.resource_version = obj.metadata.resource_version
+                else:
+                    self._store(obj)
+
+    def _store(self, obj: Any, advance: bool = True) -> None:
+        with self._lock:
+            cached = self._objects.get(obj.metadata.name)
+            if cached is None or is_newer(
+                obj.metadata.resource_version, cached.metadata.resource_version
+            ):
+                self._objects[obj.metadata.name] = obj
+            if advance and is_newer(
+                obj.metadata.resource_version, self.resource_version
+            ):
+                self.resource_version = obj.metadata.resource_version
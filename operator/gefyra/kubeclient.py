@@ -0,0 +1,131 @@
+import socket
+import threading
+from typing import Dict, Iterator, Optional
+
+import kubernetes as k8s
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import Collector
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+from gefyra.configuration import OperatorConfiguration, configuration
+from gefyra.metrics import registry
+
+# requests which are retried after the status codes of an overloaded API server
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class PooledApiClient(k8s.client.ApiClient):
+    """
+    An ApiClient which limits the time to wait for a response, unless a timeout is given
+    or the response is streamed (e.g. a watch)
+    """
+
+    def __init__(
+        self,
+        configuration: k8s.client.Configuration,
+        request_timeout: Optional[float] = None,
+    ):
+        super().__init__(configuration)
+        self.request_timeout = request_timeout
+
+    def request(
+        self, method, url, *args, _preload_content=True, _request_timeout=None, **kw
+    ):
+        if _request_timeout is None and _preload_content:
+            _request_timeout = self.request_timeout
+        return super().request(
+            method,
+            url,
+            *args,
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout,
+            **kw,
+        )
+
+
+def create_api_client(configuration: OperatorConfiguration) -> PooledApiClient:
+    """
+    Create an ApiClient for the current Kubernetes configuration (in-cluster or
+    KUBECONFIG) with the pool, timeout and retry settings of the operator
+    """
+    client_configuration = k8s.client.Configuration.get_default_copy()
+    client_configuration.connection_pool_maxsize = configuration.API_POOL_MAXSIZE
+    client_configuration.retries = Retry(
+        total=configuration.API_RETRIES,
+        backoff_factor=configuration.API_RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUS_CODES,
+        # the last response is turned into an ApiException as without retries
+        raise_on_status=False,
+    )
+    api_client = PooledApiClient(
+        client_configuration, request_timeout=configuration.API_REQUEST_TIMEOUT
+    )
+    # keep idle connections of the pool alive through NATs and load balancers
+    api_client.rest_client.pool_manager.connection_pool_kw["socket_options"] = (
+        HTTPConnection.default_socket_options
+        + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    )
+    return api_client
+
+
+_api_client: Optional[PooledApiClient] = None
+_lock = threading.Lock()
+
+
+def get_api_client() -> PooledApiClient:
+    """
+    :return: the ApiClient shared by all objects of the operator process
+    """
+    global _api_client
+    with _lock:
+        if _api_client is None:
+            _api_client = create_api_client(configuration)
+        return _api_client
+
+
+def pool_stats(api_client: k8s.client.ApiClient) -> Dict[str, int]:
+    """
+    :return: the connections of the pools of an ApiClient which are in use, idle,
+        allowed at most, and which have been opened
+    """
+    stats = {"in_use": 0, "idle": 0, "max": 0, "opened": 0}
+    pool_manager = api_client.rest_client.pool_manager
+    for key in pool_manager.pools.keys():
+        pool = pool_manager.pools.get(key)
+        if pool is None:
+            continue
+        # the queue holds the idle connections and a placeholder for each free slot
+        idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+        stats["in_use"] += pool.pool.maxsize - pool.pool.qsize()
+        stats["idle"] += idle
+        stats["max"] += pool.pool.maxsize
+        stats["opened"] += pool.num_connections
+    return stats
+
+
+class PoolCollector(Collector):
+    """
+    Reports the pool of the shared ApiClient whenever the metrics are collected
+    """
+
+    def collect(self) -> Iterator[Metric]:
+        connections = GaugeMetricFamily(
+            "gefyra_kubernetes_api_pool_connections",
+            "Connections of the Kubernetes API client pool by state (in_use, idle, max)",
+            labels=["state"],
+        )
+        opened = CounterMetricFamily(
+            "gefyra_kubernetes_api_pool_connections_opened",
+            "Connections opened by the Kubernetes API client pool",
+        )
+        if _api_client is not None:
+            stats = pool_stats(_api_client)
+            for state in ("in_use", "idle", "max"):
+                connections.add_metric([state], stats[state])
+            opened.add_metric([], stats["opened"])
+        yield connections
+        yield opened
+
+
+registry.register(PoolCollector())
@@ -0,0 +1,125 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
+import kubernetes as k8s
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# state transitions may wait for images to be pulled and Pods to start
+TRANSITION_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+# the metrics of the operator, served by start_http_server(port, registry=registry)
+registry = CollectorRegistry()
+
+STATE_TRANSITION_SECONDS = Histogram(
+    "gefyra_state_transition_seconds",
+    "Time from entering the previous state until entering this state",
+    ["kind", "state"],
+    buckets=TRANSITION_BUCKETS,
+    registry=registry,
+)
+API_REQUEST_SECONDS = Histogram(
+    "gefyra_kubernetes_api_request_seconds",
+    "Duration of the requests to the Kubernetes API",
+    ["verb", "resource"],
+    buckets=DEFAULT_BUCKETS,
+    registry=registry,
+)
+EXEC_SECONDS = Histogram(
+    "gefyra_exec_seconds",
+    "Duration of the exec sessions in Pods",
+    ["command"],
+    buckets=DEFAULT_BUCKETS,
+    registry=registry,
+)
+STOWAWAY_RELOAD_SECONDS = Histogram(
+    "gefyra_stowaway_reload_seconds",
+    "Duration of applying peer and route changes to Stowaway",
+    ["operation"],
+    buckets=DEFAULT_BUCKETS,
+    registry=registry,
+)
+POD_WAIT_SECONDS = Histogram(
+    "gefyra_pod_wait_seconds",
+    "Time spent waiting for Pods to become ready",
+    ["reason"],
+    buckets=TRANSITION_BUCKETS,
+    registry=registry,
+)
+POD_WAIT_TIMEOUTS = Counter(
+    "gefyra_pod_wait_timeouts_total",
+    "Waits for Pods which timed out",
+    ["reason"],
+    registry=registry,
+)
+HANDLERS_QUEUED = Gauge(
+    "gefyra_handlers_queued",
+    "Handler calls waiting for a worker thread",
+    registry=registry,
+)
+HANDLERS_RUNNING = Gauge(
+    "gefyra_handlers_running",
+    "Handler calls being executed",
+    registry=registry,
+)
+
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    A thread pool which reports its queued and running calls
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        HANDLERS_QUEUED.inc()
+
+        def run():
+            HANDLERS_QUEUED.dec()
+            HANDLERS_RUNNING.inc()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                HANDLERS_RUNNING.dec()
+
+        return super().submit(run)
+
+
+def api_resource(resource_path: str, path_params: Dict[str, str]) -> str:
+    """
+    The resource of a Kubernetes API path template, e.g. "pods" or "pods/exec" for
+    "/api/v1/namespaces/{namespace}/pods/{name}/exec"
+    """
+    for param in ("group", "version", "plural"):
+        if param in path_params:
+            resource_path = resource_path.replace(
+                f"{{{param}}}", str(path_params[param])
+            )
+    parts = resource_path.strip("/").split("/")
+    # the core API is /api/<version>, the others are /apis/<group>/<version>
+    parts = parts[2:] if parts[0] == "api" else parts[3:]
+    if parts[:1] == ["namespaces"] and len(parts) > 2:
+        parts = parts[2:]
+    if not parts:
+        return "discovery"
+    if len(parts) > 2:
+        return f"{parts[0]}/{parts[2]}"
+    return parts[0]
+
+
+def observe_api_requests() -> None:
+    """
+    Observe the duration of every call of the Kubernetes client; the sessions of execs
+    are observed as such, see exec_command_pod
+    """
+    call_api = k8s.client.ApiClient.call_api
+    if getattr(call_api, "_gefyra_observed", False):
+        return
+
+    def observed_call_api(self, resource_path, method, path_params=None, *args, **kw):
+        resource = api_resource(resource_path, path_params or {})
+        if resource.endswith("/exec"):
+            return call_api(self, resource_path, method, path_params, *args, **kw)
+        with API_REQUEST_SECONDS.labels(verb=method, resource=resource).time():
+            return call_api(self, resource_path, method, path_params, *args, **kw)
+
+    observed_call_api._gefyra_observed = True  # type: ignore
+    k8s.client.ApiClient.call_api = observed_call_api
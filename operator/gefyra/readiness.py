@@ -0,0 +1,116 @@
+import math
+from time import monotonic
+from typing import Callable, Optional
+
+import kubernetes as k8s
+
+from gefyra.kubeclient import get_api_client
+from gefyra.metrics import POD_WAIT_SECONDS, POD_WAIT_TIMEOUTS
+
+core_v1_api = k8s.client.CoreV1Api(get_api_client())
+
+PodCondition = Callable[[k8s.client.V1Pod], bool]
+
+
+class PodWaitTimeout(TimeoutError):
+    """
+    No Pod met the condition within the timeout
+    """
+
+
+def pod_ready(pod: k8s.client.V1Pod) -> bool:
+    """
+    :return: True if the Pod is not being deleted and all of its containers are ready
+    """
+    if pod.metadata.deletion_timestamp is not None:
+        return False
+    statuses = pod.status.container_statuses if pod.status else None
+    return bool(statuses) and all(status.ready for status in statuses)
+
+
+def wait_for_pod(
+    namespace: str,
+    condition: PodCondition,
+    name: Optional[str] = None,
+    label_selector: Optional[str] = None,
+    timeout: float = 30,
+    reason: str = "pod",
+) -> k8s.client.V1Pod:
+    """
+    Wait for a Pod to meet a condition; the Pods are watched, so this returns as soon as
+    the condition holds instead of polling
+
+    :param namespace: the namespace of the Pods
+    :param condition: called with each Pod (and each change of it)
+    :param name: only wait for the Pod with this name
+    :param label_selector: only wait for Pods matching this selector
+    :param timeout: seconds to wait
+    :param reason: the reason of the wait for the metrics
+    :return: the first Pod meeting the condition
+    :raises PodWaitTimeout: if no Pod meets the condition within the timeout
+    """
+    start = monotonic()
+    timed_out = False
+    field_selector = f"metadata.name={name}" if name else None
+    try:
+        while True:
+            pods = core_v1_api.list_namespaced_pod(
+                namespace, label_selector=label_selector, field_selector=field_selector
+            )
+            for pod in pods.items:
+                if condition(pod):
+                    return pod
+            try:
+                pod = _watch_for_pod(
+                    namespace,
+                    condition,
+                    label_selector,
+                    field_selector,
+                    pods.metadata.resource_version,
+                    start + timeout,
+                )
+            except k8s.client.exceptions.ApiException as e:
+                if e.status == 410:
+                    # the list is outdated, get the current Pods again
+                    continue
+                raise e
+            if pod is None:
+                timed_out = True
+                raise PodWaitTimeout(
+                    f"Waited {timeout} seconds for a Pod "
+                    f"({name or label_selector or 'any'}) in namespace {namespace} "
+                    f"to be ready: {reason}"
+                )
+            return pod
+    finally:
+        POD_WAIT_SECONDS.labels(reason=reason).observe(monotonic() - start)
+        if timed_out:
+            POD_WAIT_TIMEOUTS.labels(reason=reason).inc()
+
+
+def _watch_for_pod(
+    namespace: str,
+    condition: PodCondition,
+    label_selector: Optional[str],
+    field_selector: Optional[str],
+    resource_version: str,
+    deadline: float,
+) -> Optional[k8s.client.V1Pod]:
+    while (remaining := deadline - monotonic()) > 0:
+        watch = k8s.watch.Watch()
+        for event in watch.stream(
+            core_v1_api.list_namespaced_pod,
+            namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            resource_version=resource_version,
+            timeout_seconds=max(1, math.ceil(remaining)),
+        ):
+            if event["type"] in ("ADDED", "MODIFIED") and condition(event["object"]):
+                watch.stop()
+                return event["object"]
+            if monotonic() >= deadline:
+                watch.stop()
+                return None
+        resource_version = watch.resource_version
+    return None
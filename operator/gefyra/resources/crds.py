@@ -1,3 +1,5 @@
+from typing import Any, Dict, List, Optional
+
 import kubernetes as k8s
 
 from gefyra.configuration import configuration
@@ -5,6 +7,87 @@ from gefyra.configuration import configuration
 CONNECTION_PROVIDERS = ["stowaway"]
 BRIDGE_PROVIDERS = ["carrier"]
 
+# the version of the Gefyra CRDs used by the operator and the client; v1 is still
+# served, but does not have the status subresource
+API_VERSION = "v2"
+# GefyraBridges carry the name of their client as label to select them by client
+CLIENT_LABEL = "gefyra.dev/client"
+# the fields written by the operator to the status subresource, in v1 they are at the
+# top level of the objects
+STATUS_FIELDS = ("state", "stateTransitions")
+INITIAL_STATE = "REQUESTED"
+
+
+def get_status(data: Dict[str, Any], field: str) -> Optional[Any]:
+    """
+    A field of the status of a Gefyra object; objects created as v1 have it at the top
+    level until the operator writes their status
+    """
+    status = data.get("status") or {}
+    if field in status:
+        return status[field]
+    return data.get(field)
+
+
+def _status_schema() -> k8s.client.V1JSONSchemaProps:
+    return k8s.client.V1JSONSchemaProps(
+        type="object",
+        properties={
+            "state": k8s.client.V1JSONSchemaProps(type="string"),
+            "stateTransitions": k8s.client.V1JSONSchemaProps(
+                type="object", x_kubernetes_preserve_unknown_fields=True
+            ),
+        },
+        # kopf keeps the progress of its handlers here
+        x_kubernetes_preserve_unknown_fields=True,
+    )
+
+
+def _create_versions(
+    schema_props: k8s.client.V1JSONSchemaProps,
+    printer_columns: List[k8s.client.V1CustomResourceColumnDefinition],
+) -> List[k8s.client.V1CustomResourceDefinitionVersion]:
+    """
+    The v2 schema has the state in the status subresource, so writing it does not
+    change the generation of the objects; the top level fields of v1 are kept for
+    the objects created as v1 (no conversion is required between the versions)
+    """
+    v2_properties = dict(schema_props.properties)
+    v2_properties["state"] = k8s.client.V1JSONSchemaProps(type="string")
+    v2_properties["status"] = _status_schema()
+    v2_schema_props = k8s.client.V1JSONSchemaProps(
+        type=schema_props.type,
+        required=schema_props.required,
+        properties=v2_properties,
+    )
+    return [
+        k8s.client.V1CustomResourceDefinitionVersion(
+            name="v1",
+            served=True,
+            storage=False,
+            deprecated=True,
+            deprecation_warning="gefyra.dev/v1 is deprecated, use gefyra.dev/v2",
+            schema=k8s.client.V1CustomResourceValidation(
+                open_apiv3_schema=schema_props
+            ),
+        ),
+        k8s.client.V1CustomResourceDefinitionVersion(
+            name=API_VERSION,
+            served=True,
+            storage=True,
+            schema=k8s.client.V1CustomResourceValidation(
+                open_apiv3_schema=v2_schema_props
+            ),
+            subresources=k8s.client.V1CustomResourceSubresources(status={}),
+            additional_printer_columns=printer_columns
+            + [
+                k8s.client.V1CustomResourceColumnDefinition(
+                    name="Age", type="date", json_path=".metadata.creationTimestamp"
+                )
+            ],
+        ),
+    ]
+
 
 def create_gefyrabridge_definition() -> k8s.client.V1CustomResourceDefinition:
     schema_props = k8s.client.V1JSONSchemaProps(
@@ -71,16 +154,23 @@ def create_gefyrabridge_definition() -> k8s.client.V1CustomResourceDefinition:
             short_names=["gbridge", "gbridges"],
         ),
         scope="Namespaced",
-        versions=[
-            k8s.client.V1CustomResourceDefinitionVersion(
-                name="v1",
-                served=True,
-                storage=True,
-                schema=k8s.client.V1CustomResourceValidation(
-                    open_apiv3_schema=schema_props
+        versions=_create_versions(
+            schema_props,
+            [
+                k8s.client.V1CustomResourceColumnDefinition(
+                    name="State", type="string", json_path=".status.state"
+                ),
+                k8s.client.V1CustomResourceColumnDefinition(
+                    name="Client", type="string", json_path=".client"
                 ),
-            )
-        ],
+                k8s.client.V1CustomResourceColumnDefinition(
+                    name="Target Namespace", type="string", json_path=".targetNamespace"
+                ),
+                k8s.client.V1CustomResourceColumnDefinition(
+                    name="Target Pod", type="string", json_path=".targetPod"
+                ),
+            ],
+        ),
     )
 
     crd = k8s.client.V1CustomResourceDefinition(
@@ -145,16 +235,20 @@ def create_gefyraclient_definition() -> k8s.client.V1CustomResourceDefinition:
             short_names=["gclients", "gclient"],
         ),
         scope="Namespaced",
-        versions=[
-            k8s.client.V1CustomResourceDefinitionVersion(
-                name="v1",
-                served=True,
-                storage=True,
-                schema=k8s.client.V1CustomResourceValidation(
-                    open_apiv3_schema=schema_props
+        versions=_create_versions(
+            schema_props,
+            [
+                k8s.client.V1CustomResourceColumnDefinition(
+                    name="State", type="string", json_path=".status.state"
                 ),
-            )
-        ],
+                k8s.client.V1CustomResourceColumnDefinition(
+                    name="Provider", type="string", json_path=".provider"
+                ),
+                k8s.client.V1CustomResourceColumnDefinition(
+                    name="Sunset", type="string", json_path=".sunset", priority=1
+                ),
+            ],
+        ),
     )
 
     crd = k8s.client.V1CustomResourceDefinition(
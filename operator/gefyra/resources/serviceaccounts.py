@@ -1,8 +1,9 @@
 import kopf
 import kubernetes as k8s
+from gefyra.kubeclient import get_api_client
 
-rbac_v1_api = k8s.client.RbacAuthorizationV1Api()
-core_v1_api = k8s.client.CoreV1Api()
+rbac_v1_api = k8s.client.RbacAuthorizationV1Api(get_api_client())
+core_v1_api = k8s.client.CoreV1Api(get_api_client())
 
 
 def handle_create_gefyraclient_serviceaccount(
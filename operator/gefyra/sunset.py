@@ -0,0 +1,136 @@
+import heapq
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("gefyra.sunset")
+
+# the kind, namespace and name of an object with a sunset
+SunsetKey = Tuple[str, str, str]
+ExpireCallback = Callable[[str, str], None]
+
+
+def parse_sunset(sunset: Optional[str]) -> Optional[datetime]:
+    """
+    :param sunset: the 'sunset' of a GefyraClient or GefyraBridge, an ISO 8601 UTC time
+    :return: the naive UTC datetime, None if no sunset is set
+    """
+    if sunset:
+        return datetime.fromisoformat(sunset.strip("Z"))
+    return None
+
+
+class SunsetScheduler:
+    """
+    Expires objects at their sunset; a min-heap of the sunsets is maintained from the
+    events of the objects and a single thread sleeps until the earliest one is reached
+    """
+
+    def __init__(self):
+        self._callbacks: Dict[str, ExpireCallback] = {}
+        # the current sunset of each object, heap entries not matching it are outdated
+        self._sunsets: Dict[SunsetKey, datetime] = {}
+        self._heap: List[Tuple[datetime, SunsetKey]] = []
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, kind: str, callback: ExpireCallback) -> None:
+        """
+        :param kind: the kind of objects
+        :param callback: called with the namespace and name of an expired object
+        """
+        self._callbacks[kind] = callback
+
+    def schedule(
+        self, kind: str, namespace: str, name: str, sunset: Optional[datetime]
+    ) -> None:
+        """
+        Expire an object at its sunset, replacing a previously scheduled sunset; an
+        object without a sunset is unscheduled
+        """
+        if sunset is None:
+            self.unschedule(kind, namespace, name)
+            return
+        key = (kind, namespace, name)
+        with self._condition:
+            if self._sunsets.get(key) == sunset:
+                return
+            self._sunsets[key] = sunset
+            heapq.heappush(self._heap, (sunset, key))
+            self._compact()
+            self._ensure_thread()
+            self._condition.notify()
+
+    def unschedule(self, kind: str, namespace: str, name: str) -> None:
+        with self._condition:
+            self._sunsets.pop((kind, namespace, name), None)
+            self._compact()
+
+    def next_sunset(self) -> Optional[Tuple[datetime, SunsetKey]]:
+        """
+        :return: the earliest scheduled sunset and its object, None if there is none
+        """
+        with self._condition:
+            self._drop_outdated()
+            return self._heap[0] if self._heap else None
+
+    def pop_expired(self, now: datetime) -> List[SunsetKey]:
+        """
+        Unschedule and return all objects whose sunset is reached at `now`
+        """
+        expired = []
+        with self._condition:
+            self._drop_outdated()
+            while self._heap and self._heap[0][0] <= now:
+                _, key = heapq.heappop(self._heap)
+                del self._sunsets[key]
+                expired.append(key)
+                self._drop_outdated()
+        return expired
+
+    def _drop_outdated(self) -> None:
+        while self._heap and self._sunsets.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _compact(self) -> None:
+        # rescheduled and unscheduled objects leave outdated entries in the heap
+        if len(self._heap) > 2 * len(self._sunsets) + 16:
+            self._heap = [(sunset, key) for key, sunset in self._sunsets.items()]
+            heapq.heapify(self._heap)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="sunset-scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                next_sunset = self.next_sunset()
+                if next_sunset is None:
+                    self._condition.wait()
+                    continue
+                delay = (next_sunset[0] - datetime.utcnow()).total_seconds()
+                if delay > 0:
+                    # woken up earlier if an earlier sunset gets scheduled
+                    self._condition.wait(delay)
+                    continue
+            for kind, namespace, name in self.pop_expired(datetime.utcnow()):
+                self._expire(kind, namespace, name)
+
+    def _expire(self, kind: str, namespace: str, name: str) -> None:
+        callback = self._callbacks.get(kind)
+        if callback is None:
+            logger.error(f"No callback to expire {kind} '{name}'")
+            return
+        logger.info(f"{kind} '{name}' reached its sunset")
+        try:
+            callback(namespace, name)
+        except Exception as e:
+            logger.error(f"Could not expire {kind} '{name}': {e}")
+
+
+sunset_scheduler = SunsetScheduler()
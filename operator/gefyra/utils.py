@@ -1,14 +1,19 @@
+import io
 import logging
+import os
 import select
 import tarfile
-from tempfile import TemporaryFile
-from typing import List
+from contextlib import contextmanager
+from typing import Iterator, List
 
 import kubernetes as k8s
 
 
 from websocket import ABNF
 
+from gefyra.callstats import count_exec
+from gefyra.metrics import EXEC_SECONDS
+
 
 logger = logging.getLogger("gefyra.utils")
 
@@ -17,23 +22,34 @@ def get_label_selector(labels: dict[str, str]) -> str:
     return ",".join(["{0}={1}".format(*label) for label in list(labels.items())])
 
 
-class WSFileManager:
+class WSFileManager(io.RawIOBase):
     """
-    WS wrapper to manage read and write bytes in K8s WSClient
+    Blocking, file-like reader of the stdout channel of a K8s WSClient; stderr output is
+    collected in `stderr`
     """
 
-    def __init__(self, ws_client):
+    def __init__(self, ws_client, timeout: float = 30, buffer_size: int = 64 * 1024):
         """
 
         :param wsclient: Kubernetes WSClient
+        :param timeout: seconds to wait for the next frame before raising a TimeoutError
+        :param buffer_size: initial size of the frame buffer
         """
         self.ws_client = ws_client
+        self.timeout = timeout
+        self.stderr = bytearray()
+        self._buffer = bytearray(buffer_size)
+        self._start = 0
+        self._end = 0
+
+    def readable(self) -> bool:
+        return True
 
-    def read_bytes(self, timeout=0):
+    def read_bytes(self, timeout=None):
         """
-        Read slice of bytes from stream
+        Read the next frame from the stream, waits up to timeout seconds for it
 
-        :param timeout: read timeout
+        :param timeout: read timeout, defaults to the timeout of this reader
         :return: stdout, stderr and closed stream flag
         """
         stdout_bytes = None
@@ -42,76 +58,142 @@ class WSFileManager:
         if self.ws_client.is_open():
             if not self.ws_client.sock.connected:
                 self.ws_client._connected = False
-            else:
-                r, _, _ = select.select((self.ws_client.sock.sock,), (), (), timeout)
-                if r:
-                    op_code, frame = self.ws_client.sock.recv_data_frame(True)
-                    if op_code == ABNF.OPCODE_CLOSE:
-                        self.ws_client._connected = False
-                    elif op_code == ABNF.OPCODE_BINARY or op_code == ABNF.OPCODE_TEXT:
-                        data = frame.data
-                        if len(data) > 1:
-                            channel = data[0]
-                            data = data[1:]
-                            if data:
-                                if channel == k8s.stream.ws_client.STDOUT_CHANNEL:
-                                    stdout_bytes = data
-                                elif channel == k8s.stream.ws_client.STDERR_CHANNEL:
-                                    stderr_bytes = data
+            elif self._wait(self.timeout if timeout is None else timeout):
+                op_code, frame = self.ws_client.sock.recv_data_frame(True)
+                if op_code == ABNF.OPCODE_CLOSE:
+                    self.ws_client._connected = False
+                elif op_code == ABNF.OPCODE_BINARY or op_code == ABNF.OPCODE_TEXT:
+                    data = frame.data
+                    if len(data) > 1:
+                        channel = data[0]
+                        data = data[1:]
+                        if data:
+                            if channel == k8s.stream.ws_client.STDOUT_CHANNEL:
+                                stdout_bytes = data
+                            elif channel == k8s.stream.ws_client.STDERR_CHANNEL:
+                                stderr_bytes = data
         return stdout_bytes, stderr_bytes, not self.ws_client._connected
 
+    def readinto(self, b) -> int:
+        while self._start == self._end:
+            if not self._fill():
+                return 0
+        start = self._start
+        end = min(self._end, start + len(b))
+        b[: end - start] = self._buffer[start:end]
+        self._start = end
+        return end - start
+
+    def _wait(self, timeout: float) -> bool:
+        sock = self.ws_client.sock.sock
+        # TLS sockets may already hold decrypted data that select does not report
+        if getattr(sock, "pending", None) and sock.pending():
+            return True
+        r, _, _ = select.select((sock,), (), (), timeout)
+        return bool(r)
+
+    def _fill(self) -> bool:
+        """
+        Append the next stdout frame to the buffer
+        :return: False once the stream is closed
+        """
+        while True:
+            if not self.ws_client.is_open():
+                return False
+            if not self._wait(self.timeout):
+                raise TimeoutError(
+                    f"No data received from the stream for {self.timeout} seconds"
+                )
+            out, err, closed = self.read_bytes(0)
+            if err:
+                self.stderr += err
+            if out:
+                self._append(out)
+                return True
+            if closed:
+                return False
+
+    def _append(self, data: bytes) -> None:
+        size = len(data)
+        if self._end + size > len(self._buffer):
+            # move the unread bytes to the front, only grow if they still do not fit
+            start, end = self._start, self._end
+            unread = end - start
+            self._buffer[:unread] = self._buffer[start:end]
+            self._start, self._end = 0, unread
+            if unread + size > len(self._buffer):
+                self._buffer.extend(bytes(unread + size - len(self._buffer)))
+        start, end = self._end, self._end + size
+        self._buffer[start:end] = data
+        self._end = end
+
+
+@contextmanager
+def _exec_api(api_instance: k8s.client.CoreV1Api) -> Iterator[k8s.client.CoreV1Api]:
+    """
+    A CoreV1Api on a dedicated ApiClient with the configuration of api_instance, which
+    is closed afterwards
+    """
+    # the stream replaces the request function of its ApiClient while it is running,
+    # so it must not use the ApiClient shared with other threads
+    api_client = k8s.client.ApiClient(api_instance.api_client.configuration)
+    try:
+        yield k8s.client.CoreV1Api(api_client)
+    finally:
+        api_client.close()
+        api_client.rest_client.pool_manager.clear()
 
-def stream_copy_from_pod(pod_name, namespace, source_path, destination_path):
-    # https://stackoverflow.com/questions/59703610/copy-file-from-pod-to-host-by-using-kubernetes-python-client
 
+def stream_read_from_pod(
+    api_instance: k8s.client.CoreV1Api,
+    pod_name: str,
+    namespace: str,
+    source_path: str,
+    timeout: float = 30,
+) -> bytes:
     """
-    Copy file from pod to the host.
+    Read a file from a Pod; the file is streamed with tar and not written to disk
 
-    :param pod_name: String. Pod name
-    :param namespace: String. Namespace
-    :param source_path: String. Pod destination file path
-    :param destination_path: Host destination file path
-    :return: bool
+    :param api_instance: a CoreV1Api instance
+    :param pod_name: the name of the Pod
+    :param namespace: the namespace this Pod is running in
+    :param source_path: the path of the file in the Pod
+    :param timeout: seconds to wait for data from the Pod
+    :return: the content of the file
     """
-
-    core_v1_api = k8s.client.CoreV1Api()
-
-    command_copy = ["tar", "cf", "-", source_path]
-    with TemporaryFile() as tar_buffer:
+    count_exec()
+    with _exec_api(api_instance) as exec_api, EXEC_SECONDS.labels(command="tar").time():
         exec_stream = k8s.stream.stream(
-            core_v1_api.connect_get_namespaced_pod_exec,
+            exec_api.connect_get_namespaced_pod_exec,
             pod_name,
             namespace,
-            command=command_copy,
+            command=["tar", "cf", "-", source_path],
             stderr=True,
-            stdin=True,
+            stdin=False,
             stdout=True,
             tty=False,
             _preload_content=False,
         )
-        # Copy file to stream
+        reader = WSFileManager(exec_stream, timeout=timeout)
+        # tar strips the leading slash of member names
+        member_name = os.path.normpath(source_path).lstrip("/")
         try:
-            reader = WSFileManager(exec_stream)
-            while True:
-                out, err, closed = reader.read_bytes()
-                if out:
-                    tar_buffer.write(out)
-                elif err:
-                    logger.debug(
-                        "Error copying file {0}".format(err.decode("utf-8", "replace"))
-                    )
-                if closed:
-                    break
-            exec_stream.close()
-            tar_buffer.flush()
-            tar_buffer.seek(0)
-            with tarfile.open(fileobj=tar_buffer, mode="r:") as tar:
-                member = tar.getmember(source_path.split("/", 1)[1])
-                tar.makefile(member, destination_path)
-                return True
-        except Exception as e:
+            with tarfile.open(fileobj=reader, mode="r|") as tar:
+                for member in tar:
+                    if member.name == member_name:
+                        extracted = tar.extractfile(member)
+                        if extracted is not None:
+                            return extracted.read()
+        except tarfile.ReadError as e:
             logger.info(e)
-            raise e
+            if not reader.stderr:
+                raise e
+        finally:
+            exec_stream.close()
+    raise FileNotFoundError(
+        f"Could not read {source_path} from Pod {pod_name}: "
+        f"{reader.stderr.decode('utf-8', 'replace')}"
+    )
 
 
 def exec_command_pod(
@@ -130,15 +212,31 @@ def exec_command_pod(
     :param command: command as List[str]
     :return: the result output as str
     """
-    resp = k8s.stream.stream(
-        api_instance.connect_get_namespaced_pod_exec,
-        pod_name,
-        namespace,
-        container=container_name,
-        command=command,
-        stderr=True,
-        stdin=False,
-        stdout=True,
-        tty=False,
-    )
+    count_exec()
+    with _exec_api(api_instance) as exec_api, EXEC_SECONDS.labels(
+        command=_command_name(command)
+    ).time():
+        resp = k8s.stream.stream(
+            exec_api.connect_get_namespaced_pod_exec,
+            pod_name,
+            namespace,
+            container=container_name,
+            command=command,
+            stderr=True,
+            stdin=False,
+            stdout=True,
+            tty=False,
+        )
     return resp
+
+
+def _command_name(command: List[str]) -> str:
+    """
+    The name of the program or script a command runs, e.g. "setroutes.sh" for
+    ["/bin/busybox", "sh", "setroutes.sh", ...]
+    """
+    for part in command:
+        name = os.path.basename(str(part))
+        if name not in ("busybox", "sh"):
+            return name
+    return ""
@@ -0,0 +1,137 @@
+"""
+Reconcile throughput of concurrently created bridges: the bridge handler as coroutine
+on kopf's event loop (as before) against the synchronous handler in kopf's thread pool.
+
+The Kubernetes API and the providers are simulated with a fixed latency per call, so
+the numbers show how many blocking calls can overlap, not the speed of a cluster.
+"""
+
+import argparse
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter, sleep
+
+import kubernetes as k8s
+
+from gefyra.bridge.factory import bridge_provider_factory
+from gefyra.configuration import configuration
+from gefyra.connection.factory import connection_provider_factory
+from gefyra.handler.bridges import client_created
+
+logger = logging.getLogger("benchmark")
+
+LATENCY = 0.02
+
+
+class FakeConnectionProvider:
+    def destination_exists(self, peer_id, destination_ip, destination_port):
+        sleep(LATENCY)
+        return False
+
+    def add_destination(self, peer_id, destination_ip, destination_port):
+        sleep(LATENCY * 3)
+        return "gefyra-stowaway-proxy-10000.gefyra.svc.cluster.local:10000"
+
+
+class FakeBridgeProvider:
+    def install(self):
+        sleep(LATENCY * 3)
+
+    def wait_ready(self, timeout):
+        sleep(LATENCY)
+        return True
+
+    def add_proxy_routes(self, routes):
+        # one read of the routes, one exec to add them
+        sleep(LATENCY * 4)
+
+
+def _patch_object(*args, **kwargs):
+    sleep(LATENCY)
+
+
+def _bridge(index: int) -> dict:
+    return {
+        "metadata": {
+            "name": f"bridge-{index}",
+            "namespace": "gefyra",
+            "uid": "0",
+            "labels": {"gefyra.dev/client": "client-a"},
+        },
+        "provider": "carrier",
+        "connectionProvider": "stowaway",
+        "client": "client-a",
+        "targetNamespace": "default",
+        "targetPod": f"backend-{index}",
+        "targetContainer": "backend",
+        "destinationIP": "192.168.99.2",
+        "portMappings": ["8080:80"],
+    }
+
+
+async def _lag_monitor(lags: list, interval: float = 0.01):
+    while True:
+        start = perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(perf_counter() - start - interval)
+
+
+async def on_event_loop(bridges: list):
+    async def handler(body):
+        client_created(body=body, logger=logger)
+
+    await asyncio.gather(*[handler(body) for body in bridges])
+
+
+async def in_thread_pool(bridges: list):
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=configuration.HANDLER_WORKERS) as executor:
+        await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    executor,
+                    functools.partial(client_created, body=body, logger=logger),
+                )
+                for body in bridges
+            ]
+        )
+
+
+async def measure(run, bridges: list):
+    lags: list = []
+    monitor = asyncio.create_task(_lag_monitor(lags))
+    await asyncio.sleep(0)
+    start = perf_counter()
+    await run(bridges)
+    duration = perf_counter() - start
+    monitor.cancel()
+    return duration, max(lags, default=duration)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bridges", type=int, default=50)
+    args = parser.parse_args()
+
+    connection_provider_factory.get = lambda *args, **kwargs: FakeConnectionProvider()
+    bridge_provider_factory.get = lambda *args, **kwargs: FakeBridgeProvider()
+    k8s.client.CustomObjectsApi.patch_namespaced_custom_object = _patch_object
+    k8s.client.CustomObjectsApi.patch_namespaced_custom_object_status = _patch_object
+
+    print(
+        f"{args.bridges} bridges, {LATENCY * 1000:.0f}ms per simulated call, "
+        f"{configuration.HANDLER_WORKERS} handler workers"
+    )
+    for name, run in [("event loop", on_event_loop), ("thread pool", in_thread_pool)]:
+        bridges = [_bridge(i) for i in range(args.bridges)]
+        duration, lag = asyncio.run(measure(run, bridges))
+        print(
+            f"{name:>12}: {duration:6.2f}s, {args.bridges / duration:7.1f} bridges/s, "
+            f"event loop blocked up to {lag * 1000:7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
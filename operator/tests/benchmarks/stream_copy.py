@@ -0,0 +1,146 @@
+"""
+CPU time per file copy from a Pod: the former spinning reader (select with a zero
+timeout, temp file) against the blocking stream reader of gefyra.utils.
+
+The Pod is simulated with a socket pair that delivers a tar stream in websocket frames
+with a delay between frames, like a slow exec session does.
+"""
+
+import argparse
+import io
+import socket
+import struct
+import tarfile
+import threading
+from tempfile import TemporaryFile
+from time import perf_counter, process_time, sleep
+
+import kubernetes as k8s
+from websocket import ABNF
+
+from gefyra.utils import WSFileManager, stream_read_from_pod
+
+SOURCE_PATH = "/config/peer_bench/peer_bench.conf"
+
+
+class FakeFrame:
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+class FakeWebSocket:
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.connected = True
+
+    def _recv_exactly(self, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = self.sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("socket closed")
+            data += chunk
+        return data
+
+    def recv_data_frame(self, control_frame: bool):
+        op_code, size = struct.unpack("!BI", self._recv_exactly(5))
+        return op_code, FakeFrame(self._recv_exactly(size))
+
+
+class FakeWSClient:
+    def __init__(self, sock: socket.socket):
+        self.sock = FakeWebSocket(sock)
+        self._connected = True
+
+    def is_open(self) -> bool:
+        return self._connected
+
+    def close(self):
+        self._connected = False
+
+
+def _tar_stream(size: int) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        info = tarfile.TarInfo(SOURCE_PATH.lstrip("/"))
+        info.size = size
+        tar.addfile(info, io.BytesIO(b"x" * size))
+    return buffer.getvalue()
+
+
+def _serve(sock: socket.socket, data: bytes, frame_size: int, delay: float):
+    try:
+        for i in range(0, len(data), frame_size):
+            sleep(delay)
+            payload = bytes([k8s.stream.ws_client.STDOUT_CHANNEL])
+            payload += data[i : i + frame_size]  # noqa: E203
+            sock.sendall(struct.pack("!BI", ABNF.OPCODE_BINARY, len(payload)) + payload)
+        sock.sendall(struct.pack("!BI", ABNF.OPCODE_CLOSE, 0))
+    except OSError:
+        pass
+
+
+def spinning_copy(ws_client) -> bytes:
+    """
+    The reader loop as it was used before: read_bytes() with a timeout of 0
+    """
+    reader = WSFileManager(ws_client)
+    with TemporaryFile() as tar_buffer:
+        while True:
+            out, err, closed = reader.read_bytes(0)
+            if out:
+                tar_buffer.write(out)
+            if closed:
+                break
+        tar_buffer.flush()
+        tar_buffer.seek(0)
+        with tarfile.open(fileobj=tar_buffer, mode="r:") as tar:
+            member = tar.getmember(SOURCE_PATH.split("/", 1)[1])
+            return tar.extractfile(member).read()
+
+
+def streaming_copy(ws_client) -> bytes:
+    k8s.stream.stream = lambda *args, **kwargs: ws_client
+    return stream_read_from_pod(
+        k8s.client.CoreV1Api(k8s.client.ApiClient()), "stowaway", "gefyra", SOURCE_PATH
+    )
+
+
+def measure(copy, data: bytes, frame_size: int, delay: float, rounds: int):
+    cpu = wall = 0.0
+    for _ in range(rounds):
+        client, server = socket.socketpair()
+        producer = threading.Thread(
+            target=_serve, args=(server, data, frame_size, delay)
+        )
+        producer.start()
+        cpu_start, wall_start = process_time(), perf_counter()
+        copy(FakeWSClient(client))
+        cpu += process_time() - cpu_start
+        wall += perf_counter() - wall_start
+        producer.join()
+        server.close()
+        client.close()
+    return cpu / rounds, wall / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=4096, help="file size in bytes")
+    parser.add_argument("--frame-size", type=int, default=256)
+    parser.add_argument("--delay", type=float, default=0.002, help="s between frames")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    data = _tar_stream(args.size)
+    print(
+        f"{len(data)} bytes in frames of {args.frame_size} bytes, "
+        f"{args.delay * 1000:.1f}ms apart, {args.rounds} rounds"
+    )
+    for name, copy in [("spinning", spinning_copy), ("streaming", streaming_copy)]:
+        cpu, wall = measure(copy, data, args.frame_size, args.delay, args.rounds)
+        print(f"{name:>10}: {cpu * 1000:8.2f}ms CPU / copy, {wall * 1000:8.2f}ms wall")
+
+
+if __name__ == "__main__":
+    main()
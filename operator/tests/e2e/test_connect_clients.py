@@ -18,7 +18,7 @@ def test_a_connect_clients(
 
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=WAITING",
+        "jsonpath=.status.state=WAITING",
         namespace="gefyra",
         timeout=20,
     )
@@ -38,7 +38,7 @@ def test_a_connect_clients(
     )
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=ACTIVE",
+        "jsonpath=.status.state=ACTIVE",
         namespace="gefyra",
         timeout=20,
     )
@@ -64,14 +64,14 @@ def test_a_connect_clients(
     )
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=WAITING",
+        "jsonpath=.status.state=WAITING",
         namespace="gefyra",
         timeout=20,
     )
     k3d.apply("tests/fixtures/b_gefyra_client.yaml")
     k3d.wait(
         "gefyraclients.gefyra.dev/client-b",
-        "jsonpath=.state=WAITING",
+        "jsonpath=.status.state=WAITING",
         namespace="gefyra",
         timeout=20,
     )
@@ -103,13 +103,13 @@ def test_a_connect_clients(
     )
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=ACTIVE",
+        "jsonpath=.status.state=ACTIVE",
         namespace="gefyra",
         timeout=20,
     )
     k3d.wait(
         "gefyraclients.gefyra.dev/client-b",
-        "jsonpath=.state=ACTIVE",
+        "jsonpath=.status.state=ACTIVE",
         namespace="gefyra",
         timeout=20,
     )
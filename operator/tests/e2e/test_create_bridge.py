@@ -32,7 +32,7 @@ def test_a_bridge(
 
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=WAITING",
+        "jsonpath=.status.state=WAITING",
         namespace="gefyra",
         timeout=20,
     )
@@ -51,7 +51,7 @@ def test_a_bridge(
     )
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=ACTIVE",
+        "jsonpath=.status.state=ACTIVE",
         namespace="gefyra",
         timeout=20,
     )
@@ -66,7 +66,7 @@ def test_a_bridge(
     k3d.apply("tests/fixtures/a_gefyra_bridge.yaml")
     k3d.wait(
         "gefyrabridges.gefyra.dev/bridge-a",
-        "jsonpath=.state=ACTIVE",
+        "jsonpath=.status.state=ACTIVE",
         namespace="gefyra",
         timeout=20,
     )
@@ -111,7 +111,7 @@ def test_b_cleanup_bridges_routes(
     k3d.apply("tests/fixtures/a_gefyra_bridge.yaml")
     k3d.wait(
         "gefyrabridges.gefyra.dev/bridge-a",
-        "jsonpath=.state=ACTIVE",
+        "jsonpath=.status.state=ACTIVE",
         namespace="gefyra",
         timeout=20,
     )
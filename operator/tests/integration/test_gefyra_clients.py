@@ -10,30 +10,30 @@ def test_a_create_client(operator: AClusterManager):
 
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=WAITING",
+        "jsonpath=.status.state=WAITING",
         namespace="gefyra",
         timeout=20,
     )
     client_a = k3d.kubectl(
         ["-n", "gefyra", "get", "gefyraclients.gefyra.dev", "client-a"]
     )
-    assert client_a["state"] == "WAITING"
-    assert client_a["stateTransitions"]["CREATING"] is not None
+    assert client_a["status"]["state"] == "WAITING"
+    assert client_a["status"]["stateTransitions"]["CREATING"] is not None
 
 
 def test_b_client_waiting(operator: AClusterManager):
     k3d = operator
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=WAITING",
+        "jsonpath=.status.state=WAITING",
         namespace="gefyra",
         timeout=20,
     )
     client_a = k3d.kubectl(
         ["-n", "gefyra", "get", "gefyraclients.gefyra.dev", "client-a"]
     )
-    assert client_a["state"] == "WAITING"
-    assert client_a["stateTransitions"]["CREATING"] is not None
+    assert client_a["status"]["state"] == "WAITING"
+    assert client_a["status"]["stateTransitions"]["CREATING"] is not None
 
 
 def test_c_client_activate(operator: AClusterManager):
@@ -52,7 +52,7 @@ def test_c_client_activate(operator: AClusterManager):
     )
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=ENABLING",
+        "jsonpath=.status.state=ENABLING",
         namespace="gefyra",
         timeout=20,
     )
@@ -62,15 +62,15 @@ def test_c_client_activate(operator: AClusterManager):
     assert client_a["providerParameter"] is not None
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=ACTIVE",
+        "jsonpath=.status.state=ACTIVE",
         namespace="gefyra",
         timeout=20,
     )
     client_a = k3d.kubectl(
         ["-n", "gefyra", "get", "gefyraclients.gefyra.dev", "client-a"]
     )
-    assert client_a["state"] == "ACTIVE"
-    assert client_a.get("stateTransitions") is not None
+    assert client_a["status"]["state"] == "ACTIVE"
+    assert client_a["status"].get("stateTransitions") is not None
     assert client_a["providerConfig"] is not None
 
 
@@ -95,21 +95,21 @@ def test_d_client_deactivate(operator: AClusterManager):
     sleep(1)
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=DISABLING",
+        "jsonpath=.status.state=DISABLING",
         namespace="gefyra",
         timeout=20,
     )
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=WAITING",
+        "jsonpath=.status.state=WAITING",
         namespace="gefyra",
         timeout=20,
     )
     client_a = k3d.kubectl(
         ["-n", "gefyra", "get", "gefyraclients.gefyra.dev", "client-a"]
     )
-    assert client_a["state"] == "WAITING"
-    assert client_a.get("stateTransitions") is not None
+    assert client_a["status"]["state"] == "WAITING"
+    assert client_a["status"].get("stateTransitions") is not None
     assert client_a.get("providerConfig") is None
 
 
@@ -129,7 +129,7 @@ def test_e_client_reactivate(operator: AClusterManager):
     )
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=ENABLING",
+        "jsonpath=.status.state=ENABLING",
         namespace="gefyra",
         timeout=20,
     )
@@ -139,15 +139,15 @@ def test_e_client_reactivate(operator: AClusterManager):
     assert client_a["providerParameter"] is not None
     k3d.wait(
         "gefyraclients.gefyra.dev/client-a",
-        "jsonpath=.state=ACTIVE",
+        "jsonpath=.status.state=ACTIVE",
         namespace="gefyra",
         timeout=20,
     )
     client_a = k3d.kubectl(
         ["-n", "gefyra", "get", "gefyraclients.gefyra.dev", "client-a"]
     )
-    assert client_a["state"] == "ACTIVE"
-    assert client_a.get("stateTransitions") is not None
+    assert client_a["status"]["state"] == "ACTIVE"
+    assert client_a["status"].get("stateTransitions") is not None
     assert client_a["providerConfig"] is not None
 
 
@@ -42,12 +42,18 @@ def test_a_gefyraclients_validator(operator: AClusterManager):
     body = {
         "metadata": {"name": "test1"},
         "provider": "stowaway",
-        "providerParameter": {"subnet": "192.168.300.0/24"},
+        "providerParameter": {"subnet": "192.168.30.0/24"},
         "state": GefyraClient.waiting.value,
     }
-    diff = [("add", ("providerParameter",), None, {"subnet": "192.168.300.0/24"})]
+    diff = [("add", ("providerParameter",), None, {"subnet": "192.168.30.0/24"})]
     check_validate_provider_parameters(body, diff, logger, operation)
 
+    # not a network
+    body["providerParameter"] = {"subnet": "192.168.300.0/24"}
+    diff = [("add", ("providerParameter",), None, {"subnet": "192.168.300.0/24"})]
+    with pytest.raises(kopf.AdmissionError):
+        check_validate_provider_parameters(body, diff, logger, operation)
+
     operation = "UPDATE"
     body = {
         "metadata": {"name": "test1"},
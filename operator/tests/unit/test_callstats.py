@@ -0,0 +1,95 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _pod():
+    import kubernetes as k8s
+
+    return k8s.client.V1Pod(
+        metadata=k8s.client.V1ObjectMeta(name="backend", namespace="demo"),
+        spec=k8s.client.V1PodSpec(
+            containers=[
+                k8s.client.V1Container(
+                    name="backend", image="quay.io/gefyra/carrier:latest"
+                )
+            ]
+        ),
+        status=k8s.client.V1PodStatus(
+            container_statuses=[
+                k8s.client.V1ContainerStatus(
+                    name="backend",
+                    image="quay.io/gefyra/carrier:latest",
+                    image_id="",
+                    ready=True,
+                    restart_count=0,
+                )
+            ]
+        ),
+    )
+
+
+def test_api_calls_are_counted(monkeypatch):
+    import kubernetes as k8s
+    from gefyra.callstats import instrument_api_client, start_counting, stop_counting
+
+    monkeypatch.setattr(
+        k8s.client.ApiClient, "request", lambda self, *args, **kwargs: object()
+    )
+    instrument_api_client()
+    instrument_api_client()
+    core_v1_api = k8s.client.CoreV1Api()
+    core_v1_api.read_namespaced_pod("backend", "demo", _preload_content=False)
+    stats = start_counting()
+    core_v1_api.read_namespaced_pod("backend", "demo", _preload_content=False)
+    core_v1_api.list_namespaced_pod("demo", _preload_content=False)
+    assert stop_counting() is stats
+    core_v1_api.read_namespaced_pod("backend", "demo", _preload_content=False)
+    assert stats.api_calls == 2
+    assert str(stats) == "2 API calls and 0 execs"
+
+
+def test_carrier_reads_the_pod_once(monkeypatch):
+    import gefyra.bridge.carrier as carrier_module
+    from gefyra.callstats import count_api_call, start_counting, stop_counting
+    from gefyra.configuration import OperatorConfiguration
+
+    class FakeCoreV1Api:
+        def read_namespaced_pod(self, name, namespace):
+            count_api_call()
+            return _pod()
+
+    monkeypatch.setattr(carrier_module, "core_v1_api", FakeCoreV1Api())
+    carrier = carrier_module.Carrier(
+        OperatorConfiguration(), "demo", "backend", "backend", logger
+    )
+    stats = start_counting()
+    assert carrier.installed() is True
+    assert carrier.ready() is True
+    assert carrier.ready() is True
+    stop_counting()
+    assert stats.api_calls == 1
+    assert stats.execs == 0
+
+
+def test_providers_are_created_once():
+    from gefyra.bridgestate import GefyraBridge, GefyraBridgeObject
+    from gefyra.configuration import OperatorConfiguration
+
+    bridge = GefyraBridge(
+        GefyraBridgeObject(
+            {
+                "metadata": {"name": "bridge", "namespace": "gefyra"},
+                "state": "REQUESTED",
+                "provider": "carrier",
+                "connectionProvider": "stowaway",
+                "targetNamespace": "demo",
+                "targetPod": "backend",
+                "targetContainer": "backend",
+            }
+        ),
+        OperatorConfiguration(),
+        logger,
+    )
+    assert bridge.bridge_provider is bridge.bridge_provider
+    assert bridge.connection_provider is bridge.connection_provider
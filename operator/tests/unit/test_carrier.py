@@ -137,6 +137,7 @@ class TestCarrier:
             logger,
         )
         carrier.remove_proxy_route(8081, "host", 8080)
+        assert carrier.proxy_route_exists(8081, "host", 8080) is False
 
     def test_z_uninstall(self, k3d: AClusterManager, operator_config, carrier_image):
         from gefyra.bridge.factory import (
@@ -0,0 +1,109 @@
+import logging
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+CONFIG = """stream {
+    upstream stowaway-8080 {server gefyra-stowaway-proxy-10000:10000;} server {listen 8080; proxy_pass stowaway-8080;}
+upstream stowaway-80 {server gefyra-stowaway-proxy-10001:10001;} server {listen 80; proxy_pass stowaway-80;}
+#MARKER
+}
+"""
+
+
+@pytest.fixture
+def carrier(monkeypatch):
+    import gefyra.bridge.carrier as carrier_module
+    from gefyra.configuration import OperatorConfiguration
+
+    commands = []
+
+    def exec_command_pod(api, pod, namespace, container, command):
+        commands.append(command)
+        return CONFIG if command[0] == "cat" else ""
+
+    monkeypatch.setattr(carrier_module, "exec_command_pod", exec_command_pod)
+    monkeypatch.setattr(carrier_module.Carrier, "ready", lambda self: True)
+    provider = carrier_module.Carrier(
+        OperatorConfiguration(), "demo", "backend", "backend", logger
+    )
+    provider._sidecar = False
+    provider.commands = commands
+    return provider
+
+
+def test_routes_are_parsed():
+    from gefyra.bridge.carrier import parse_proxy_routes
+
+    assert parse_proxy_routes(CONFIG) == {
+        8080: "gefyra-stowaway-proxy-10000:10000",
+        80: "gefyra-stowaway-proxy-10001:10001",
+    }
+    assert parse_proxy_routes("stream {\n    #MARKER\n}") == {}
+
+
+def test_routes_are_added_in_one_exec(carrier):
+    carrier.add_proxy_routes(
+        [
+            (8080, "gefyra-stowaway-proxy-10000", 10000),
+            (80, "gefyra-stowaway-proxy-10002", 10002),
+            (8000, "gefyra-stowaway-proxy-10003", 10003),
+        ]
+    )
+    assert carrier.commands[1:] == [
+        [
+            "/bin/busybox",
+            "sh",
+            "setroutes.sh",
+            "add",
+            "80",
+            "gefyra-stowaway-proxy-10002:10002",
+            "8000",
+            "gefyra-stowaway-proxy-10003:10003",
+        ]
+    ]
+
+
+def test_existing_routes_are_not_configured_again(carrier):
+    carrier.add_proxy_route(8080, "gefyra-stowaway-proxy-10000", 10000)
+    assert carrier.commands == [["cat", "/tmp/nginx.conf"]]
+
+
+def test_only_matching_routes_are_removed(carrier):
+    assert carrier.proxy_route_exists(80, "gefyra-stowaway-proxy-10001", 10001)
+    carrier.remove_proxy_routes(
+        [
+            (80, "gefyra-stowaway-proxy-10001", 10001),
+            (8080, "gefyra-stowaway-proxy-10005", 10005),
+        ]
+    )
+    assert carrier.commands[-1] == [
+        "/bin/busybox",
+        "sh",
+        "setroutes.sh",
+        "remove",
+        "80",
+    ]
+
+
+def test_carrier_that_is_not_ready_is_not_read(carrier, monkeypatch):
+    import gefyra.bridge.carrier as carrier_module
+
+    monkeypatch.setattr(carrier_module.Carrier, "ready", lambda self: False)
+    with pytest.raises(RuntimeError, match="Not able to configure Carrier"):
+        carrier.add_proxy_route(8080, "gefyra-stowaway-proxy-10000", 10000)
+    assert carrier.commands == []
+
+
+def test_failing_configuration_is_raised(carrier, monkeypatch):
+    import gefyra.bridge.carrier as carrier_module
+
+    def exec_command_pod(api, pod, namespace, container, command):
+        if command[0] == "cat":
+            return CONFIG
+        raise RuntimeError("nginx: configuration file test failed")
+
+    monkeypatch.setattr(carrier_module, "exec_command_pod", exec_command_pod)
+    with pytest.raises(RuntimeError, match="configuration file test failed"):
+        carrier.add_proxy_route(8000, "gefyra-stowaway-proxy-10003", 10003)
@@ -0,0 +1,74 @@
+import logging
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+CONFIG = """stream {
+    upstream stowaway-8080 {server gefyra-stowaway-proxy-10000:10000;} server {listen 61000; proxy_pass stowaway-8080;}
+#MARKER
+}
+"""
+
+
+@pytest.fixture
+def carrier(monkeypatch):
+    import gefyra.bridge.carrier as carrier_module
+    from gefyra.configuration import OperatorConfiguration
+
+    commands = []
+
+    def exec_command_pod(api, pod, namespace, container, command):
+        commands.append((container, command))
+        return CONFIG if command[0] == "cat" else ""
+
+    monkeypatch.setattr(carrier_module, "exec_command_pod", exec_command_pod)
+    monkeypatch.setattr(carrier_module.Carrier, "ready", lambda self: True)
+    provider = carrier_module.Carrier(
+        OperatorConfiguration(), "demo", "backend", "backend", logger
+    )
+    provider._sidecar = True
+    provider.commands = commands
+    return provider
+
+
+def test_sidecar_is_injected_once():
+    from gefyra.bridge.carrier.sidecar import (
+        CARRIER_SIDECAR_NAME,
+        inject_carrier_sidecar,
+    )
+    from gefyra.configuration import OperatorConfiguration
+
+    pod = {"spec": {"containers": [{"name": "backend", "image": "backend"}]}}
+    containers = inject_carrier_sidecar(pod, OperatorConfiguration())
+    assert [container["name"] for container in containers] == [
+        "backend",
+        CARRIER_SIDECAR_NAME,
+    ]
+    assert containers[1]["securityContext"]["capabilities"] == {"add": ["NET_ADMIN"]}
+    assert inject_carrier_sidecar({"spec": {"containers": containers}}, None) is None
+
+
+def test_sidecar_routes_listen_on_free_ports(carrier):
+    carrier.add_proxy_routes(
+        [
+            (8080, "gefyra-stowaway-proxy-10003", 10003),
+            (80, "gefyra-stowaway-proxy-10004", 10004),
+        ]
+    )
+    container, command = carrier.commands[-1]
+    assert container == "gefyra-carrier"
+    assert command[3:] == [
+        "add",
+        "8080:61000",
+        "gefyra-stowaway-proxy-10003:10003",
+        "80:61001",
+        "gefyra-stowaway-proxy-10004:10004",
+    ]
+
+
+def test_sidecar_is_not_restored(carrier):
+    carrier.uninstall()
+    assert carrier.commands == [
+        ("gefyra-carrier", ["/bin/busybox", "sh", "setroutes.sh", "set"])
+    ]
@@ -12,8 +12,8 @@ class TestClientStates:
         k3d = gefyra_crd
         k3d.apply("tests/fixtures/a_gefyra_client.yaml")
         client_a = k3d.kubectl(["-n", "gefyra", "get", "gefyraclient", "client-a"])
-        assert client_a["state"] == "REQUESTED"
-        assert client_a.get("stateTransitions") is None
+        # the state is written to the status by the operator
+        assert client_a.get("status") is None
 
     def test_b_load_client(self, gefyra_crd: AClusterManager):
         from gefyra.clientstate import GefyraClient, GefyraClientObject
@@ -42,7 +42,7 @@ class TestClientStates:
                     ["-n", "gefyra", "get", "gefyraclient", "client-a"]
                 )
                 assert (
-                    client_a["state"] == "REQUESTED" or client_a["state"] == "CREATING"
+                    client_a.get("status", {}).get("state") in (None, "CREATING")
                 )
                 sleep(1)
                 _i += 1
@@ -51,6 +51,6 @@ class TestClientStates:
                 break
 
         client_a = k3d.kubectl(["-n", "gefyra", "get", "gefyraclient", "client-a"])
-        assert client_a["state"] == "WAITING"
-        assert client_a.get("stateTransitions") is not None
+        assert client_a["status"]["state"] == "WAITING"
+        assert client_a["status"].get("stateTransitions") is not None
         client.get_latest_state()
@@ -0,0 +1,80 @@
+import threading
+
+import pytest
+
+
+def _configmap(name: str, resource_version: str, data: dict):
+    import kubernetes as k8s
+
+    return k8s.client.V1ConfigMap(
+        metadata=k8s.client.V1ObjectMeta(name=name, resource_version=resource_version),
+        data=data,
+    )
+
+
+class FakeList:
+    def __init__(self, items):
+        self.calls = 0
+        self.items = items
+
+    def __call__(self, namespace, label_selector=None):
+        import kubernetes as k8s
+
+        self.calls += 1
+        return k8s.client.V1ConfigMapList(
+            items=self.items, metadata=k8s.client.V1ListMeta(resource_version="10")
+        )
+
+
+@pytest.fixture
+def informer(monkeypatch):
+    from gefyra.informer import Informer
+
+    # the watch is not part of these tests, it blocks the (daemon) thread for good,
+    # so that it does not list again while the next test module imports kubernetes
+    monkeypatch.setattr(Informer, "_watch", lambda self: threading.Event().wait())
+    list_func = FakeList([_configmap("peers", "5", {"PEERS": "0"})])
+    list_func.__name__ = "list_namespaced_config_map"
+    return Informer(list_func, "gefyra", sync_timeout=5)
+
+
+def test_reads_are_served_from_the_cache(informer):
+    assert informer.get("peers").data == {"PEERS": "0"}
+    assert informer.get("missing") is None
+    assert [cm.metadata.name for cm in informer.list()] == ["peers"]
+    assert informer.list_func.calls == 1
+    assert informer.resource_version == "10"
+
+
+def test_cached_objects_are_copies(informer):
+    informer.get("peers").data["PEERS"] = "changed"
+    assert informer.get("peers").data == {"PEERS": "0"}
+
+
+def test_writes_update_the_cache(informer):
+    informer.get("peers")
+    informer.update(_configmap("peers", "11", {"PEERS": "a,0"}))
+    assert informer.get("peers").data == {"PEERS": "a,0"}
+    # an outdated object does not replace a newer one
+    informer.update(_configmap("peers", "7", {"PEERS": "0"}))
+    assert informer.get("peers").metadata.resource_version == "11"
+    # the watch is resumed from the last event, not from the write
+    assert informer.resource_version == "10"
+
+
+def test_disabled_informer_is_not_synced():
+    from gefyra.informer import Informer, InformerNotSynced
+
+    informer = Informer(FakeList([]), "gefyra", enabled=False)
+    with pytest.raises(InformerNotSynced):
+        informer.get("peers")
+    assert informer.list_func.calls == 0
+
+
+def test_resource_versions_are_compared_numerically():
+    from gefyra.informer import is_newer
+
+    assert is_newer("10", "9")
+    assert not is_newer("9", "10")
+    assert not is_newer("10", "10")
+    assert is_newer("1", None)
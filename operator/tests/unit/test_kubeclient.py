@@ -0,0 +1,87 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_api_client_is_configured():
+    from gefyra.configuration import OperatorConfiguration
+    from gefyra.kubeclient import create_api_client
+
+    configuration = OperatorConfiguration()
+    configuration.API_POOL_MAXSIZE = 42
+    configuration.API_RETRIES = 5
+    configuration.API_REQUEST_TIMEOUT = 7
+    api_client = create_api_client(configuration)
+    assert api_client.configuration.connection_pool_maxsize == 42
+    assert api_client.configuration.retries.total == 5
+    assert api_client.request_timeout == 7
+
+
+def test_request_timeout_is_not_applied_to_streams():
+    from gefyra.configuration import OperatorConfiguration
+    from gefyra.kubeclient import create_api_client
+
+    timeouts = []
+
+    class FakeRestClient:
+        def GET(self, url, _request_timeout=None, **kwargs):
+            timeouts.append(_request_timeout)
+
+    configuration = OperatorConfiguration()
+    configuration.API_REQUEST_TIMEOUT = 7
+    api_client = create_api_client(configuration)
+    api_client.rest_client = FakeRestClient()
+    api_client.request("GET", "/api/v1/pods")
+    api_client.request("GET", "/api/v1/pods", _request_timeout=1)
+    # a watch
+    api_client.request("GET", "/api/v1/pods", _preload_content=False)
+    assert timeouts == [7, 1, None]
+
+
+def test_connections_are_pooled():
+    from gefyra.configuration import OperatorConfiguration
+    from gefyra.kubeclient import create_api_client, pool_stats
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        configuration = OperatorConfiguration()
+        configuration.API_POOL_MAXSIZE = 4
+        api_client = create_api_client(configuration)
+        url = f"http://127.0.0.1:{server.server_port}/version"
+        for _ in range(3):
+            api_client.request("GET", url)
+        assert pool_stats(api_client) == {
+            "in_use": 0,
+            "idle": 1,
+            "max": 4,
+            "opened": 1,
+        }
+    finally:
+        server.shutdown()
+
+
+def test_pool_of_the_shared_client_is_exposed():
+    from gefyra.kubeclient import get_api_client
+    from prometheus_client import generate_latest
+
+    from gefyra.metrics import registry
+
+    assert get_api_client() is get_api_client()
+    rendered = generate_latest(registry).decode()
+    assert 'gefyra_kubernetes_api_pool_connections{state="max"}' in rendered
+    assert "gefyra_kubernetes_api_pool_connections_opened_total" in rendered
@@ -0,0 +1,91 @@
+import urllib.request
+
+
+def test_api_resources():
+    from gefyra.metrics import api_resource
+
+    assert api_resource("/api/v1/namespaces/{namespace}/pods/{name}", {}) == "pods"
+    assert (
+        api_resource("/api/v1/namespaces/{namespace}/pods/{name}/exec", {})
+        == "pods/exec"
+    )
+    assert api_resource("/api/v1/namespaces/{name}", {}) == "namespaces"
+    assert (
+        api_resource(
+            "/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}",
+            {"group": "gefyra.dev", "version": "v1", "plural": "gefyrabridges"},
+        )
+        == "gefyrabridges"
+    )
+    assert (
+        api_resource(
+            "/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}", {}
+        )
+        == "customresourcedefinitions"
+    )
+
+
+def test_state_transitions_are_observed(monkeypatch):
+    import kubernetes as k8s
+    from gefyra.bridgestate import GefyraBridgeObject
+    from gefyra.metrics import registry
+
+    monkeypatch.setattr(
+        k8s.client.CustomObjectsApi,
+        "patch_namespaced_custom_object_status",
+        lambda self, **kwargs: None,
+    )
+    bridge = GefyraBridgeObject(
+        {
+            "metadata": {"name": "bridge", "namespace": "gefyra"},
+            "state": "INSTALLED",
+            "stateTransitions": {"INSTALLED": "2024-01-01T00:00:00.000000Z"},
+        }
+    )
+    bridge.state = "CREATING"
+    bridge.state = "CREATING"
+    bridge.state = "ACTIVE"
+
+    def sample(suffix, state):
+        return registry.get_sample_value(
+            f"gefyra_state_transition_seconds_{suffix}",
+            {"kind": "GefyraBridge", "state": state},
+        )
+
+    assert sample("count", "CREATING") == 1
+    assert sample("count", "ACTIVE") == 1
+    assert sample("sum", "ACTIVE") < 60
+
+
+def test_handler_queue_is_reported():
+    import threading
+
+    from gefyra.metrics import InstrumentedThreadPoolExecutor, registry
+
+    release = threading.Event()
+    with InstrumentedThreadPoolExecutor(max_workers=1) as executor:
+        first = executor.submit(release.wait)
+        second = executor.submit(release.wait)
+        while registry.get_sample_value("gefyra_handlers_running") < 1:
+            pass
+        assert registry.get_sample_value("gefyra_handlers_queued") == 1
+        release.set()
+        first.result(), second.result()
+    assert registry.get_sample_value("gefyra_handlers_queued") == 0
+    assert registry.get_sample_value("gefyra_handlers_running") == 0
+
+
+def test_metrics_are_served():
+    from prometheus_client import start_http_server
+
+    from gefyra.metrics import registry
+
+    server, _ = start_http_server(0, addr="127.0.0.1", registry=registry)
+    try:
+        port = server.server_port
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert "# TYPE gefyra_exec_seconds histogram" in response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
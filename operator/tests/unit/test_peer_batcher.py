@@ -0,0 +1,138 @@
+import logging
+import threading
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class FakeProvider:
+    provider_type = "fake"
+
+    def __init__(self):
+        self.added: List[Dict] = []
+        self.removed: List[List[str]] = []
+
+    def add_peers(self, peers):
+        self.added.append(peers)
+
+    def remove_peers(self, peer_ids):
+        self.removed.append(peer_ids)
+        return {peer_id: True for peer_id in peer_ids}
+
+
+def _run_concurrently(target, args_list):
+    threads = [threading.Thread(target=target, args=args) for args in args_list]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_peers_are_added_in_one_batch():
+    from gefyra.connection.batch import PeerBatcher
+
+    batcher = PeerBatcher(window=0.2)
+    provider = FakeProvider()
+    _run_concurrently(
+        batcher.add_peer,
+        [
+            (provider, f"client{i}", {"subnet": f"192.168.{100 + i}.0/24"})
+            for i in range(10)
+        ],
+    )
+    assert len(provider.added) == 1
+    assert provider.added[0]["client3"] == {"subnet": "192.168.103.0/24"}
+    assert len(provider.added[0]) == 10
+
+
+def test_removals_return_provider_results():
+    from gefyra.connection.batch import PeerBatcher
+
+    batcher = PeerBatcher(window=0.2)
+    provider = FakeProvider()
+    results = {}
+
+    def _remove(peer_id):
+        results[peer_id] = batcher.remove_peer(provider, peer_id)
+
+    _run_concurrently(_remove, [("client1",), ("client2",), ("client2",)])
+    assert len(provider.removed) == 1
+    assert sorted(provider.removed[0]) == ["client1", "client2"]
+    assert results == {"client1": True, "client2": True}
+
+
+def test_batch_errors_are_raised_to_every_caller():
+    from gefyra.connection.batch import PeerBatcher
+
+    class BrokenProvider(FakeProvider):
+        def add_peers(self, peers):
+            raise RuntimeError("Stowaway is gone")
+
+    batcher = PeerBatcher(window=0)
+    try:
+        batcher.add_peer(BrokenProvider(), "client1")
+    except RuntimeError as e:
+        assert "Stowaway is gone" in str(e)
+    else:
+        raise AssertionError("RuntimeError not raised")
+
+
+def test_batches_of_a_provider_are_not_applied_concurrently():
+    from time import sleep
+
+    from gefyra.connection.batch import PeerBatcher
+
+    class SlowProvider(FakeProvider):
+        def __init__(self):
+            super().__init__()
+            self.running = 0
+            self.overlaps = 0
+
+        def _apply(self):
+            self.running += 1
+            if self.running > 1:
+                self.overlaps += 1
+            sleep(0.1)
+            self.running -= 1
+
+        def add_peers(self, peers):
+            self._apply()
+            super().add_peers(peers)
+
+        def remove_peers(self, peer_ids):
+            self._apply()
+            return super().remove_peers(peer_ids)
+
+    batcher = PeerBatcher(window=0)
+    provider = SlowProvider()
+    _run_concurrently(
+        lambda operation, peer_id: getattr(batcher, operation)(provider, peer_id),
+        [("add_peer", "client1"), ("remove_peer", "client2")]
+        + [("add_peer", f"client{i}") for i in range(3, 6)],
+    )
+    assert provider.overlaps == 0
+    assert sum(len(peers) for peers in provider.added) == 4
+
+
+def test_pending_peer_with_other_parameters_is_rejected():
+    from gefyra.connection.batch import PeerBatcher
+
+    batcher = PeerBatcher(window=0.2)
+    provider = FakeProvider()
+    errors = []
+
+    def _add(subnet):
+        try:
+            batcher.add_peer(provider, "client1", {"subnet": subnet})
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=_add, args=("192.168.101.0/24",))
+    leader.start()
+    while not batcher._pending:
+        pass
+    _run_concurrently(_add, [("192.168.101.0/24",), ("192.168.102.0/24",)])
+    leader.join()
+    assert provider.added == [{"client1": {"subnet": "192.168.101.0/24"}}]
+    assert len(errors) == 1
+    assert "other parameters" in str(errors[0])
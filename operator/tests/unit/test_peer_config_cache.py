@@ -0,0 +1,55 @@
+import logging
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+PEER_CONFIG = """[Interface]
+Address = 192.168.99.2
+PrivateKey = cHJpdmF0ZQ==
+DNS = 192.168.99.1
+
+[Peer]
+PublicKey = cHVibGlj
+Endpoint = 127.0.0.1:31820
+AllowedIPs = 0.0.0.0/0, ::/0
+"""
+
+
+@pytest.fixture
+def stowaway(monkeypatch):
+    from gefyra.configuration import OperatorConfiguration
+    from gefyra.connection.stowaway import Stowaway
+
+    downloads = []
+
+    def download(self, peer_id):
+        downloads.append(peer_id)
+        return self._read_wireguard_config(PEER_CONFIG)
+
+    monkeypatch.setattr(Stowaway, "peer_exists", lambda self, peer_id: True)
+    monkeypatch.setattr(Stowaway, "_get_wireguard_connection_details", download)
+    monkeypatch.setattr(Stowaway, "_edit_peer_configmap", lambda self, **kw: None)
+    monkeypatch.setattr(Stowaway, "_remove_live_peers", lambda self, peer_ids: None)
+    provider = Stowaway(OperatorConfiguration(), logger)
+    provider.downloads = downloads
+    yield provider
+    provider._forget_peer_configs(["client-a"])
+
+
+def test_peer_config_is_parsed(stowaway):
+    peer_config = stowaway.get_peer_config("client-a")
+    assert peer_config["Interface.Address"] == "192.168.99.2"
+    assert peer_config["Interface.PrivateKey"] == "cHJpdmF0ZQ=="
+    assert peer_config["Peer.AllowedIPs"] == "0.0.0.0/0, ::/0"
+
+
+def test_peer_config_is_cached_until_removal(stowaway):
+    first = stowaway.get_peer_config("client-a")
+    first["Interface.Address"] = "modified by the caller"
+    assert stowaway.get_peer_config("client-a")["Interface.Address"] == "192.168.99.2"
+    assert stowaway.downloads == ["client-a"]
+
+    assert stowaway.remove_peer("client-a") is True
+    stowaway.get_peer_config("client-a")
+    assert stowaway.downloads == ["client-a", "client-a"]
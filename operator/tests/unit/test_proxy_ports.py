@@ -0,0 +1,57 @@
+import pytest
+
+
+def test_allocate_lowest_free_port():
+    from gefyra.connection.stowaway.ports import ProxyPortAllocator
+
+    allocator = ProxyPortAllocator(10000, 10020)
+    assert [allocator.allocate() for _ in range(3)] == [10000, 10001, 10002]
+    allocator.release(10001)
+    assert allocator.allocate() == 10001
+    assert allocator.allocate() == 10003
+
+
+def test_range_exhausted():
+    from gefyra.connection.stowaway.ports import ProxyPortAllocator
+
+    allocator = ProxyPortAllocator(10000, 10010)
+    ports = [allocator.allocate() for _ in range(10)]
+    assert ports == list(range(10000, 10010))
+    with pytest.raises(RuntimeError):
+        allocator.allocate()
+    allocator.release(10007)
+    assert allocator.allocate() == 10007
+
+
+def test_from_ports_and_annotation_roundtrip():
+    from gefyra.connection.stowaway.ports import ProxyPortAllocator
+
+    allocator = ProxyPortAllocator.from_ports([10000, 10001, 10005])
+    assert allocator.allocate() == 10002
+    restored = ProxyPortAllocator.from_annotation(allocator.to_annotation())
+    for port in [10000, 10001, 10002, 10005]:
+        assert restored.is_taken(port) is True
+    assert restored.is_taken(10003) is False
+    assert restored.allocate() == 10003
+    assert restored.allocate() == 10004
+    assert restored.allocate() == 10006
+
+
+def test_annotation_stays_small():
+    from gefyra.connection.stowaway.ports import ProxyPortAllocator
+
+    allocator = ProxyPortAllocator()
+    for _ in range(500):
+        allocator.allocate()
+    # configmap annotations are limited to 256kB in total
+    assert len(allocator.to_annotation()) < 1024
+
+
+def test_port_out_of_range():
+    from gefyra.connection.stowaway.ports import ProxyPortAllocator
+
+    allocator = ProxyPortAllocator(10000, 10010)
+    with pytest.raises(ValueError):
+        allocator.release(9999)
+    with pytest.raises(ValueError):
+        allocator.take(10010)
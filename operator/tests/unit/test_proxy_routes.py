@@ -0,0 +1,57 @@
+def _configmap(resource_version: str, data: dict):
+    import kubernetes as k8s
+
+    return k8s.client.V1ConfigMap(
+        metadata=k8s.client.V1ObjectMeta(
+            name="gefyra-stowaway-proxyroutes", resource_version=resource_version
+        ),
+        data=data,
+    )
+
+
+def test_routes_are_matched_exactly():
+    from gefyra.connection.stowaway.routes import ProxyRouteIndex
+
+    index = ProxyRouteIndex.from_configmap(
+        _configmap(
+            "1",
+            {
+                "client-a-abcdefghij": "10.0.0.1:8080,10000",
+                "client-b-abcdefghij": "10.0.0.1:80,10001",
+            },
+        )
+    )
+    assert index.get("client-a", "10.0.0.1", 80) is None
+    assert index.get("client-a", "10.0.0.1", 8080) == 10000
+    assert index.get("client-b", "10.0.0.1", 80) == 10001
+    assert index.get("client-b", "10.0.0.1", 8080) is None
+
+
+def test_multi_port_routes_of_a_peer():
+    from gefyra.connection.stowaway.routes import ProxyRouteIndex
+
+    index = ProxyRouteIndex.from_configmap(
+        _configmap(
+            "1",
+            {
+                "client-a-abcdefghij": "10.0.0.1:8000,10000",
+                "client-a-klmnopqrst": "10.0.0.1:8001,10001",
+            },
+        )
+    )
+    assert index.get("client-a", "10.0.0.1", 8000) == 10000
+    assert index.get("client-a", "10.0.0.1", 8001) == 10001
+    assert index.get_key("client-a", "10.0.0.1", 8001) == "client-a-klmnopqrst"
+
+
+def test_index_is_rebuilt_for_newer_configmaps():
+    from gefyra.connection.stowaway.routes import ProxyRouteIndex
+
+    index = ProxyRouteIndex.from_configmap(
+        _configmap("5", {"client-a-abcdefghij": "10.0.0.1:8000,10000"})
+    )
+    index.refresh(_configmap("4", {}))
+    assert index.get("client-a", "10.0.0.1", 8000) == 10000
+    index.refresh(_configmap("6", {}))
+    assert index.get("client-a", "10.0.0.1", 8000) is None
+    assert index.resource_version == "6"
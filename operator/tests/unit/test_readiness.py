@@ -0,0 +1,91 @@
+import pytest
+
+
+def _pod(name: str, ready: bool, uid: str = "1"):
+    import kubernetes as k8s
+
+    return k8s.client.V1Pod(
+        metadata=k8s.client.V1ObjectMeta(name=name, uid=uid),
+        status=k8s.client.V1PodStatus(
+            container_statuses=[
+                k8s.client.V1ContainerStatus(
+                    name=name, image="", image_id="", ready=ready, restart_count=0
+                )
+            ]
+        ),
+    )
+
+
+class FakeCoreV1Api:
+    def __init__(self, pods):
+        self.pods = pods
+
+    def list_namespaced_pod(self, namespace, label_selector=None, field_selector=None):
+        import kubernetes as k8s
+
+        return k8s.client.V1PodList(
+            items=self.pods, metadata=k8s.client.V1ListMeta(resource_version="10")
+        )
+
+
+@pytest.fixture
+def events(monkeypatch):
+    import gefyra.readiness as readiness
+    import kubernetes as k8s
+
+    events = []
+
+    class FakeWatch:
+        resource_version = "10"
+
+        def stream(self, func, namespace, **kwargs):
+            assert kwargs["resource_version"] == "10"
+            yield from events
+
+        def stop(self):
+            pass
+
+    monkeypatch.setattr(k8s.watch, "Watch", FakeWatch)
+    monkeypatch.setattr(readiness, "core_v1_api", FakeCoreV1Api([_pod("a", False)]))
+    return events
+
+
+def test_ready_pod_is_returned_from_the_list(monkeypatch):
+    import gefyra.readiness as readiness
+    from gefyra.metrics import registry
+
+    monkeypatch.setattr(readiness, "core_v1_api", FakeCoreV1Api([_pod("a", True)]))
+    pod = readiness.wait_for_pod("gefyra", readiness.pod_ready, reason="test-list")
+    assert pod.metadata.name == "a"
+    labels = {"reason": "test-list"}
+    assert registry.get_sample_value("gefyra_pod_wait_seconds_count", labels) == 1
+
+
+def test_pod_is_returned_once_it_is_ready(events):
+    from gefyra.readiness import pod_ready, wait_for_pod
+
+    events.extend(
+        [
+            {"type": "MODIFIED", "object": _pod("a", False)},
+            {"type": "ADDED", "object": _pod("b", True, uid="2")},
+            {"type": "MODIFIED", "object": _pod("a", True)},
+        ]
+    )
+    pod = wait_for_pod(
+        "gefyra",
+        lambda pod: pod.metadata.uid == "1" and pod_ready(pod),
+        label_selector="gefyra.dev/app=stowaway",
+    )
+    assert pod.metadata.name == "a"
+
+
+def test_wait_times_out(events):
+    from gefyra.metrics import registry
+    from gefyra.readiness import PodWaitTimeout, pod_ready, wait_for_pod
+
+    with pytest.raises(PodWaitTimeout):
+        wait_for_pod("gefyra", pod_ready, name="a", timeout=0.2, reason="test-timeout")
+    labels = {"reason": "test-timeout"}
+    assert registry.get_sample_value("gefyra_pod_wait_seconds_count", labels) == 1
+    assert registry.get_sample_value("gefyra_pod_wait_seconds_sum", labels) >= 0.2
+    assert registry.get_sample_value("gefyra_pod_wait_timeouts_total", labels) == 1
@@ -0,0 +1,143 @@
+import logging
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def patches(monkeypatch):
+    import kubernetes as k8s
+
+    patches = []
+    for method in (
+        "patch_namespaced_custom_object",
+        "patch_namespaced_custom_object_status",
+    ):
+        monkeypatch.setattr(
+            k8s.client.CustomObjectsApi,
+            method,
+            lambda self, **kwargs: patches.append(kwargs["body"]),
+        )
+    return patches
+
+
+def _client_object():
+    from gefyra.clientstate import GefyraClientObject
+
+    return GefyraClientObject(
+        {
+            "metadata": {"name": "client-a", "namespace": "gefyra", "uid": "0"},
+            "state": "WAITING",
+            "stateTransitions": {"WAITING": "2024-01-01T12:00:00.000000Z"},
+            "providerParameter": {"subnet": "192.168.101.0/24"},
+            "providerConfig": {"Interface.Address": "192.168.99.2"},
+        }
+    )
+
+
+def test_writes_are_sent_as_one_patch(patches):
+    obj = _client_object()
+    with obj.write_behind():
+        obj.state = "ENABLING"
+        obj.patch({"providerConfig": {"Interface.Address": "192.168.99.3"}})
+        obj.state = "ACTIVE"
+        assert patches == []
+        # the object reflects the writes right away
+        assert obj.state == "ACTIVE"
+        assert obj.data["providerConfig"] == {"Interface.Address": "192.168.99.3"}
+    # one patch of the object, one of its status subresource
+    assert len(patches) == 2
+    assert patches[0] == {"providerConfig": {"Interface.Address": "192.168.99.3"}}
+    assert patches[1]["status"]["state"] == "ACTIVE"
+    # the transitions of the v1 object are carried over
+    assert set(patches[1]["status"]["stateTransitions"]) == {
+        "WAITING",
+        "ENABLING",
+        "ACTIVE",
+    }
+    assert obj.data["status"] == patches[1]["status"]
+
+
+def test_removed_fields_are_kept_in_the_patch(patches):
+    obj = _client_object()
+    with obj.write_behind():
+        obj.patch({"providerConfig": {"Interface.Address": "192.168.99.3"}})
+        obj.patch({"providerConfig": None})
+    assert patches == [{"providerConfig": None}]
+    assert "providerConfig" not in obj.data
+
+
+def test_writes_are_flushed_on_errors(patches):
+    obj = _client_object()
+    with pytest.raises(RuntimeError):
+        with obj.write_behind():
+            obj.state = "ERROR"
+            raise RuntimeError("Stowaway is gone")
+    assert [patch["status"]["state"] for patch in patches] == ["ERROR"]
+
+
+def test_writes_outside_of_write_behind_are_sent_right_away(patches):
+    obj = _client_object()
+    obj.state = "ENABLING"
+    obj.state = "ACTIVE"
+    assert [patch["status"]["state"] for patch in patches] == ["ENABLING", "ACTIVE"]
+
+
+def test_state_is_read_from_the_status(patches):
+    from gefyra.clientstate import GefyraClientObject
+
+    data = {"metadata": {"name": "client-a", "namespace": "gefyra", "uid": "0"}}
+    assert GefyraClientObject(dict(data)).state == "REQUESTED"
+    assert GefyraClientObject({**data, "state": "WAITING"}).state == "WAITING"
+    obj = GefyraClientObject(
+        {**data, "state": "WAITING", "status": {"state": "ACTIVE"}}
+    )
+    assert obj.state == "ACTIVE"
+
+
+def test_events_are_posted_in_the_background():
+    import kubernetes as k8s
+    from gefyra.eventqueue import EventQueue
+
+    class FakeEventsApi:
+        def __init__(self):
+            self.events = []
+
+        def create_namespaced_event(self, namespace, body):
+            self.events.append((namespace, body.metadata.name))
+            if body.metadata.name == "exists":
+                raise k8s.client.exceptions.ApiException(status=409)
+
+    events_api = FakeEventsApi()
+    queue = EventQueue(events_api)
+    for name in ("a", "exists", "b"):
+        queue.post(
+            "gefyra",
+            k8s.client.EventsV1Event(
+                metadata=k8s.client.V1ObjectMeta(name=name), event_time="now"
+            ),
+        )
+    queue.join()
+    assert events_api.events == [("gefyra", "a"), ("gefyra", "exists"), ("gefyra", "b")]
+
+
+def test_failing_patch_keeps_the_original_error(monkeypatch):
+    import kopf
+    import kubernetes as k8s
+
+    def _fail(self, **kwargs):
+        raise k8s.client.ApiException(status=500)
+
+    monkeypatch.setattr(
+        k8s.client.CustomObjectsApi, "patch_namespaced_custom_object_status", _fail
+    )
+    obj = _client_object()
+    with pytest.raises(RuntimeError, match="Stowaway is gone"):
+        with obj.write_behind():
+            obj.state = "ERROR"
+            raise RuntimeError("Stowaway is gone")
+    # server errors are retried shortly
+    with pytest.raises(kopf.TemporaryError):
+        with obj.write_behind():
+            obj.state = "ERROR"
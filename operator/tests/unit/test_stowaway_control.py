@@ -0,0 +1,100 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class FakeControlHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+    connections = set()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        self.requests.append(
+            (self.command, self.path, self.headers.get("Authorization"), body)
+        )
+        self.connections.add(self.client_address)
+        if self.headers.get("Authorization") != "Bearer secret":
+            return self._respond(401, {"error": "unauthorized"})
+        if self.path == "/peers/remove":
+            return self._respond(500, {"output": "peer not found"})
+        self._respond(200, {"output": f"done {self.path}"})
+
+    def _respond(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def control_client():
+    from gefyra.configuration import OperatorConfiguration
+    from gefyra.connection.stowaway.control import StowawayControlClient
+
+    FakeControlHandler.requests = []
+    FakeControlHandler.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeControlHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = StowawayControlClient(OperatorConfiguration())
+    client.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    client._token = "secret"
+    yield client
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_share_a_keepalive_connection(control_client):
+    assert control_client.add_peers({"client1": "192.168.101.0/24"}) == "done /peers"
+    assert control_client.add_route(10000, "192.168.99.2:8000") == "done /routes"
+    assert [r[:2] for r in FakeControlHandler.requests] == [
+        ("POST", "/peers"),
+        ("POST", "/routes"),
+    ]
+    assert FakeControlHandler.requests[0][3] == {
+        "peers": {"client1": "192.168.101.0/24"}
+    }
+    assert FakeControlHandler.requests[1][3] == {
+        "port": 10000,
+        "upstream": "192.168.99.2:8000",
+    }
+    assert len(FakeControlHandler.connections) == 1
+
+
+def test_failed_operation_raises(control_client):
+    from gefyra.connection.stowaway.control import StowawayControlError
+
+    with pytest.raises(StowawayControlError):
+        control_client.remove_peers(["client1"])
+
+
+def test_rejected_token_is_unavailable(control_client):
+    from gefyra.connection.stowaway.control import StowawayControlUnavailable
+
+    control_client._token = "outdated"
+    with pytest.raises(StowawayControlUnavailable):
+        control_client.reload()
+    # the token is read again with the next request
+    assert control_client._token is None
+
+
+def test_unreachable_control_api_is_unavailable(control_client):
+    from gefyra.connection.stowaway.control import StowawayControlUnavailable
+
+    # nothing listens on port 1
+    control_client.base_url = "http://127.0.0.1:1"
+    with pytest.raises(StowawayControlUnavailable):
+        control_client.add_peers({"client1": None})
+    # the following requests fall back without trying again
+    control_client.base_url = "http://127.0.0.1:2"
+    with pytest.raises(StowawayControlUnavailable):
+        control_client.reload()
+    assert FakeControlHandler.requests == []
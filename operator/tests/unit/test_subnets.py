@@ -0,0 +1,66 @@
+import pytest
+
+
+def _configmap(resource_version: str, data: dict):
+    import kubernetes as k8s
+
+    return k8s.client.V1ConfigMap(
+        metadata=k8s.client.V1ObjectMeta(
+            name="gefyra-stowaway-config", resource_version=resource_version
+        ),
+        data=data,
+    )
+
+
+def test_overlapping_subnets_are_found():
+    from gefyra.connection.stowaway.subnets import SubnetIndex
+
+    index = SubnetIndex.from_configmap(
+        _configmap(
+            "1",
+            {
+                "PEERS": "clienta,clientb",
+                "SERVER_ALLOWEDIPS_PEER_clienta": "192.168.101.0/24",
+                "SERVER_ALLOWEDIPS_PEER_clientb": "10.0.0.0/8",
+            },
+        )
+    )
+    assert index.overlaps("192.168.101.0/24")
+    # different sizes and base addresses
+    assert index.overlaps("192.168.101.128/25")
+    assert index.overlaps("192.168.100.0/23")
+    assert index.overlaps("10.20.30.0/24")
+    assert not index.overlaps("192.168.102.0/24")
+    assert not index.overlaps("192.168.100.0/24")
+    assert not index.overlaps("11.0.0.0/8")
+
+
+def test_a_large_subnet_hides_no_later_overlap():
+    from gefyra.connection.stowaway.subnets import SubnetIndex
+
+    index = SubnetIndex.from_configmap(
+        _configmap(
+            "1",
+            {
+                "SERVER_ALLOWEDIPS_PEER_clienta": "10.0.0.0/8",
+                "SERVER_ALLOWEDIPS_PEER_clientb": "10.1.0.0/16",
+                "SERVER_ALLOWEDIPS_PEER_clientc": "10.2.0.0/16",
+            },
+        )
+    )
+    # starts after clientb and clientc, but within clienta
+    assert index.overlaps("10.200.0.0/16")
+
+
+def test_index_is_rebuilt_for_newer_configmaps():
+    from gefyra.connection.stowaway.subnets import SubnetIndex
+
+    index = SubnetIndex.from_configmap(
+        _configmap("2", {"SERVER_ALLOWEDIPS_PEER_clienta": "192.168.101.0/24"})
+    )
+    index.refresh(_configmap("1", {}))
+    assert index.overlaps("192.168.101.0/24")
+    index.refresh(_configmap("3", {"PEERS": "", "SERVER_ALLOWEDIPS_PEER_x": ""}))
+    assert not index.overlaps("192.168.101.0/24")
+    with pytest.raises(ValueError):
+        index.overlaps("192.168.101.0/99")
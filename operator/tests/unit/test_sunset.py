@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+
+def test_sunsets_expire_in_order():
+    from gefyra.sunset import SunsetScheduler
+
+    scheduler = SunsetScheduler()
+    now = datetime(2024, 1, 1, 12, 0)
+    scheduler._ensure_thread = lambda: None
+    scheduler.schedule("GefyraClient", "gefyra", "client-b", now + timedelta(minutes=2))
+    scheduler.schedule("GefyraClient", "gefyra", "client-a", now + timedelta(minutes=1))
+    scheduler.schedule("GefyraBridge", "gefyra", "bridge-a", now + timedelta(hours=1))
+    assert scheduler.next_sunset() == (
+        now + timedelta(minutes=1),
+        ("GefyraClient", "gefyra", "client-a"),
+    )
+    assert scheduler.pop_expired(now) == []
+    assert scheduler.pop_expired(now + timedelta(minutes=5)) == [
+        ("GefyraClient", "gefyra", "client-a"),
+        ("GefyraClient", "gefyra", "client-b"),
+    ]
+    assert scheduler.next_sunset()[1] == ("GefyraBridge", "gefyra", "bridge-a")
+
+
+def test_rescheduled_and_unscheduled_sunsets():
+    from gefyra.sunset import SunsetScheduler
+
+    scheduler = SunsetScheduler()
+    now = datetime(2024, 1, 1, 12, 0)
+    scheduler._ensure_thread = lambda: None
+    scheduler.schedule("GefyraClient", "gefyra", "client-a", now + timedelta(minutes=1))
+    scheduler.schedule("GefyraClient", "gefyra", "client-b", now + timedelta(minutes=2))
+    # the sunset of client-a was postponed, client-b has none anymore
+    scheduler.schedule("GefyraClient", "gefyra", "client-a", now + timedelta(hours=1))
+    scheduler.schedule("GefyraClient", "gefyra", "client-b", None)
+    assert scheduler.pop_expired(now + timedelta(minutes=5)) == []
+    assert scheduler.next_sunset() == (
+        now + timedelta(hours=1),
+        ("GefyraClient", "gefyra", "client-a"),
+    )
+    scheduler.unschedule("GefyraClient", "gefyra", "client-a")
+    assert scheduler.next_sunset() is None
+
+
+def test_scheduler_thread_expires_objects():
+    import threading
+
+    from gefyra.sunset import SunsetScheduler
+
+    scheduler = SunsetScheduler()
+    expired = threading.Event()
+    calls = []
+
+    def expire(namespace, name):
+        calls.append((namespace, name))
+        expired.set()
+
+    scheduler.register("GefyraBridge", expire)
+    scheduler.schedule(
+        "GefyraBridge",
+        "gefyra",
+        "bridge-a",
+        datetime.utcnow() + timedelta(milliseconds=100),
+    )
+    assert expired.wait(5)
+    assert calls == [("gefyra", "bridge-a")]
@@ -0,0 +1,155 @@
+import io
+import socket
+import struct
+import tarfile
+import threading
+from time import sleep
+
+import pytest
+
+STDOUT = 1
+STDERR = 2
+
+
+class FakeFrame:
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+class FakeWebSocket:
+    """
+    A websocket that receives (op code, length, data) frames from a socket
+    """
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.connected = True
+
+    def _recv_exactly(self, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = self.sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("socket closed")
+            data += chunk
+        return data
+
+    def recv_data_frame(self, control_frame: bool):
+        op_code, size = struct.unpack("!BI", self._recv_exactly(5))
+        return op_code, FakeFrame(self._recv_exactly(size))
+
+
+class FakeWSClient:
+    def __init__(self, sock: socket.socket):
+        self.sock = FakeWebSocket(sock)
+        self._connected = True
+
+    def is_open(self) -> bool:
+        return self._connected
+
+    def close(self):
+        self._connected = False
+        self.sock.sock.close()
+
+
+def _serve(sock: socket.socket, frames, delay: float = 0):
+    from websocket import ABNF
+
+    try:
+        for channel, data in frames:
+            if delay:
+                sleep(delay)
+            payload = bytes([channel]) + data
+            sock.sendall(struct.pack("!BI", ABNF.OPCODE_BINARY, len(payload)) + payload)
+        sock.sendall(struct.pack("!BI", ABNF.OPCODE_CLOSE, 0))
+    except OSError:
+        # the reader closes the stream once it has found the file
+        pass
+
+
+def _tar(name: str, content: bytes) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        info = tarfile.TarInfo(name)
+        info.size = len(content)
+        tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def _chunks(data: bytes, size: int):
+    view = memoryview(data)
+    while view:
+        yield bytes(view[:size])
+        view = view[size:]
+
+
+def _core_v1_api():
+    import kubernetes as k8s
+
+    return k8s.client.CoreV1Api(k8s.client.ApiClient())
+
+
+@pytest.fixture
+def exec_stream(monkeypatch):
+    import kubernetes as k8s
+
+    client, server = socket.socketpair()
+    monkeypatch.setattr(
+        k8s.stream, "stream", lambda *args, **kwargs: FakeWSClient(client)
+    )
+    yield server
+    server.close()
+    client.close()
+
+
+def test_read_file_from_stream(exec_stream):
+    from gefyra.utils import stream_read_from_pod
+
+    content = b"[Interface]\nAddress = 192.168.99.2\n" * 200
+    data = _tar("config/peer_a/peer_a.conf", content)
+    # the tar stream arrives in frames that do not align with tar blocks
+    frames = [(STDOUT, chunk) for chunk in _chunks(data, 1000)]
+    threading.Thread(target=_serve, args=(exec_stream, frames, 0.001)).start()
+    assert (
+        stream_read_from_pod(
+            _core_v1_api(), "stowaway", "gefyra", "/config/peer_a/peer_a.conf"
+        )
+        == content
+    )
+
+
+def test_missing_file_raises(exec_stream):
+    from gefyra.utils import stream_read_from_pod
+
+    frames = [(STDERR, b"tar: /config/peer_b/peer_b.conf: No such file or directory")]
+    threading.Thread(target=_serve, args=(exec_stream, frames)).start()
+    with pytest.raises(FileNotFoundError, match="No such file"):
+        stream_read_from_pod(
+            _core_v1_api(), "stowaway", "gefyra", "/config/peer_b/peer_b.conf"
+        )
+
+
+def test_reader_times_out(exec_stream):
+    from gefyra.utils import stream_read_from_pod
+
+    with pytest.raises(TimeoutError):
+        stream_read_from_pod(
+            _core_v1_api(),
+            "stowaway",
+            "gefyra",
+            "/config/peer_c/peer_c.conf",
+            timeout=0.2,
+        )
+
+
+def test_reader_grows_buffer_for_large_frames():
+    from gefyra.utils import WSFileManager
+
+    client, server = socket.socketpair()
+    frames = [(STDOUT, b"a" * 100), (STDOUT, b"b" * 300)]
+    threading.Thread(target=_serve, args=(server, frames)).start()
+    reader = WSFileManager(FakeWSClient(client), timeout=5, buffer_size=128)
+    assert reader.read(50) == b"a" * 50
+    assert reader.read() == b"a" * 50 + b"b" * 300
+    server.close()
+    client.close()
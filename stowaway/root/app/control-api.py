@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Stowaway control API
+
+A small HTTP endpoint for the Gefyra Operator to manage peers and proxy routes without
+opening a Kubernetes exec session for every operation. Every request (except /healthz)
+must carry the token from STOWAWAY_CONTROL_TOKEN as a bearer token.
+
+  GET  /healthz                       liveness of the control API
+  GET  /peers/<peer>/config           the Wireguard config of a peer
+  POST /peers         {"peers": {"<peer>": "<subnet>|null"}}   add peers
+  POST /peers/remove  {"peers": ["<peer>", ...]}                remove peers
+  POST /routes        {"port": <proxy port>, "upstream": "<ip:port>"}  add a route
+  DELETE /routes/<proxy port>                                  remove a route
+  POST /reload                        request an nginx reload
+"""
+import hmac
+import json
+import os
+import re
+import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+TOKEN = os.environ.get("STOWAWAY_CONTROL_TOKEN", "")
+PORT = int(os.environ.get("STOWAWAY_CONTROL_PORT", "8181"))
+CONFIG_PATH = Path(os.environ.get("STOWAWAY_PEER_CONFIG_PATH", "/config"))
+RELOAD_REQUEST = Path("/tmp/nginx-reload-requested")
+COMMAND_TIMEOUT = 30
+
+PEER_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+SUBNET_PATTERN = re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}/\d{1,2}$")
+UPSTREAM_PATTERN = re.compile(r"^[A-Za-z0-9.:-]+:\d{1,5}$")
+
+
+class BadRequest(Exception):
+    pass
+
+
+def run(command: list) -> tuple:
+    process = subprocess.run(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        timeout=COMMAND_TIMEOUT,
+        text=True,
+    )
+    return process.returncode, process.stdout
+
+
+def check_peer(peer: str) -> str:
+    if not isinstance(peer, str) or not PEER_PATTERN.match(peer):
+        raise BadRequest(f"invalid peer name: {peer!r}")
+    return peer
+
+
+def check_port(port) -> str:
+    try:
+        port = int(port)
+    except (TypeError, ValueError):
+        raise BadRequest(f"invalid port: {port!r}")
+    if not 0 < port < 65536:
+        raise BadRequest(f"invalid port: {port!r}")
+    return str(port)
+
+
+class ControlHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "StowawayControl"
+
+    def do_GET(self):
+        if self.path == "/healthz":
+            return self.respond(200, {"status": "ok"})
+        if not self.authorized():
+            return
+        parts = self.path.strip("/").split("/")
+        if len(parts) == 3 and parts[0] == "peers" and parts[2] == "config":
+            try:
+                peer = check_peer(parts[1])
+            except BadRequest as e:
+                return self.respond(400, {"error": str(e)})
+            config_file = CONFIG_PATH / f"peer_{peer}" / f"peer_{peer}.conf"
+            if not config_file.is_file():
+                return self.respond(404, {"error": f"peer {peer} not found"})
+            return self.respond_text(200, config_file.read_text())
+        return self.respond(404, {"error": "not found"})
+
+    def do_POST(self):
+        if not self.authorized():
+            return
+        try:
+            body = self.read_json()
+            if self.path == "/peers":
+                peers = body.get("peers") or {}
+                arguments = []
+                for peer, subnet in peers.items():
+                    check_peer(peer)
+                    if subnet:
+                        if not SUBNET_PATTERN.match(str(subnet)):
+                            raise BadRequest(f"invalid subnet: {subnet!r}")
+                        arguments.append(f"{peer}={subnet}")
+                    else:
+                        arguments.append(peer)
+                return self.run_command(["/bin/bash", "/app/add-peer"] + arguments)
+            if self.path == "/peers/remove":
+                peers = [check_peer(peer) for peer in body.get("peers") or []]
+                return self.run_command(["/bin/bash", "/app/remove-peer"] + peers)
+            if self.path == "/routes":
+                upstream = str(body.get("upstream", ""))
+                if not UPSTREAM_PATTERN.match(upstream):
+                    raise BadRequest(f"invalid upstream: {upstream!r}")
+                return self.run_command(
+                    ["/bin/bash", "/app/proxyroute", "add"]
+                    + [check_port(body.get("port")), upstream]
+                )
+            if self.path == "/reload":
+                RELOAD_REQUEST.touch()
+                return self.respond(200, {"output": "reload requested"})
+        except BadRequest as e:
+            return self.respond(400, {"error": str(e)})
+        return self.respond(404, {"error": "not found"})
+
+    def do_DELETE(self):
+        if not self.authorized():
+            return
+        parts = self.path.strip("/").split("/")
+        try:
+            if len(parts) == 2 and parts[0] == "routes":
+                return self.run_command(
+                    ["/bin/bash", "/app/proxyroute", "remove", check_port(parts[1])]
+                )
+        except BadRequest as e:
+            return self.respond(400, {"error": str(e)})
+        return self.respond(404, {"error": "not found"})
+
+    def authorized(self) -> bool:
+        header = self.headers.get("Authorization", "")
+        if TOKEN and hmac.compare_digest(header, f"Bearer {TOKEN}"):
+            return True
+        # drain the body, so the connection can be kept alive
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.respond(401, {"error": "unauthorized"})
+        return False
+
+    def read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            raise BadRequest("invalid JSON body")
+        if not isinstance(body, dict):
+            raise BadRequest("JSON body must be an object")
+        return body
+
+    def run_command(self, command: list):
+        try:
+            returncode, output = run(command)
+        except subprocess.TimeoutExpired:
+            return self.respond(504, {"error": f"{command[1]} timed out"})
+        return self.respond(200 if returncode == 0 else 500, {"output": output})
+
+    def respond(self, status: int, payload: dict):
+        self.respond_text(status, json.dumps(payload), "application/json")
+
+    def respond_text(self, status: int, text: str, content_type: str = "text/plain"):
+        data = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        print(f"[control-api] {self.address_string()} {format % args}", flush=True)
+
+
+def main():
+    if not TOKEN:
+        print("[control-api] STOWAWAY_CONTROL_TOKEN is not set, not starting", flush=True)
+        return 1
+    server = ThreadingHTTPServer(("0.0.0.0", PORT), ControlHandler)
+    server.daemon_threads = True
+    print(f"[control-api] listening on port {PORT}", flush=True)
+    server.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
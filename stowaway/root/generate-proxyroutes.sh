@@ -3,37 +3,23 @@
 
 set -e
 
-DEFAULT_CONF_FILE="/etc/nginx/nginx.conf"
+ROUTES_DIRECTORY="/etc/nginx/stream.d"
+RELOAD_REQUEST="/tmp/nginx-reload-requested"
 INPUT_DIRECTORY=$1
 
-echo "worker_processes  auto;
-
-error_log  /var/log/nginx/error.log notice;
-pid        /tmp/nginx.pid;
-
-
-events {
-    worker_connections  1024;
-}
-" > $DEFAULT_CONF_FILE
-
-gen_server_block () {
-    echo "  server {
-          listen $1;
-          proxy_pass $2;
-         }
-         " >> $DEFAULT_CONF_FILE
-}
-
-echo "stream {
-     " >> $DEFAULT_CONF_FILE
+# synchronize all routes with the proxy routes read in from the input directory, the
+# routes are stored as "to_ip:to_port,proxy_port"
+mkdir -p $ROUTES_DIRECTORY
+rm -f $ROUTES_DIRECTORY/route-*.conf
 echo "Reading in: $INPUT_DIRECTORY"
 for filename in $(ls $INPUT_DIRECTORY);
 do
     echo "Generating $filename ..."
     route=($(cat $INPUT_DIRECTORY/$filename | tr "," " "))
-    gen_server_block ${route[1]} ${route[0]}
+    echo "server {
+    listen ${route[1]};
+    proxy_pass ${route[0]};
+}" > $ROUTES_DIRECTORY/route-${route[1]}.conf
 done
-echo "}" >> $DEFAULT_CONF_FILE
 
-nginx -s reload
\ No newline at end of file
+touch $RELOAD_REQUEST